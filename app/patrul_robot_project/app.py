@@ -4,20 +4,37 @@ from flask_jwt_extended import JWTManager
 from dotenv import load_dotenv
 import os
 
+from auth.controller.blocklist import BLOCKLIST
+from auth.dao.change_tracker import change_tracker
+from auth.dao.db_pool import TimedQueuePool, db_pool_monitor
+from auth.dao.entity_cache import entity_cache
+from auth.dao.fleet_dao import fleet_summary_cache
+from auth.dao.query_stats import sql_instrumentation
 from auth.domain.models import db
+from auth.route.admin_route import admin_blueprint
+from auth.route.battery_route import battery_blueprint
 from auth.route.camera_route import camera_blueprint
+from auth.route.change_feed_route import change_feed_blueprint
 from auth.route.charging_station_route import charging_station_blueprint
+from auth.route.fleet_route import fleet_blueprint
 from auth.route.maintenance_route import maintenance_blueprint
+from auth.route.json_provider import FastJSONProvider
+from auth.route.metrics_route import metrics_blueprint
 from auth.route.operator_route import operator_blueprint
 from auth.route.person_identification_route import person_identification_blueprint
 from auth.route.robot_route import robot_blueprint
 from auth.route.robot_maintenance_route import robot_maintenance_blueprint
 from auth.route.sensor_route import sensor_blueprint
+from auth.route.telemetry_rollup_route import telemetry_rollup_blueprint
 from auth.route.user_route import user_blueprint
+from auth.service.battery_buffer import battery_buffer
+from auth.service.password_hasher import password_hasher
 
 load_dotenv()
 
 app = Flask(__name__)
+# orjson when installed; datetime/time/Decimal/Enum are encoded the same way either way
+app.json = FastJSONProvider(app)
 
 # Swagger config
 swagger_config = {
@@ -56,26 +73,70 @@ swagger_template = {
 Swagger(app, config=swagger_config, template=swagger_template)
 
 # DB config
-app.config['SQLALCHEMY_DATABASE_URI'] = (
+# DATABASE_URL overrides the MySQL settings, e.g. sqlite:// for benchmarks/query_budget.py
+app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL') or (
     f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
     f"@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
 )
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+    # SQLite keeps the pool Flask-SQLAlchemy picks for it (StaticPool for in-memory)
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'poolclass': TimedQueuePool,
+        'pool_size': int(os.getenv('DB_POOL_SIZE', '5')),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', '10')),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', '30')),
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', '1800')),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', '1') == '1',
+    }
 
 # JWT config
 app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "super-secret-key")
 app.config["JWT_ACCESS_TOKEN_EXPIRES"] = 3600
 jwt = JWTManager(app)
 
-# Token blocklist
-BLOCKLIST = set()
+# Password hashing: PBKDF2 rounds and size of the hashing process pool per Gunicorn worker
+# (0 = hash inline; default = CPU cores divided by WEB_CONCURRENCY)
+app.config['PASSWORD_HASH_ROUNDS'] = int(os.getenv('PASSWORD_HASH_ROUNDS', str(password_hasher.rounds)))
+app.config['PASSWORD_HASH_WORKERS'] = int(os.getenv('PASSWORD_HASH_WORKERS', str(password_hasher.workers)))
+password_hasher.init_app(app)
+
+# Token blocklist, shared by all workers on the host
+app.config['REVOKED_TOKENS_PATH'] = os.getenv('REVOKED_TOKENS_PATH', BLOCKLIST.path)
+BLOCKLIST.init_app(app)
 
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload: dict) -> bool:
     return jwt_payload["jti"] in BLOCKLIST
 
+# Battery telemetry write-behind buffer
+app.config['BATTERY_BUFFER_ENABLED'] = os.getenv('BATTERY_BUFFER_ENABLED', '0') == '1'
+app.config['BATTERY_BUFFER_SIZE'] = int(os.getenv('BATTERY_BUFFER_SIZE', '1000'))
+app.config['BATTERY_BUFFER_INTERVAL'] = float(os.getenv('BATTERY_BUFFER_INTERVAL', '1.0'))
+app.config['BATTERY_BUFFER_MAX_BACKLOG'] = int(os.getenv('BATTERY_BUFFER_MAX_BACKLOG', '100000'))
+
+# Read-through cache for single-entity DAO lookups. Off by default: the cache lives in each
+# worker's memory, so writes made through one Gunicorn worker reach the others only after the TTL
+app.config['ENTITY_CACHE_ENABLED'] = os.getenv('ENTITY_CACHE_ENABLED', '0') == '1'
+app.config['ENTITY_CACHE_MAX_ENTRIES'] = int(os.getenv('ENTITY_CACHE_MAX_ENTRIES', '10000'))
+app.config['ENTITY_CACHE_MAX_BYTES'] = int(os.getenv('ENTITY_CACHE_MAX_BYTES', str(32 * 1024 * 1024)))
+app.config['ENTITY_CACHE_TTL'] = float(os.getenv('ENTITY_CACHE_TTL', '5'))
+
+# GET /fleet/summary: seconds to serve the last computed summary (0 disables the cache)
+app.config['FLEET_SUMMARY_CACHE_TTL'] = float(os.getenv('FLEET_SUMMARY_CACHE_TTL', '10'))
+
+# Per-request SQL statistics: Server-Timing header and /admin/sql_report
+app.config['SQL_INSTRUMENTATION_ENABLED'] = os.getenv('SQL_INSTRUMENTATION_ENABLED', '0') == '1'
+app.config['SQL_N_PLUS_ONE_THRESHOLD'] = int(os.getenv('SQL_N_PLUS_ONE_THRESHOLD', '5'))
+
 # Init DB
 db.init_app(app)
+battery_buffer.init_app(app)
+entity_cache.init_app(app)
+fleet_summary_cache.ttl = app.config['FLEET_SUMMARY_CACHE_TTL']
+change_tracker.init_app(app)
+db_pool_monitor.init_app(app)
+sql_instrumentation.init_app(app)
 
 # Register blueprints
 app.register_blueprint(operator_blueprint)
@@ -87,6 +148,12 @@ app.register_blueprint(camera_blueprint)
 app.register_blueprint(maintenance_blueprint)
 app.register_blueprint(robot_maintenance_blueprint)
 app.register_blueprint(user_blueprint)
+app.register_blueprint(battery_blueprint)
+app.register_blueprint(telemetry_rollup_blueprint)
+app.register_blueprint(fleet_blueprint)
+app.register_blueprint(change_feed_blueprint)
+app.register_blueprint(metrics_blueprint)
+app.register_blueprint(admin_blueprint)
 
 # Routes
 @app.route('/')
@@ -0,0 +1,53 @@
+from auth.dao.list_query import parse_datetime
+from auth.service.battery_service import BatteryService
+from auth.service.robot_service import RobotService
+
+MAX_READINGS_PER_REQUEST = 5000
+# Довжина battery.temperature (VARCHAR(45))
+MAX_TEMPERATURE_LENGTH = 45
+
+class BatteryController:
+
+    @staticmethod
+    def add_readings(robot_id, data):
+        readings = data if isinstance(data, list) else [data]
+        if not readings or not all(isinstance(reading, dict) for reading in readings):
+            return {'error': 'Expected a JSON array of readings'}, 400
+        if len(readings) > MAX_READINGS_PER_REQUEST:
+            return {'error': f'At most {MAX_READINGS_PER_REQUEST} readings per request'}, 413
+
+        required_fields = ['log_time', 'battery_level', 'temperature']
+        rows = []
+        for index, reading in enumerate(readings):
+            if not all(field in reading for field in required_fields):
+                return {'error': f'Missing required fields in reading {index}'}, 400
+            try:
+                log_time = parse_datetime(reading['log_time'])
+            except (TypeError, ValueError):
+                return {'error': f'Invalid log_time in reading {index}'}, 400
+            # З буфером клієнт отримує 202 ще до запису, тож усе, що відхилила б база, відсіюється тут
+            battery_level = reading['battery_level']
+            if isinstance(battery_level, bool) or not isinstance(battery_level, int):
+                return {'error': f'battery_level must be an integer in reading {index}'}, 400
+            if not 0 <= battery_level <= 100:
+                return {'error': f'battery_level out of range in reading {index}'}, 400
+            temperature = reading['temperature']
+            if isinstance(temperature, bool) or not isinstance(temperature, (str, int, float)):
+                return {'error': f'temperature must be a string or a number in reading {index}'}, 400
+            temperature = str(temperature)
+            if len(temperature) > MAX_TEMPERATURE_LENGTH:
+                return {'error': f'temperature longer than {MAX_TEMPERATURE_LENGTH} characters in reading {index}'}, 400
+            rows.append({
+                'log_time': log_time,
+                'battery_level': battery_level,
+                'robot_id': robot_id,
+                'temperature': temperature
+            })
+
+        if not RobotService.get_robot(robot_id):
+            return {'error': 'Robot not found'}, 404
+
+        buffered = BatteryService.add_readings(rows)
+        if buffered:
+            return {'accepted': len(rows)}, 202
+        return {'inserted': len(rows)}, 201
@@ -1 +1,60 @@
-BLOCKLIST = set()
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+NO_EXPIRY = 2 ** 62
+
+
+class RevokedTokenStore:
+    """
+    Спільний для всіх воркерів gunicorn список відкликаних jti.
+
+    Зберігається у SQLite-файлі в режимі WAL: перевірка — пошук за первинним
+    ключем без мережевого запиту, запис одразу видно іншим процесам. Записи
+    видаляються, щойно минає exp токена.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(tempfile.gettempdir(), 'patrol_revoked_tokens.sqlite3')
+        self._local = threading.local()
+
+    def init_app(self, app):
+        self.path = app.config.get('REVOKED_TOKENS_PATH', self.path)
+        self._local = threading.local()
+
+    def add(self, jti, expires_at=None):
+        connection = self._connection()
+        now = int(time.time())
+        connection.execute(
+            'INSERT OR REPLACE INTO revoked_tokens (jti, expires_at) VALUES (?, ?)',
+            (jti, int(expires_at) if expires_at else NO_EXPIRY)
+        )
+        connection.execute('DELETE FROM revoked_tokens WHERE expires_at <= ?', (now,))
+
+    def __contains__(self, jti):
+        row = self._connection().execute(
+            'SELECT 1 FROM revoked_tokens WHERE jti = ? AND expires_at > ?', (jti, int(time.time()))
+        ).fetchone()
+        return row is not None
+
+    def _connection(self):
+        # Окреме з'єднання на потік і процес: sqlite3 не можна ділити після fork
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(self.path, timeout=5, isolation_level=None, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS revoked_tokens ('
+            'jti TEXT PRIMARY KEY, expires_at INTEGER NOT NULL) WITHOUT ROWID'
+        )
+        connection.execute('CREATE INDEX IF NOT EXISTS ix_revoked_tokens_expires_at ON revoked_tokens (expires_at)')
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        return connection
+
+
+BLOCKLIST = RevokedTokenStore()
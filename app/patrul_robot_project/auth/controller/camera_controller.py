@@ -1,7 +1,23 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.camera_service import CameraService
 
 class CameraController:
 
+    @staticmethod
+    def _to_dict(camera):
+        return {
+            'id': camera.camera_id,
+            'robot_id': camera.robot_id,
+            'resolution': camera.resolution,
+            'zoom_level': camera.zoom_level,
+            'status': camera.status,
+            'night_vision': camera.night_vision,
+            'panoramic_view': camera.panoramic_view,
+            'version': camera.version
+        }
+
     @staticmethod
     def add_camera(data):
         required_fields = ['robot_id', 'resolution', 'zoom_level', 'status', 'night_vision', 'panoramic_view']
@@ -19,55 +35,118 @@ class CameraController:
         return {'id': camera.camera_id}, 201
 
     @staticmethod
-    def get_camera(camera_id):
+    def apply_camera_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        try:
+            results, applied = CameraService.apply_camera_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_camera(camera_id, fields=None):
+        if fields:
+            try:
+                camera = CameraService.get_camera_fields(camera_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if camera:
+                return camera, 200
+            return {'error': 'Camera not found'}, 404
+
         camera = CameraService.get_camera(camera_id)
         if camera:
-            return {
-                'id': camera.camera_id,
-                'robot_id': camera.robot_id,
-                'resolution': camera.resolution,
-                'zoom_level': camera.zoom_level,
-                'status': camera.status,
-                'night_vision': camera.night_vision,
-                'panoramic_view': camera.panoramic_view
-            }, 200
+            return CameraController._to_dict(camera), 200
         return {'error': 'Camera not found'}, 404
 
     @staticmethod
-    def get_all_cameras():
-        cameras = CameraService.get_all_cameras()
-        return [{
-            'id': cam.camera_id,
-            'robot_id': cam.robot_id,
-            'resolution': cam.resolution,
-            'zoom_level': cam.zoom_level,
-            'status': cam.status,
-            'night_vision': cam.night_vision,
-            'panoramic_view': cam.panoramic_view
-        } for cam in cameras], 200
+    def get_cameras_by_ids(ids, fields=None):
+        try:
+            items, missing = CameraService.get_cameras_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
 
     @staticmethod
-    def update_camera(camera_id, data):
+    def get_all_cameras(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = CameraService.get_all_cameras(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
+
+    @staticmethod
+    def stream_all_cameras(fields=None, filters=None, sort=None):
+        try:
+            return CameraService.stream_all_cameras(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+
+    @staticmethod
+    def update_camera(camera_id, data, versions=None):
         required_fields = ['robot_id', 'resolution', 'zoom_level', 'status', 'night_vision', 'panoramic_view']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
 
-        camera = CameraService.update_camera(
-            camera_id,
-            robot_id=data['robot_id'],
-            resolution=data['resolution'],
-            zoom_level=data['zoom_level'],
-            status=data['status'],
-            night_vision=data['night_vision'],
-            panoramic_view=data['panoramic_view']
-        )
+        try:
+            camera = CameraService.update_camera(
+                camera_id,
+                robot_id=data['robot_id'],
+                resolution=data['resolution'],
+                zoom_level=data['zoom_level'],
+                status=data['status'],
+                night_vision=data['night_vision'],
+                panoramic_view=data['panoramic_view'],
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if camera:
             return {'message': 'Camera updated'}, 200
         return {'error': 'Camera not found'}, 404
 
     @staticmethod
-    def delete_camera(camera_id):
-        camera = CameraService.delete_camera(camera_id)
-        if camera:
+    def patch_camera(camera_id, data, versions=None):
+        try:
+            updated = CameraService.patch_camera(camera_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Camera updated'}, 200
+        return {'error': 'Camera not found'}, 404
+
+    @staticmethod
+    def delete_camera(camera_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = CameraService.preview_camera_delete(camera_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Camera not found'}, 404
+
+        try:
+            deleted = CameraService.delete_camera(camera_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Camera deleted'}, 200
         return {'error': 'Camera not found'}, 404
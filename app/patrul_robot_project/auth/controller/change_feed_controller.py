@@ -0,0 +1,27 @@
+from auth.dao.list_query import FilterError
+from auth.service.change_feed_service import ChangeFeedService
+
+class ChangeFeedController:
+
+    @staticmethod
+    def get_changes(since=None, limit=None, entities=None):
+        if since is None:
+            return {
+                'items': [],
+                'next_since': ChangeFeedService.get_current_version(),
+                'has_more': False
+            }, 200
+        try:
+            since = int(since)
+        except ValueError:
+            return {'error': f'Invalid since: {since}'}, 400
+
+        try:
+            items, next_since, has_more = ChangeFeedService.get_changes(since, limit, entities)
+        except FilterError as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_since': next_since,
+            'has_more': has_more
+        }, 200
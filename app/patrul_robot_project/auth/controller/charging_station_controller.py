@@ -1,7 +1,20 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.charging_station_service import ChargingStationService
 
 class ChargingStationController:
 
+    @staticmethod
+    def _to_dict(station):
+        return {
+            'id': station.station_id,
+            'location': station.location,
+            'capacity': station.capacity,
+            'available': station.available,
+            'version': station.version
+        }
+
     @staticmethod
     def add_station(data):
         required_fields = ['location', 'capacity', 'available']
@@ -16,62 +29,134 @@ class ChargingStationController:
         return {'id': station.station_id}, 201
 
     @staticmethod
-    def get_station(station_id):
+    def apply_station_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        try:
+            results, applied = ChargingStationService.apply_station_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_station(station_id, fields=None):
+        if fields:
+            try:
+                station = ChargingStationService.get_station_fields(station_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if station:
+                return station, 200
+            return {'error': 'Charging station not found'}, 404
+
         station = ChargingStationService.get_station(station_id)
         if station:
-            return {
-                'id': station.station_id,
-                'location': station.location,
-                'capacity': station.capacity,
-                'available': station.available
-            }, 200
+            return ChargingStationController._to_dict(station), 200
         return {'error': 'Charging station not found'}, 404
 
     @staticmethod
-    def get_all_stations():
-        stations = ChargingStationService.get_all_stations()
-        return [{
-            'id': st.station_id,
-            'location': st.location,
-            'capacity': st.capacity,
-            'available': st.available
-        } for st in stations], 200
+    def get_stations_by_ids(ids, fields=None):
+        try:
+            items, missing = ChargingStationService.get_stations_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
 
     @staticmethod
-    def update_station(station_id, data):
+    def get_all_stations(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = ChargingStationService.get_all_stations(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
+
+    @staticmethod
+    def stream_all_stations(fields=None, filters=None, sort=None):
+        try:
+            return ChargingStationService.stream_all_stations(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+
+    @staticmethod
+    def update_station(station_id, data, versions=None):
         required_fields = ['location', 'capacity', 'available']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
         
-        station = ChargingStationService.update_station(
-            station_id,
-            location=data['location'],
-            capacity=data['capacity'],
-            available=data['available']
-        )
+        try:
+            station = ChargingStationService.update_station(
+                station_id,
+                location=data['location'],
+                capacity=data['capacity'],
+                available=data['available'],
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if station:
             return {'message': 'Charging station updated'}, 200
         return {'error': 'Charging station not found'}, 404
 
     @staticmethod
-    def delete_station(station_id):
-        station = ChargingStationService.delete_station(station_id)
-        if station:
+    def patch_station(station_id, data, versions=None):
+        try:
+            updated = ChargingStationService.patch_station(station_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Charging station updated'}, 200
+        return {'error': 'Charging station not found'}, 404
+
+    @staticmethod
+    def delete_station(station_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = ChargingStationService.preview_station_delete(station_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Charging station not found'}, 404
+
+        try:
+            deleted = ChargingStationService.delete_station(station_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Charging station deleted'}, 200
         return {'error': 'Charging station not found'}, 404
 
     @staticmethod
-    def get_charging_stations_with_robots():
-        stations = ChargingStationService.get_all_stations_with_robots()
-        return [{
-            'id': st.station_id,
-            'location': st.location,
-            'capacity': st.capacity,
-            'available': st.available,
-            'robots': [{
-                'id': rb.robot_id,
-                'status': rb.status,
-                'max_distance': rb.max_distance,
-                'alternative_power_source': rb.alternative_power_source
-            } for rb in st.robots]
-        } for st in stations], 200
+    def get_charging_stations_with_robots(limit=None, after=None):
+        stations, next_cursor = ChargingStationService.get_all_stations_with_robots(limit, after)
+        return {
+            'items': [{
+                'id': st.station_id,
+                'location': st.location,
+                'capacity': st.capacity,
+                'available': st.available,
+                'robots': [{
+                    'id': rb.robot_id,
+                    'status': rb.status,
+                    'max_distance': rb.max_distance,
+                    'alternative_power_source': rb.alternative_power_source
+                } for rb in st.robots]
+            } for st in stations],
+            'next_cursor': next_cursor
+        }, 200
@@ -0,0 +1,7 @@
+from auth.service.fleet_service import FleetService
+
+class FleetController:
+
+    @staticmethod
+    def get_fleet_summary():
+        return FleetService.get_fleet_summary(), 200
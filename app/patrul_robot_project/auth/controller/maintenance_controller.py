@@ -1,7 +1,21 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.maintenance_service import MaintenanceService
 
 class MaintenanceController:
 
+    @staticmethod
+    def _to_dict(maintenance):
+        return {
+            'id': maintenance.maintenance_id,
+            'maintenance_date': maintenance.maintenance_date,
+            'description': maintenance.description,
+            'technician_name': maintenance.technician_name,
+            'next_maintenance': maintenance.next_maintenance,
+            'version': maintenance.version
+        }
+
     @staticmethod
     def add_maintenance(data):
         required_fields = ['maintenance_date', 'description', 'technician_name', 'next_maintenance']
@@ -17,49 +31,116 @@ class MaintenanceController:
         return {'id': maintenance.maintenance_id}, 201
 
     @staticmethod
-    def get_maintenance(maintenance_id):
+    def apply_maintenance_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        try:
+            results, applied = MaintenanceService.apply_maintenance_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_maintenance(maintenance_id, fields=None):
+        if fields:
+            try:
+                maintenance = MaintenanceService.get_maintenance_fields(maintenance_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if maintenance:
+                return maintenance, 200
+            return {'error': 'Maintenance not found'}, 404
+
         maintenance = MaintenanceService.get_maintenance(maintenance_id)
         if maintenance:
-            return {
-                'id': maintenance.maintenance_id,
-                'maintenance_date': maintenance.maintenance_date.strftime('%Y-%m-%d %H:%M:%S'),
-                'description': maintenance.description,
-                'technician_name': maintenance.technician_name,
-                'next_maintenance': maintenance.next_maintenance.strftime('%Y-%m-%d %H:%M:%S')
-            }, 200
+            return MaintenanceController._to_dict(maintenance), 200
         return {'error': 'Maintenance not found'}, 404
 
     @staticmethod
-    def get_all_maintenances():
-        maintenances = MaintenanceService.get_all_maintenances()
-        return [{
-            'id': maintenance.maintenance_id,
-            'maintenance_date': maintenance.maintenance_date.strftime('%Y-%m-%d %H:%M:%S'),
-            'description': maintenance.description,
-            'technician_name': maintenance.technician_name,
-            'next_maintenance': maintenance.next_maintenance.strftime('%Y-%m-%d %H:%M:%S')
-        } for maintenance in maintenances], 200
+    def get_maintenances_by_ids(ids, fields=None):
+        try:
+            items, missing = MaintenanceService.get_maintenances_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
+
+    @staticmethod
+    def get_all_maintenances(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = MaintenanceService.get_all_maintenances(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
 
     @staticmethod
-    def update_maintenance(maintenance_id, data):
+    def stream_all_maintenances(fields=None, filters=None, sort=None):
+        try:
+            return MaintenanceService.stream_all_maintenances(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+
+    @staticmethod
+    def update_maintenance(maintenance_id, data, versions=None):
         required_fields = ['maintenance_date', 'description', 'technician_name', 'next_maintenance']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
 
-        maintenance = MaintenanceService.update_maintenance(
-            maintenance_id,
-            maintenance_date=data['maintenance_date'],
-            description=data['description'],
-            technician_name=data['technician_name'],
-            next_maintenance=data['next_maintenance']
-        )
+        try:
+            maintenance = MaintenanceService.update_maintenance(
+                maintenance_id,
+                maintenance_date=data['maintenance_date'],
+                description=data['description'],
+                technician_name=data['technician_name'],
+                next_maintenance=data['next_maintenance'],
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if maintenance:
             return {'message': 'Maintenance updated'}, 200
         return {'error': 'Maintenance not found'}, 404
 
     @staticmethod
-    def delete_maintenance(maintenance_id):
-        maintenance = MaintenanceService.delete_maintenance(maintenance_id)
-        if maintenance:
+    def patch_maintenance(maintenance_id, data, versions=None):
+        try:
+            updated = MaintenanceService.patch_maintenance(maintenance_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Maintenance updated'}, 200
+        return {'error': 'Maintenance not found'}, 404
+
+    @staticmethod
+    def delete_maintenance(maintenance_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = MaintenanceService.preview_maintenance_delete(maintenance_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Maintenance not found'}, 404
+
+        try:
+            deleted = MaintenanceService.delete_maintenance(maintenance_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Maintenance deleted'}, 200
         return {'error': 'Maintenance not found'}, 404
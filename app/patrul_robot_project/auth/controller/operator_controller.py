@@ -1,7 +1,21 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.operator_service import OperatorService
 
 class OperatorController:
 
+    @staticmethod
+    def _to_dict(operator):
+        return {
+            'id': operator.operators_id,
+            'name': operator.name,
+            'shift_start': operator.shift_start,
+            'shift_end': operator.shift_end,
+            'contact_info': operator.contact_info,
+            'version': operator.version
+        }
+
     @staticmethod
     def add_operator(data):
         required_fields = ['name', 'shift_start', 'shift_end', 'contact_info']
@@ -17,66 +31,136 @@ class OperatorController:
         return {'id': operator.operators_id}, 201
 
     @staticmethod
-    def get_operator(operator_id):
+    def apply_operator_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        try:
+            results, applied = OperatorService.apply_operator_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_operator(operator_id, fields=None):
+        if fields:
+            try:
+                operator = OperatorService.get_operator_fields(operator_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if operator:
+                return operator, 200
+            return {'error': 'Operator not found'}, 404
+
         operator = OperatorService.get_operator(operator_id)
         if operator:
-            return {
-                'id': operator.operators_id,
-                'name': operator.name,
-                'shift_start': operator.shift_start.strftime('%H:%M:%S'),
-                'shift_end': operator.shift_end.strftime('%H:%M:%S'),
-                'contact_info': operator.contact_info
-            }, 200
+            return OperatorController._to_dict(operator), 200
         return {'error': 'Operator not found'}, 404
 
     @staticmethod
-    def get_all_operators():
-        operators = OperatorService.get_all_operators()
-        return [{
-            'id': op.operators_id,
-            'name': op.name,
-            'shift_start': op.shift_start.strftime('%H:%M:%S'),
-            'shift_end': op.shift_end.strftime('%H:%M:%S'),
-            'contact_info': op.contact_info
-        } for op in operators], 200
+    def get_operators_by_ids(ids, fields=None):
+        try:
+            items, missing = OperatorService.get_operators_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
 
     @staticmethod
-    def update_operator(operator_id, data):
+    def get_all_operators(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = OperatorService.get_all_operators(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
+
+    @staticmethod
+    def stream_all_operators(fields=None, filters=None, sort=None):
+        try:
+            return OperatorService.stream_all_operators(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+
+    @staticmethod
+    def update_operator(operator_id, data, versions=None):
         required_fields = ['name', 'shift_start', 'shift_end', 'contact_info']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
 
-        operator = OperatorService.update_operator(
-            operator_id,
-            name=data['name'],
-            shift_start=data['shift_start'],
-            shift_end=data['shift_end'],
-            contact_info=data['contact_info']
-        )
+        try:
+            operator = OperatorService.update_operator(
+                operator_id,
+                name=data['name'],
+                shift_start=data['shift_start'],
+                shift_end=data['shift_end'],
+                contact_info=data['contact_info'],
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if operator:
             return {'message': 'Operator updated'}, 200
         return {'error': 'Operator not found'}, 404
 
     @staticmethod
-    def delete_operator(operator_id):
-        operator = OperatorService.delete_operator(operator_id)
-        if operator:
+    def patch_operator(operator_id, data, versions=None):
+        try:
+            updated = OperatorService.patch_operator(operator_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Operator updated'}, 200
+        return {'error': 'Operator not found'}, 404
+
+    @staticmethod
+    def delete_operator(operator_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = OperatorService.preview_operator_delete(operator_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Operator not found'}, 404
+
+        try:
+            deleted = OperatorService.delete_operator(operator_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Operator deleted'}, 200
         return {'error': 'Operator not found'}, 404
 
     @staticmethod
-    def get_operators_with_robots():
-        operators = OperatorService.get_all_operators_with_robots()
-        return [{
-            'id': op.operators_id,
-            'name': op.name,
-            'shift_start': op.shift_start.strftime('%H:%M:%S'),
-            'shift_end': op.shift_end.strftime('%H:%M:%S'),
-            'contact_info': op.contact_info,
-            'robots': [{
-                'id': rb.robot_id,
-                'status': rb.status,
-                'max_distance': rb.max_distance,
-                'alternative_power_source': rb.alternative_power_source
-            } for rb in op.robots]
-        } for op in operators], 200
+    def get_operators_with_robots(limit=None, after=None):
+        operators, next_cursor = OperatorService.get_all_operators_with_robots(limit, after)
+        return {
+            'items': [{
+                'id': op.operators_id,
+                'name': op.name,
+                'shift_start': op.shift_start,
+                'shift_end': op.shift_end,
+                'contact_info': op.contact_info,
+                'robots': [{
+                    'id': rb.robot_id,
+                    'status': rb.status,
+                    'max_distance': rb.max_distance,
+                    'alternative_power_source': rb.alternative_power_source
+                } for rb in op.robots]
+            } for op in operators],
+            'next_cursor': next_cursor
+        }, 200
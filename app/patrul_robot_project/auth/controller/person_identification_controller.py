@@ -1,7 +1,23 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.person_identification_service import PersonIdentificationService
 
 class PersonIdentificationController:
 
+    @staticmethod
+    def _to_dict(identification):
+        return {
+            'id': identification.identification_id,
+            'person_name': identification.person_name,
+            'timestamp': identification.timestamp,
+            'accuracy': identification.accuracy,
+            'sensor_id': identification.sensor_id,
+            'camera_id': identification.camera_id,
+            'report_id': identification.report_id,
+            'version': identification.version
+        }
+
     @staticmethod
     def add_identification(data):
         required_fields = ['person_name', 'timestamp', 'accuracy', 'sensor_id', 'camera_id', 'report_id']
@@ -19,69 +35,135 @@ class PersonIdentificationController:
         return {'id': identification.identification_id}, 201
 
     @staticmethod
-    def get_identification(identification_id):
+    def apply_identification_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        try:
+            results, applied = PersonIdentificationService.apply_identification_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_identification(identification_id, fields=None):
+        if fields:
+            try:
+                identification = PersonIdentificationService.get_identification_fields(identification_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if identification:
+                return identification, 200
+            return {'error': 'Person identification not found'}, 404
+
         identification = PersonIdentificationService.get_identification(identification_id)
         if identification:
-            return {
-                'id': identification.identification_id,
-                'person_name': identification.person_name,
-                'timestamp': identification.timestamp,
-                'accuracy': identification.accuracy,
-                'sensor_id': identification.sensor_id,
-                'camera_id': identification.camera_id,
-                'report_id': identification.report_id
-            }, 200
+            return PersonIdentificationController._to_dict(identification), 200
         return {'error': 'Person identification not found'}, 404
 
     @staticmethod
-    def get_all_identifications():
-        identifications = PersonIdentificationService.get_all_identifications()
-        return [{
-            'id': idf.identification_id,
-            'person_name': idf.person_name,
-            'timestamp': idf.timestamp,
-            'accuracy': idf.accuracy,
-            'sensor_id': idf.sensor_id,
-            'camera_id': idf.camera_id,
-            'report_id': idf.report_id
-        } for idf in identifications], 200
+    def get_identifications_by_ids(ids, fields=None):
+        try:
+            items, missing = PersonIdentificationService.get_identifications_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
 
     @staticmethod
-    def update_identification(identification_id, data):
+    def get_all_identifications(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = PersonIdentificationService.get_all_identifications(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
+
+    @staticmethod
+    def stream_all_identifications(fields=None, filters=None, sort=None):
+        try:
+            return PersonIdentificationService.stream_all_identifications(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+
+    @staticmethod
+    def update_identification(identification_id, data, versions=None):
         required_fields = ['person_name', 'timestamp', 'accuracy', 'sensor_id', 'camera_id', 'report_id']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
 
-        identification = PersonIdentificationService.update_identification(
-            identification_id,
-            person_name=data['person_name'],
-            timestamp=data['timestamp'],
-            accuracy=data['accuracy'],
-            sensor_id=data['sensor_id'],
-            camera_id=data['camera_id'],
-            report_id=data['report_id']
-        )
+        try:
+            identification = PersonIdentificationService.update_identification(
+                identification_id,
+                person_name=data['person_name'],
+                timestamp=data['timestamp'],
+                accuracy=data['accuracy'],
+                sensor_id=data['sensor_id'],
+                camera_id=data['camera_id'],
+                report_id=data['report_id'],
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if identification:
             return {'message': 'Person identification updated'}, 200
         return {'error': 'Person identification not found'}, 404
 
     @staticmethod
-    def delete_identification(identification_id):
-        identification = PersonIdentificationService.delete_identification(identification_id)
-        if identification:
+    def patch_identification(identification_id, data, versions=None):
+        try:
+            updated = PersonIdentificationService.patch_identification(identification_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Person identification updated'}, 200
+        return {'error': 'Person identification not found'}, 404
+
+    @staticmethod
+    def delete_identification(identification_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = PersonIdentificationService.preview_identification_delete(identification_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Person identification not found'}, 404
+
+        try:
+            deleted = PersonIdentificationService.delete_identification(identification_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Person identification deleted'}, 200
         return {'error': 'Person identification not found'}, 404
 
     @staticmethod
-    def get_person_identifications_with_reports():
-        identifications = PersonIdentificationService.get_all_identifications_with_reports()
-        return [{
-            'identification_id': ident.identification_id,
-            'person_name': ident.person_name,
-            'timestamp': ident.timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-            'accuracy': str(ident.accuracy),
-            'report': {
-                'id': ident.report.report_id,
-                'observations': ident.report.observations
-            } if ident.report else None
-        } for ident in identifications], 200
+    def get_person_identifications_with_reports(limit=None, after=None):
+        identifications, next_cursor = PersonIdentificationService.get_all_identifications_with_reports(limit, after)
+        return {
+            'items': [{
+                'identification_id': ident.identification_id,
+                'person_name': ident.person_name,
+                'timestamp': ident.timestamp,
+                'accuracy': ident.accuracy,
+                'report': {
+                    'id': ident.report.report_id,
+                    'observations': ident.report.observations
+                } if ident.report else None
+            } for ident in identifications],
+            'next_cursor': next_cursor
+        }, 200
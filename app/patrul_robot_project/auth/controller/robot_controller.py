@@ -1,16 +1,37 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.robot_dao import JWT_INCLUDES, ROBOT_INCLUDES
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.robot_service import RobotService
 
 class RobotController:
 
+    @staticmethod
+    def _to_dict(robot):
+        return {
+            'id': robot.robot_id,
+            'status': robot.status,
+            'max_distance': robot.max_distance,
+            'operator_id': robot.operator_id,
+            'station_id': robot.station_id,
+            'alternative_power_source': robot.alternative_power_source,
+            'version': robot.version
+        }
+
+    @staticmethod
+    def _power_source(value):
+        # alternative_power_source приймає і bool, і 'yes'/'no'
+        if isinstance(value, bool):
+            return 'yes' if value else 'no'
+        return value
+
     @staticmethod
     def add_robot(data):
         required_fields = ['status', 'max_distance', 'operator_id', 'station_id', 'alternative_power_source']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
         
-        alt_power = data['alternative_power_source']
-        if isinstance(alt_power, bool):
-            alt_power = 'yes' if alt_power else 'no'
+        alt_power = RobotController._power_source(data['alternative_power_source'])
 
         robot = RobotService.add_robot(
             status=data['status'],
@@ -22,56 +43,141 @@ class RobotController:
         return {'id': robot.robot_id}, 201
 
     @staticmethod
-    def get_robot(robot_id):
+    def apply_robot_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        for operation in operations if isinstance(operations, list) else ():
+            values = operation.get('data') if isinstance(operation, dict) else None
+            if isinstance(values, dict) and 'alternative_power_source' in values:
+                values['alternative_power_source'] = RobotController._power_source(values['alternative_power_source'])
+        try:
+            results, applied = RobotService.apply_robot_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_robot(robot_id, fields=None):
+        if fields:
+            try:
+                robot = RobotService.get_robot_fields(robot_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if robot:
+                return robot, 200
+            return {'error': 'Robot not found'}, 404
+
         robot = RobotService.get_robot(robot_id)
         if robot:
-            return {
-                'id': robot.robot_id,
-                'status': robot.status,
-                'max_distance': robot.max_distance,
-                'operator_id': robot.operator_id,
-                'station_id': robot.station_id,
-                'alternative_power_source': robot.alternative_power_source
-            }, 200
+            return RobotController._to_dict(robot), 200
         return {'error': 'Robot not found'}, 404
 
     @staticmethod
-    def get_all_robots():
-        robots = RobotService.get_all_robots()
-        return [{
-            'id': rb.robot_id,
-            'status': rb.status,
-            'max_distance': rb.max_distance,
-            'operator_id': rb.operator_id,
-            'station_id': rb.station_id,
-            'alternative_power_source': rb.alternative_power_source
-        } for rb in robots], 200
+    def get_robot_full(robot_id, include=None, authenticated=False):
+        if not authenticated:
+            # Без токена сенсори не входять у набір за замовчуванням, а явний запит на них — 401
+            if include is None:
+                include = [name for name in ROBOT_INCLUDES if name not in JWT_INCLUDES]
+            elif JWT_INCLUDES.intersection(include):
+                return {'error': f"A JWT is required to include {', '.join(sorted(JWT_INCLUDES.intersection(include)))}"}, 401
+        try:
+            robot = RobotService.get_robot_full(robot_id, include)
+        except UnknownFieldError as error:
+            return {'error': str(error)}, 400
+        if robot:
+            return robot, 200
+        return {'error': 'Robot not found'}, 404
+
+    @staticmethod
+    def get_robots_by_ids(ids, fields=None):
+        try:
+            items, missing = RobotService.get_robots_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
 
     @staticmethod
-    def update_robot(robot_id, data):
+    def get_all_robots(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = RobotService.get_all_robots(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
+
+    @staticmethod
+    def stream_all_robots(fields=None, filters=None, sort=None):
+        try:
+            return RobotService.stream_all_robots(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+
+    @staticmethod
+    def update_robot(robot_id, data, versions=None):
         required_fields = ['status', 'max_distance', 'operator_id', 'station_id', 'alternative_power_source']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
 	
-        alt_power = data['alternative_power_source']
-        if isinstance(alt_power, bool):
-            alt_power = 'yes' if alt_power else 'no'        
+        alt_power = RobotController._power_source(data['alternative_power_source'])
         
-        robot = RobotService.update_robot(
-            robot_id,
-            status=data['status'],
-            max_distance=data['max_distance'],
-            operator_id=data['operator_id'],
-            station_id=data['station_id'],
-            alternative_power_source=alt_power
-        )
+        try:
+            robot = RobotService.update_robot(
+                robot_id,
+                status=data['status'],
+                max_distance=data['max_distance'],
+                operator_id=data['operator_id'],
+                station_id=data['station_id'],
+                alternative_power_source=alt_power,
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if robot:
             return {'message': 'Robot updated'}, 200
         return {'error': 'Robot not found'}, 404
 
     @staticmethod
-    def delete_robot(robot_id):
-        robot = RobotService.delete_robot(robot_id)
-        if robot:
+    def patch_robot(robot_id, data, versions=None):
+        if isinstance(data, dict) and 'alternative_power_source' in data:
+            data['alternative_power_source'] = RobotController._power_source(data['alternative_power_source'])
+        try:
+            updated = RobotService.patch_robot(robot_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Robot updated'}, 200
+        return {'error': 'Robot not found'}, 404
+
+    @staticmethod
+    def delete_robot(robot_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = RobotService.preview_robot_delete(robot_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Robot not found'}, 404
+
+        try:
+            deleted = RobotService.delete_robot(robot_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Robot deleted'}, 200
         return {'error': 'Robot not found'}, 404
@@ -12,20 +12,23 @@ class RobotMaintenanceController:
         } for maintenance in maintenances], 200
 
     @staticmethod
-    def get_all_maintenances_with_robots():
-        maintenances = RobotMaintenanceService.get_all_maintenances_with_robots()
-        return [{
-            'maintenance_id': maintenance.maintenance_id,
-            'description': maintenance.description,
-            'robots': [
-                {
-                    'robot_id': robot_maintenance.robot.robot_id,
-                    'status': robot_maintenance.robot.status,
-                    'max_distance': robot_maintenance.robot.max_distance
-                    # Додайте інші поля, які хочете вивести
-                } for robot_maintenance in maintenance.robot_maintenances
-            ]
-        } for maintenance in maintenances], 200
+    def get_all_maintenances_with_robots(limit=None, after=None):
+        maintenances, next_cursor = RobotMaintenanceService.get_all_maintenances_with_robots(limit, after)
+        return {
+            'items': [{
+                'maintenance_id': maintenance.maintenance_id,
+                'description': maintenance.description,
+                'robots': [
+                    {
+                        'robot_id': robot_maintenance.robot.robot_id,
+                        'status': robot_maintenance.robot.status,
+                        'max_distance': robot_maintenance.robot.max_distance
+                        # Додайте інші поля, які хочете вивести
+                    } for robot_maintenance in maintenance.robot_maintenances
+                ]
+            } for maintenance in maintenances],
+            'next_cursor': next_cursor
+        }, 200
 
     @staticmethod
     def get_maintenance_with_robots(maintenance_id):
@@ -1,7 +1,21 @@
+from auth.dao.batch import StaleVersionError, WriteConflictError, WriteError
+from auth.dao.list_query import FilterError
+from auth.dao.row_serializer import InvalidIdsError, UnknownFieldError
 from auth.service.sensor_service import SensorService
 
 class SensorController:
 
+    @staticmethod
+    def _to_dict(sensor):
+        return {
+            'id': sensor.sensor_id,
+            'robot_id': sensor.robot_id,
+            'technology_used': sensor.technology_used,
+            'detection_range': sensor.detection_range,
+            'trigger_status': sensor.trigger_status,
+            'version': sensor.version
+        }
+
     @staticmethod
     def add_sensor(data):
         required_fields = ['robot_id', 'technology_used', 'detection_range', 'trigger_status']
@@ -17,60 +31,130 @@ class SensorController:
         return {'id': sensor.sensor_id}, 201
 
     @staticmethod
-    def get_sensor(sensor_id):
+    def apply_sensor_batch(data):
+        operations = data.get('operations') if isinstance(data, dict) else None
+        try:
+            results, applied = SensorService.apply_sensor_batch(operations)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        return {
+            'applied': applied,
+            'results': results
+        }, 200 if applied else 400
+
+    @staticmethod
+    def get_sensor(sensor_id, fields=None):
+        if fields:
+            try:
+                sensor = SensorService.get_sensor_fields(sensor_id, fields)
+            except UnknownFieldError as error:
+                return {'error': str(error)}, 400
+            if sensor:
+                return sensor, 200
+            return {'error': 'Sensor not found'}, 404
+
         sensor = SensorService.get_sensor(sensor_id)
         if sensor:
-            return {
-                'id': sensor.sensor_id,
-                'robot_id': sensor.robot_id,
-                'technology_used': sensor.technology_used,
-                'detection_range': sensor.detection_range,
-                'trigger_status': sensor.trigger_status
-            }, 200
+            return SensorController._to_dict(sensor), 200
         return {'error': 'Sensor not found'}, 404
 
     @staticmethod
-    def get_all_sensors():
-        sensors = SensorService.get_all_sensors()
-        return [{
-            'id': sensor.sensor_id,
-            'robot_id': sensor.robot_id,
-            'technology_used': sensor.technology_used,
-            'detection_range': sensor.detection_range,
-            'trigger_status': sensor.trigger_status
-        } for sensor in sensors], 200
+    def get_sensors_by_ids(ids, fields=None):
+        try:
+            items, missing = SensorService.get_sensors_by_ids(ids, fields)
+        except (UnknownFieldError, InvalidIdsError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'missing': missing
+        }, 200
+
+    @staticmethod
+    def get_all_sensors(limit=None, after=None, fields=None, filters=None, sort=None):
+        try:
+            items, next_cursor = SensorService.get_all_sensors(limit, after, fields, filters, sort)
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
+        return {
+            'items': items,
+            'next_cursor': next_cursor
+        }, 200
+
+    @staticmethod
+    def stream_all_sensors(fields=None, filters=None, sort=None):
+        try:
+            return SensorService.stream_all_sensors(fields, filters, sort), 200
+        except (UnknownFieldError, FilterError) as error:
+            return {'error': str(error)}, 400
 
     @staticmethod
-    def update_sensor(sensor_id, data):
+    def update_sensor(sensor_id, data, versions=None):
         required_fields = ['robot_id', 'technology_used', 'detection_range', 'trigger_status']
         if not all(field in data for field in required_fields):
             return {'error': 'Missing required fields'}, 400
 
-        sensor = SensorService.update_sensor(
-            sensor_id,
-            robot_id=data['robot_id'],
-            technology_used=data['technology_used'],
-            detection_range=data['detection_range'],
-            trigger_status=data['trigger_status']
-        )
+        try:
+            sensor = SensorService.update_sensor(
+                sensor_id,
+                robot_id=data['robot_id'],
+                technology_used=data['technology_used'],
+                detection_range=data['detection_range'],
+                trigger_status=data['trigger_status'],
+                versions=versions
+            )
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
         if sensor:
             return {'message': 'Sensor updated'}, 200
         return {'error': 'Sensor not found'}, 404
 
     @staticmethod
-    def delete_sensor(sensor_id):
-        sensor = SensorService.delete_sensor(sensor_id)
-        if sensor:
+    def patch_sensor(sensor_id, data, versions=None):
+        try:
+            updated = SensorService.patch_sensor(sensor_id, data, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        except WriteConflictError as error:
+            return {'error': str(error)}, 409
+        except WriteError as error:
+            return {'error': str(error)}, 400
+        if updated:
+            return {'message': 'Sensor updated'}, 200
+        return {'error': 'Sensor not found'}, 404
+
+    @staticmethod
+    def delete_sensor(sensor_id, dry_run=False, versions=None):
+        if dry_run:
+            counts = SensorService.preview_sensor_delete(sensor_id)
+            if counts:
+                return {
+                    'dry_run': True,
+                    'would_delete': counts
+                }, 200
+            return {'error': 'Sensor not found'}, 404
+
+        try:
+            deleted = SensorService.delete_sensor(sensor_id, versions)
+        except StaleVersionError as error:
+            return {'error': str(error)}, 412
+        if deleted:
             return {'message': 'Sensor deleted'}, 200
         return {'error': 'Sensor not found'}, 404
 
     @staticmethod
-    def get_sensors_with_robot():
-        sensors = SensorService.get_all_sensors_with_robot()
-        return [{
-            'id': sen.sensor_id,
-            'technology_used': sen.technology_used,
-            'detection_range': sen.detection_range,
-            'robot_id': sen.robot.robot_id if sen.robot else None,
-            'robot_status': sen.robot.status if sen.robot else None
-        } for sen in sensors], 200
+    def get_sensors_with_robot(limit=None, after=None):
+        sensors, next_cursor = SensorService.get_all_sensors_with_robot(limit, after)
+        return {
+            'items': [{
+                'id': sen.sensor_id,
+                'technology_used': sen.technology_used,
+                'detection_range': sen.detection_range,
+                'robot_id': sen.robot.robot_id if sen.robot else None,
+                'robot_status': sen.robot.status if sen.robot else None
+            } for sen in sensors],
+            'next_cursor': next_cursor
+        }, 200
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+
+from auth.dao.list_query import parse_datetime
+from auth.dao.telemetry_rollup_dao import ROLLUP_RESOLUTIONS
+from auth.service.telemetry_rollup_service import DEFAULT_MAX_POINTS, TelemetryRollupService
+
+BATTERY_METRICS = ['battery_level', 'temperature']
+
+class TelemetryRollupController:
+
+    @staticmethod
+    def _series(metric, entity_key, entity_id, start, end, max_points, resolution):
+        try:
+            end = parse_datetime(end) if end else datetime.utcnow()
+            start = parse_datetime(start) if start else end - timedelta(days=1)
+        except ValueError:
+            return {'error': 'from and to must be ISO 8601 datetimes'}, 400
+        if start >= end:
+            return {'error': 'from must be earlier than to'}, 400
+        if resolution is not None and resolution not in ROLLUP_RESOLUTIONS:
+            return {'error': f'resolution must be one of {list(ROLLUP_RESOLUTIONS)}'}, 400
+
+        resolution, buckets = TelemetryRollupService.get_series(
+            metric, entity_id, start, end, max_points or DEFAULT_MAX_POINTS, resolution
+        )
+        return {
+            'metric': metric,
+            entity_key: entity_id,
+            'resolution': resolution,
+            'from': start,
+            'to': end,
+            'points': [{
+                'bucket_start': bucket.bucket_start,
+                'count': bucket.sample_count,
+                'min': bucket.value_min,
+                'max': bucket.value_max,
+                'avg': bucket.value_sum / bucket.sample_count,
+                'last': bucket.value_last
+            } for bucket in buckets]
+        }, 200
+
+    @staticmethod
+    def get_battery_rollup(robot_id, metric, start, end, max_points=None, resolution=None):
+        metric = metric or 'battery_level'
+        if metric not in BATTERY_METRICS:
+            return {'error': f'metric must be one of {BATTERY_METRICS}'}, 400
+        return TelemetryRollupController._series(metric, 'robot_id', robot_id, start, end, max_points, resolution)
+
+    @staticmethod
+    def get_solar_rollup(station_id, start, end, max_points=None, resolution=None):
+        return TelemetryRollupController._series('power_output', 'station_id', station_id, start, end, max_points, resolution)
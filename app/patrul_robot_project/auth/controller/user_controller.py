@@ -11,10 +11,11 @@ class UserController:
         if not username or not password:
             return jsonify({"error": "Username and password required"}), 400
 
-        if UserService.authenticate(username, password):
+        if UserService.exists(username):
             return jsonify({"error": "User already exists"}), 409
 
-        UserService.register(username, password)
+        if not UserService.register(username, password):
+            return jsonify({"error": "User already exists"}), 409
         return jsonify({"message": "User created successfully"}), 201
 
     @staticmethod
@@ -33,6 +34,6 @@ class UserController:
 
     @staticmethod
     def logout():
-        jti = get_jwt()["jti"]
-        BLOCKLIST.add(jti)
+        token = get_jwt()
+        BLOCKLIST.add(token["jti"], token.get("exp"))
         return jsonify({"message": "Successfully logged out"}), 200
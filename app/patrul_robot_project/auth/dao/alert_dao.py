@@ -1,5 +1,7 @@
 from auth.domain.models import db
 from auth.domain.alert import Alert
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.pagination import keyset_page
 
 class AlertDAO:
     @staticmethod
@@ -10,14 +12,16 @@ class AlertDAO:
         return new_alert
 
     @staticmethod
+    @cached_get(Alert)
     def get_alert(alerts_id):
         return Alert.query.get(alerts_id)
 
     @staticmethod
-    def get_all_alerts():
-        return Alert.query.all()
+    def get_all_alerts(limit=None, after=None):
+        return keyset_page(Alert.query, Alert.alerts_id, limit, after)
 
     @staticmethod
+    @invalidates(Alert)
     def update_alert(alerts_id, alert_type, timestamp, status, audio_system_id):
         alert = Alert.query.get(alerts_id)
         if alert:
@@ -29,6 +33,7 @@ class AlertDAO:
         return alert
 
     @staticmethod
+    @invalidates(Alert, cascade=True)
     def delete_alert(alerts_id):
         alert = Alert.query.get(alerts_id)
         if alert:
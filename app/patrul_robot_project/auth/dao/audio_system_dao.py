@@ -1,5 +1,18 @@
 from auth.domain.models import db
 from auth.domain.audio_system import AudioSystem
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.pagination import keyset_page
+from auth.dao.row_serializer import RowPlan
+
+# Колонки audio_system для /robots/<id>/full
+AUDIO_SYSTEM_ROWS = RowPlan(
+    ('id', AudioSystem.audio_system_id),
+    ('has_speaker', AudioSystem.has_speaker),
+    ('has_microphone', AudioSystem.has_microphone),
+    ('has_panic_button', AudioSystem.has_panic_button),
+    ('robot_id', AudioSystem.robot_id)
+)
+
 
 class AudioSystemDAO:
     @staticmethod
@@ -10,14 +23,16 @@ class AudioSystemDAO:
         return new_audio_system
 
     @staticmethod
+    @cached_get(AudioSystem)
     def get_audio_system(audio_system_id):
         return AudioSystem.query.get(audio_system_id)
 
     @staticmethod
-    def get_all_audio_systems():
-        return AudioSystem.query.all()
+    def get_all_audio_systems(limit=None, after=None):
+        return keyset_page(AudioSystem.query, AudioSystem.audio_system_id, limit, after)
 
     @staticmethod
+    @invalidates(AudioSystem)
     def update_audio_system(audio_system_id, has_speaker, has_microphone, has_panic_button, robot_id):
         audio_system = AudioSystem.query.get(audio_system_id)
         if audio_system:
@@ -29,6 +44,7 @@ class AudioSystemDAO:
         return audio_system
 
     @staticmethod
+    @invalidates(AudioSystem, cascade=True)
     def delete_audio_system(audio_system_id):
         audio_system = AudioSystem.query.get(audio_system_id)
         if audio_system:
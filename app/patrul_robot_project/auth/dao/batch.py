@@ -0,0 +1,296 @@
+from decimal import Decimal
+
+from sqlalchemy import and_, delete, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
+
+from auth.domain.models import db
+from auth.dao.change_tracker import change_tracker
+from auth.dao.entity_cache import entity_cache
+from auth.dao.list_query import FilterError, parse_value
+from auth.dao.row_serializer import IN_CHUNK_SIZE
+
+MAX_BATCH_ITEMS = 1000
+OPERATIONS = ('create', 'update', 'delete')
+
+
+class WriteError(ValueError):
+    """Зміну не можна застосувати: невалідний формат або значення."""
+
+
+class WriteConflictError(WriteError):
+    """База відхилила зміну (зовнішній ключ тощо); транзакцію відкочено."""
+
+
+class StaleVersionError(WriteError):
+    """Версія запису не та, що надіслав клієнт (If-Match): запис змінили після читання."""
+
+
+def _chunks(items, size=IN_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _matched(model, pk_column, pk, versions):
+    # WHERE для запису: ключ і, якщо клієнт надіслав If-Match, одна з його версій
+    if versions is None:
+        return pk_column == pk
+    return and_(pk_column == pk, model.version.in_(versions))
+
+
+def _check_stale(pk_column, pk, versions):
+    # Рядків 0: SELECT лише тут, щоб відрізнити 412 від 404
+    if versions is not None and db.session.execute(select(pk_column).where(pk_column == pk)).first():
+        db.session.rollback()
+        raise StaleVersionError(f'Version mismatch for {pk}: read it again and retry with the new ETag')
+
+
+def update_by_pk(model, pk_column, pk, values, versions=None):
+    """
+    Один UPDATE ... WHERE pk = :pk без попереднього SELECT; True, якщо рядок є.
+
+    Для моделей з version_id_col SET збільшує version, а `versions` (з
+    If-Match) додає `version IN (...)` до WHERE: конфлікт видно з самого
+    UPDATE, без SELECT ... FOR UPDATE. Якщо версія не збіглася —
+    StaleVersionError. Для MySQL rowcount рахує знайдені, а не змінені рядки
+    (SQLAlchemy вмикає CLIENT_FOUND_ROWS), тож оновлення тими самими
+    значеннями не виглядає як 404. Коміт і інвалідація кешу — на боці виклику.
+    """
+    if model.__mapper__.version_id_col is not None:
+        values = {**values, 'version': model.version + 1}
+    result = db.session.execute(
+        update(model).where(_matched(model, pk_column, pk, versions)).values(values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount > 0:
+        change_tracker.record(model, 'update', [pk])
+        return True
+    _check_stale(pk_column, pk, versions)
+    return False
+
+
+def delete_by_pk(model, pk_column, pk, versions=None):
+    """
+    Один DELETE ... WHERE pk = :pk; True, якщо рядок був.
+
+    Залежні записи прибирає ON DELETE CASCADE у базі, тож ORM не вантажить
+    колекції, щоб видаляти дітей поштучно. `versions` — як в update_by_pk.
+    Коміт і інвалідація кешу — на боці виклику.
+    """
+    condition = _matched(model, pk_column, pk, versions)
+    change_tracker.record_deletes(pk_column.table, condition)
+    result = db.session.execute(
+        delete(model).where(condition).execution_options(synchronize_session=False)
+    )
+    if result.rowcount > 0:
+        return True
+    _check_stale(pk_column, pk, versions)
+    return False
+
+
+def _check_json_type(key, column, value):
+    """
+    JSON-значення, що не рядок, має відповідати типу колонки; рядки розбирає parse_value.
+
+    Інакше масив чи об'єкт падає в драйвері вже під час INSERT/UPDATE (500),
+    а 1.5 чи true мовчки зберігаються в цілу колонку.
+    """
+    if isinstance(value, str):
+        return
+    python_type = column.type.python_type
+    if python_type is int:
+        expected, valid = 'an integer', isinstance(value, int) and not isinstance(value, bool)
+    elif python_type in (float, Decimal):
+        expected, valid = 'a number', isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        expected, valid = 'a string', False
+    if not valid:
+        raise WriteError(f'{key} must be {expected}')
+
+
+class BatchWriter:
+    """
+    Запис одного ресурсу: змішаний пакет create/update/delete в одній
+    транзакції і PATCH одного запису одним UPDATE.
+
+    Спершу перевіряються всі елементи: op, id, поля й типи значень, наявність
+    записів для update/delete та їхніх версій (один IN-запит на порцію
+    ключів). Якщо хоч один елемент невалідний, нічого не виконується. Інакше
+    створення йдуть одним flush (insertmanyvalues, де діалект вміє RETURNING),
+    оновлення — ORM bulk UPDATE за первинним ключем і версією, видалення —
+    DELETE ... WHERE (ключ, версія) IN, і все одним комітом. Якщо запис
+    змінили між перевіркою й записом, пакет відкочується зі StaleVersionError.
+    Поля в `data` називаються так само, як атрибути моделі.
+    """
+
+    def __init__(self, model, pk_column, fields):
+        self.model = model
+        self.pk_column = pk_column
+        self.fields = {field: getattr(model, field) for field in fields}
+
+    def apply(self, operations):
+        """Повертає (результати по елементах, чи застосовано пакет)."""
+        if not isinstance(operations, list) or not operations:
+            raise WriteError('operations must be a non-empty list')
+        if len(operations) > MAX_BATCH_ITEMS:
+            raise WriteError(f'At most {MAX_BATCH_ITEMS} operations per batch, got {len(operations)}')
+
+        results = [self._validate(index, operation) for index, operation in enumerate(operations)]
+        self._check_targets(results)
+        if any('error' in result for result in results):
+            for result in results:
+                if 'error' not in result:
+                    result.update(status=424, error='Batch not applied')
+                result.pop('values', None)
+            return results, False
+
+        self._execute(results)
+        for result in results:
+            result.pop('values', None)
+        return results, True
+
+    def _validate(self, index, operation):
+        result = {'index': index}
+        if not isinstance(operation, dict):
+            return {**result, 'status': 400, 'error': 'Operation must be an object'}
+        op = operation.get('op')
+        result['op'] = op
+        if op not in OPERATIONS:
+            return {**result, 'status': 400, 'error': f"op must be one of: {', '.join(OPERATIONS)}"}
+
+        if op != 'create':
+            pk = operation.get('id')
+            if isinstance(pk, bool) or not isinstance(pk, int):
+                return {**result, 'status': 400, 'error': 'id must be an integer'}
+            result['id'] = pk
+            # Аналог If-Match для елемента пакета: версія, прочитана клієнтом
+            version = operation.get('version')
+            if isinstance(version, bool) or not isinstance(version, int):
+                return {**result, 'status': 400, 'error': 'version must be an integer (the ETag from GET)'}
+            result['version'] = version
+        if op == 'delete':
+            return result
+
+        try:
+            result['values'] = self.parse(operation.get('data'), partial=op == 'update')
+        except WriteError as error:
+            return {**result, 'status': 400, 'error': str(error)}
+        return result
+
+    def parse(self, data, partial=False):
+        """
+        Перевіряє `data` і зводить значення до типів колонок.
+
+        `partial` (update, PATCH) дозволяє будь-яку непорожню підмножину полів,
+        інакше (create) потрібні всі.
+        """
+        if not isinstance(data, dict) or not data:
+            raise WriteError('data must be a non-empty object')
+        unknown = [key for key in data if key not in self.fields]
+        if unknown:
+            raise WriteError(f"Unknown fields: {', '.join(unknown)}")
+        if not partial:
+            missing = [field for field in self.fields if data.get(field) is None]
+            if missing:
+                raise WriteError(f"Missing required fields: {', '.join(missing)}")
+        values = {}
+        for key, value in data.items():
+            if value is None:
+                raise WriteError(f'{key} cannot be null')
+            _check_json_type(key, self.fields[key], value)
+            try:
+                values[key] = parse_value(key, self.fields[key], value)
+            except FilterError as error:
+                raise WriteError(str(error)) from None
+        return values
+
+    def patch(self, pk, data, versions=None):
+        """PATCH: лише передані поля одним UPDATE за ключем і версією; False, якщо запису немає."""
+        values = self.parse(data, partial=True)
+        try:
+            found = update_by_pk(self.model, self.pk_column, pk, values, versions)
+            db.session.commit()
+        except IntegrityError as error:
+            db.session.rollback()
+            raise WriteConflictError(f'Update rolled back: {error.orig}') from None
+        except StaleVersionError:
+            db.session.rollback()
+            raise
+        finally:
+            entity_cache.invalidate(self.model, pk)
+        return found
+
+    def _check_targets(self, results):
+        targets = {}
+        for result in results:
+            if 'id' not in result or 'error' in result:
+                continue
+            if result['id'] in targets:
+                result.update(status=400, error=f"id {result['id']} appears more than once in the batch")
+                continue
+            targets[result['id']] = result
+
+        existing = {}
+        for chunk in _chunks(list(targets)):
+            existing.update(db.session.execute(
+                select(self.pk_column, self.model.version).where(self.pk_column.in_(chunk))
+            ).all())
+        for pk, result in targets.items():
+            if pk not in existing:
+                result.update(status=404, error='Not found')
+            elif existing[pk] != result['version']:
+                result.update(status=412, error=f'Version mismatch: current version is {existing[pk]}')
+
+    def _execute(self, results):
+        creates = [result for result in results if result['op'] == 'create']
+        updates = [result for result in results if result['op'] == 'update']
+        deletes = [result for result in results if result['op'] == 'delete']
+        pk_key = self.pk_column.key
+        cascaded = []
+        try:
+            instances = [self.model(**result['values']) for result in creates]
+            db.session.add_all(instances)
+            db.session.flush()
+            # Ключі беруться до коміту: після нього expire_on_commit коштував би SELECT на кожен екземпляр
+            created = [getattr(instance, pk_key) for instance in instances]
+            if updates:
+                # З version у кожному елементі ORM сам пише SET version = :v + 1 WHERE ... AND version = :v
+                db.session.execute(update(self.model), [
+                    {pk_key: result['id'], 'version': result['version'], **result['values']} for result in updates
+                ])
+                change_tracker.record(self.model, 'update', [result['id'] for result in updates])
+            for chunk in _chunks(deletes):
+                condition = tuple_(self.pk_column, self.model.version).in_(
+                    [(result['id'], result['version']) for result in chunk]
+                )
+                # Залежні записи прибирає ON DELETE CASCADE у схемі бази; журнал змін і ключі кешу — до DELETE
+                change_tracker.record_deletes(self.pk_column.table, condition)
+                cascaded.extend(entity_cache.cascade_keys(
+                    self.pk_column.table, self.pk_column.in_([result['id'] for result in chunk])
+                ))
+                deleted = db.session.execute(
+                    delete(self.model).where(condition).execution_options(synchronize_session=False)
+                ).rowcount
+                if deleted != len(chunk):
+                    raise StaleVersionError('Batch rolled back: a record was changed or deleted concurrently')
+            db.session.commit()
+        except IntegrityError as error:
+            db.session.rollback()
+            raise WriteConflictError(f'Batch rolled back: {error.orig}') from None
+        except StaleDataError:
+            db.session.rollback()
+            raise StaleVersionError('Batch rolled back: a record was changed or deleted concurrently') from None
+        except StaleVersionError:
+            db.session.rollback()
+            raise
+        finally:
+            for result in updates + deletes:
+                entity_cache.invalidate(self.model, result['id'])
+            entity_cache.invalidate_keys(cascaded)
+
+        for result, pk in zip(creates, created):
+            result.update(status=201, id=pk, version=1)
+        for result in updates:
+            result.update(status=200, version=result['version'] + 1)
+        for result in deletes:
+            result['status'] = 200
@@ -1,23 +1,68 @@
+import re
+
+from sqlalchemy import insert
 from auth.domain.models import db
 from auth.domain.battery import Battery
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.pagination import keyset_page
+from auth.dao.row_serializer import RowPlan
+from auth.dao.telemetry_rollup_dao import TelemetryRollupDAO
+
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+
+def _temperature_value(temperature):
+    # Температура зберігається рядком на кшталт '35.5°C'
+    match = _NUMBER.search(str(temperature))
+    return float(match.group()) if match else None
+
+
+def _record_rollups(readings):
+    TelemetryRollupDAO.record('battery_level', [
+        (r['robot_id'], r['log_time'], r['battery_level']) for r in readings
+    ])
+    temperatures = [(r['robot_id'], r['log_time'], _temperature_value(r['temperature'])) for r in readings]
+    TelemetryRollupDAO.record('temperature', [t for t in temperatures if t[2] is not None])
+
+
+# Колонки battery для latest_battery у /robots/<id>/full
+BATTERY_ROWS = RowPlan(
+    ('id', Battery.battery_id),
+    ('log_time', Battery.log_time),
+    ('battery_level', Battery.battery_level),
+    ('robot_id', Battery.robot_id),
+    ('temperature', Battery.temperature)
+)
+
 
 class BatteryDAO:
     @staticmethod
     def add_battery(log_time, battery_level, robot_id, temperature):
         new_battery = Battery(log_time=log_time, battery_level=battery_level, robot_id=robot_id, temperature=temperature)
         db.session.add(new_battery)
+        _record_rollups([{'log_time': log_time, 'battery_level': battery_level, 'robot_id': robot_id, 'temperature': temperature}])
         db.session.commit()
         return new_battery
 
     @staticmethod
+    def add_batteries(readings):
+        # Один executemany (багаторядковий INSERT) і один коміт на всю пачку разом з агрегатами
+        db.session.execute(insert(Battery), readings)
+        _record_rollups(readings)
+        db.session.commit()
+        return len(readings)
+
+    @staticmethod
+    @cached_get(Battery)
     def get_battery(battery_id):
         return Battery.query.get(battery_id)
 
     @staticmethod
-    def get_all_batteries():
-        return Battery.query.all()
+    def get_all_batteries(limit=None, after=None):
+        return keyset_page(Battery.query, Battery.battery_id, limit, after)
 
     @staticmethod
+    @invalidates(Battery)
     def update_battery(battery_id, log_time, battery_level, robot_id, temperature):
         battery = Battery.query.get(battery_id)
         if battery:
@@ -29,6 +74,7 @@ class BatteryDAO:
         return battery
 
     @staticmethod
+    @invalidates(Battery, cascade=True)
     def delete_battery(battery_id):
         battery = Battery.query.get(battery_id)
         if battery:
@@ -1,5 +1,34 @@
 from auth.domain.models import db
 from auth.domain.camera import Camera
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.pagination import keyset_rows
+from auth.dao.row_serializer import RowPlan, get_row, get_rows
+from auth.dao.streaming import stream_rows
+
+# Колонки cameras для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+CAMERA_ROWS = RowPlan(
+    ('id', Camera.camera_id),
+    ('robot_id', Camera.robot_id),
+    ('resolution', Camera.resolution),
+    ('zoom_level', Camera.zoom_level),
+    ('status', Camera.status),
+    ('night_vision', Camera.night_vision),
+    ('panoramic_view', Camera.panoramic_view),
+    ('version', Camera.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+CAMERA_FILTERS = ListFilters(
+    CAMERA_ROWS, Camera.camera_id,
+    filterable=('robot_id', 'resolution', 'zoom_level', 'status', 'night_vision', 'panoramic_view'),
+    indexed=('robot_id',),
+    sortable=('robot_id',)
+)
+# POST /cameras/batch і PATCH /cameras/<id>: поля ті самі, що в add_camera
+CAMERA_BATCH = BatchWriter(Camera, Camera.camera_id, ('robot_id', 'resolution', 'zoom_level', 'status', 'night_vision', 'panoramic_view'))
+
 
 class CameraDAO:
     @staticmethod
@@ -10,30 +39,59 @@ class CameraDAO:
         return new_camera
 
     @staticmethod
+    def apply_camera_batch(operations):
+        return CAMERA_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(Camera)
     def get_camera(camera_id):
         return Camera.query.get(camera_id)
 
     @staticmethod
-    def get_all_cameras():
-        return Camera.query.all()
+    def get_camera_fields(camera_id, fields):
+        return get_row(CAMERA_ROWS.only(fields), Camera.camera_id, camera_id)
+
+    @staticmethod
+    def get_cameras_by_ids(ids, fields=None):
+        return get_rows(CAMERA_ROWS.only(fields), Camera.camera_id, ids)
+
+    @staticmethod
+    def get_all_cameras(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = CAMERA_FILTERS.compile(filters, sort)
+        return keyset_rows(CAMERA_ROWS.only(fields), Camera.camera_id, limit, after, query)
 
     @staticmethod
-    def update_camera(camera_id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view):
-        camera = Camera.query.get(camera_id)
-        if camera:
-            camera.robot_id = robot_id
-            camera.resolution = resolution
-            camera.zoom_level = zoom_level
-            camera.status = status
-            camera.night_vision = night_vision
-            camera.panoramic_view = panoramic_view
-            db.session.commit()
-        return camera
+    def stream_all_cameras(fields=None, filters=None, sort=None):
+        query = CAMERA_FILTERS.compile(filters, sort)
+        return stream_rows(CAMERA_ROWS.only(fields), Camera.camera_id, query=query)
+
+    @staticmethod
+    def patch_camera(camera_id, data, versions=None):
+        return CAMERA_BATCH.patch(camera_id, data, versions)
+
+    @staticmethod
+    @invalidates(Camera)
+    def update_camera(camera_id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(Camera, Camera.camera_id, camera_id, {
+            'robot_id': robot_id,
+            'resolution': resolution,
+            'zoom_level': zoom_level,
+            'status': status,
+            'night_vision': night_vision,
+            'panoramic_view': panoramic_view
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(Camera, cascade=True)
+    def delete_camera(camera_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(Camera, Camera.camera_id, camera_id, versions)
+        db.session.commit()
+        return deleted
 
     @staticmethod
-    def delete_camera(camera_id):
-        camera = Camera.query.get(camera_id)
-        if camera:
-            db.session.delete(camera)
-            db.session.commit()
-        return camera
+    def preview_camera_delete(camera_id):
+        return cascade_counts(Camera.camera_id, camera_id)
@@ -0,0 +1,51 @@
+from sqlalchemy import func, or_, select
+
+from auth.domain.models import db
+
+
+def _cascade_children(table):
+    # (дочірня таблиця, колонка FK, колонка батька) для зв'язків з ON DELETE CASCADE
+    return [
+        (child, fk.parent, fk.column)
+        for child in db.metadata.sorted_tables
+        for fk in child.foreign_keys
+        if fk.column.table is table and (fk.ondelete or '').upper() == 'CASCADE'
+    ]
+
+
+def cascade_scope(table, condition):
+    """
+    (таблиця, WHERE) для рядків `table` за умовою `condition` і для кожної
+    таблиці, куди з них дійде ON DELETE CASCADE.
+
+    Граф зв'язків береться з метаданих моделей. Таблиці йдуть у топологічному
+    порядку, тож до моменту видачі таблиці вже відомі всі шляхи до неї
+    (ідентифікація досяжна і через сенсор, і через камеру, і через звіт), і
+    умова покриває кожен рядок один раз. Умови дітей — вкладені IN по
+    зовнішніх ключах; SQL тут не виконується.
+    """
+    conditions = {table: [condition]}
+    for current in db.metadata.sorted_tables:
+        if current not in conditions:
+            continue
+        where = or_(*conditions[current])
+        yield current, where
+        for child, fk_column, parent_column in _cascade_children(current):
+            conditions.setdefault(child, []).append(fk_column.in_(select(parent_column).where(where)))
+
+
+def cascade_counts(pk_column, pk):
+    """
+    Скільки рядків у кожній таблиці прибере DELETE запису `pk` разом з ON DELETE CASCADE.
+
+    Один SELECT COUNT(*) на таблицю з cascade_scope; самі рядки не
+    завантажуються. Повертає {таблиця: кількість}, порожній dict, якщо запису
+    немає.
+    """
+    counts = {}
+    for table, where in cascade_scope(pk_column.table, pk_column == pk):
+        count = db.session.execute(select(func.count()).select_from(table).where(where)).scalar_one()
+        if table is pk_column.table and not count:
+            return {}
+        counts[table.name] = count
+    return counts
@@ -0,0 +1,122 @@
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.exc import IntegrityError
+
+from auth.domain.models import db, ChangeLog
+from auth.domain.camera import Camera
+from auth.domain.charging_station import ChargingStation
+from auth.domain.operator import Operator
+from auth.domain.robot import Robot
+from auth.domain.sensor import Sensor
+from auth.dao.camera_dao import CAMERA_ROWS
+from auth.dao.charging_station_dao import STATION_ROWS
+from auth.dao.list_query import FilterError
+from auth.dao.operator_dao import OPERATOR_ROWS
+from auth.dao.pagination import clamp_limit
+from auth.dao.robot_dao import ROBOT_ROWS
+from auth.dao.row_serializer import get_rows
+from auth.dao.sensor_dao import SENSOR_ROWS
+
+# Поточний стан записів у стрічці — ті самі ключі, що й у списках ресурсів
+CHANGE_FEED_PLANS = {
+    'robot': (ROBOT_ROWS, Robot.robot_id),
+    'sensor': (SENSOR_ROWS, Sensor.sensor_id),
+    'camera': (CAMERA_ROWS, Camera.camera_id),
+    'operator': (OPERATOR_ROWS, Operator.operators_id),
+    'charging_station': (STATION_ROWS, ChargingStation.station_id),
+}
+
+
+# Скільки нових рядків журналу нумерується за один запит до стрічки
+SEQUENCE_BATCH = 5000
+
+
+def _assign_sequence():
+    """
+    Дає sequence закомітченим рядкам журналу, що його ще не мають; True,
+    якщо після цього ненумеровані ще лишились.
+
+    version видається при вставці, і транзакція з меншою version може
+    закомітитись пізніше за більшу — клієнт, що вже пішов далі, пропустив
+    би її. sequence ж ставиться лише рядкам, які вже видно, тобто
+    закомітченим, і завжди після всіх виданих раніше номерів, тож пізній
+    коміт потрапляє в стрічку після того, що клієнт уже прочитав. Два
+    читачі, що нумерують одночасно, зіткнуться на унікальному індексі або
+    на `sequence IS NULL`; той, що програв, відкочується й віддає те, що
+    вже пронумеровано.
+    """
+    pending = db.session.execute(
+        select(ChangeLog.version).where(ChangeLog.sequence.is_(None))
+        .order_by(ChangeLog.version).limit(SEQUENCE_BATCH + 1)
+    ).scalars().all()
+    if not pending:
+        return False
+    last = db.session.execute(select(func.max(ChangeLog.sequence))).scalar() or 0
+    table = ChangeLog.__table__
+    batch = pending[:SEQUENCE_BATCH]
+    try:
+        stamped = db.session.execute(
+            update(table).where(table.c.version == bindparam('pk'), table.c.sequence.is_(None)),
+            [{'pk': pk, 'sequence': last + offset} for offset, pk in enumerate(batch, 1)]
+        ).rowcount
+        if stamped != len(batch):
+            db.session.rollback()
+            return False
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return False
+    return len(pending) > SEQUENCE_BATCH
+
+
+class ChangeFeedDAO:
+
+    @staticmethod
+    def get_current_version():
+        """Остання видана версія (sequence): з неї клієнт починає після повного завантаження."""
+        _assign_sequence()
+        return db.session.execute(select(func.max(ChangeLog.sequence))).scalar() or 0
+
+    @staticmethod
+    def get_changes(since, limit=None, entities=None):
+        """
+        Зміни з версією (sequence) більшою за `since`: діапазон унікального
+        індексу з LIMIT, тож вартість сторінки не залежить від довжини журналу.
+        Спершу нумеруються нові закомітчені рядки (_assign_sequence).
+
+        Для вставок і змін додається поточний стан запису (один IN-запит на
+        тип сутності на сторінці); null, якщо запис уже видалено — його
+        видалення прийде далі в стрічці. Повертає (записи, next_since, has_more).
+        """
+        limit = clamp_limit(limit)
+        stmt = select(ChangeLog.sequence, ChangeLog.entity, ChangeLog.entity_id, ChangeLog.op, ChangeLog.changed_at)
+        stmt = stmt.where(ChangeLog.sequence > since)
+        if entities:
+            unknown = [entity for entity in entities if entity not in CHANGE_FEED_PLANS]
+            if unknown:
+                raise FilterError(f"Unknown entities: {', '.join(unknown)}. Allowed: {', '.join(CHANGE_FEED_PLANS)}")
+            stmt = stmt.where(ChangeLog.entity.in_(entities))
+        unnumbered = _assign_sequence()
+        rows = db.session.execute(stmt.order_by(ChangeLog.sequence).limit(limit + 1)).all()
+        has_more = len(rows) > limit or unnumbered
+        rows = rows[:limit]
+
+        changed = {}
+        for row in rows:
+            if row.op != 'delete':
+                changed.setdefault(row.entity, []).append(row.entity_id)
+        current = {}
+        for entity, ids in changed.items():
+            plan, pk_column = CHANGE_FEED_PLANS[entity]
+            pk_key = plan.keys[plan.index(pk_column)]
+            items, _ = get_rows(plan, pk_column, ids)
+            current[entity] = {item[pk_key]: item for item in items}
+
+        items = [{
+            'version': row.sequence,
+            'entity': row.entity,
+            'id': row.entity_id,
+            'op': row.op,
+            'changed_at': row.changed_at,
+            'data': current.get(row.entity, {}).get(row.entity_id)
+        } for row in rows]
+        return items, rows[-1].sequence if rows else since, has_more
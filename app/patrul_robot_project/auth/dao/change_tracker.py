@@ -0,0 +1,81 @@
+from datetime import datetime
+
+from sqlalchemy import event, insert, inspect, literal, select
+from sqlalchemy.orm import Session
+
+from auth.domain.models import db, ChangeLog
+from auth.dao.cascade import cascade_scope
+
+# Таблиці, зміни яких віддає GET /changes
+TRACKED_TABLES = frozenset({'robot', 'sensor', 'camera', 'operator', 'charging_station'})
+
+
+class ChangeTracker:
+    """
+    Журнал змін для GET /changes: рядок change_log на кожну вставку, зміну чи
+    видалення відстежуваного запису, у тій самій транзакції, що й сама зміна.
+
+    Записи через ORM (add, зміна атрибутів, session.delete) ловлять події
+    сесії. Core-шляхи без unit of work (update_by_pk, delete_by_pk, пакети)
+    викликають record і record_deletes самі. Видалення пишуться до DELETE через
+    INSERT ... SELECT по графу ON DELETE CASCADE, тож роботи видаленої станції
+    та їхні сенсори й камери теж потрапляють у журнал — без читання рядків у
+    Python.
+    """
+
+    def init_app(self, app):
+        event.listen(Session, 'before_flush', self._before_flush)
+        event.listen(Session, 'after_flush', self._after_flush)
+
+    @staticmethod
+    def record(model, op, ids, connection=None):
+        """Рядки журналу для `ids` однієї моделі; моделі поза TRACKED_TABLES пропускаються."""
+        if model.__tablename__ not in TRACKED_TABLES or not ids:
+            return
+        changed_at = datetime.utcnow()
+        (connection or db.session.connection()).execute(insert(ChangeLog.__table__), [
+            {'entity': model.__tablename__, 'entity_id': pk, 'op': op, 'changed_at': changed_at}
+            for pk in ids
+        ])
+
+    @staticmethod
+    def record_deletes(table, condition, connection=None):
+        """Видалення рядків `table` за `condition` і всього, що прибере ON DELETE CASCADE; викликати до DELETE."""
+        connection = connection or db.session.connection()
+        changed_at = datetime.utcnow()
+        for scoped, where in cascade_scope(table, condition):
+            if scoped.name not in TRACKED_TABLES:
+                continue
+            pk = scoped.primary_key.columns.values()[0]
+            connection.execute(insert(ChangeLog.__table__).from_select(
+                ['entity', 'entity_id', 'op', 'changed_at'],
+                select(literal(scoped.name), pk, literal('delete'), literal(changed_at, ChangeLog.changed_at.type))
+                .where(where)
+            ))
+
+    @staticmethod
+    def _tracked(instances):
+        for instance in instances:
+            state = inspect(instance)
+            if state.mapper.local_table.name in TRACKED_TABLES:
+                yield state
+
+    def _before_flush(self, session, flush_context, instances):
+        # Після flush рядків уже немає, а INSERT ... SELECT має знайти каскадних дітей
+        for state in self._tracked(session.deleted):
+            pk_column = state.mapper.primary_key[0]
+            self.record_deletes(pk_column.table, pk_column == state.identity[0], session.connection())
+
+    def _after_flush(self, session, flush_context):
+        # Тут session.new і session.dirty ще показують стан до flush, а ключі нових рядків уже відомі
+        changes = {}
+        for state in self._tracked(session.new):
+            changes.setdefault((state.class_, 'insert'), []).append(state.mapper.primary_key_from_instance(state.obj())[0])
+        for state in self._tracked(session.dirty):
+            if session.is_modified(state.obj(), include_collections=False):
+                changes.setdefault((state.class_, 'update'), []).append(state.identity[0])
+        for (model, op), ids in changes.items():
+            self.record(model, op, ids, session.connection())
+
+
+change_tracker = ChangeTracker()
@@ -1,5 +1,29 @@
 from auth.domain.models import db
 from auth.domain.charging_station import ChargingStation
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.pagination import keyset_page, keyset_rows
+from auth.dao.row_serializer import RowPlan, get_row, get_rows
+from auth.dao.streaming import stream_rows
+
+# Колонки stations для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+STATION_ROWS = RowPlan(
+    ('id', ChargingStation.station_id),
+    ('location', ChargingStation.location),
+    ('capacity', ChargingStation.capacity),
+    ('available', ChargingStation.available),
+    ('version', ChargingStation.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+STATION_FILTERS = ListFilters(
+    STATION_ROWS, ChargingStation.station_id,
+    filterable=('location', 'capacity', 'available')
+)
+# POST /charging_stations/batch і PATCH /charging_stations/<id>: поля ті самі, що в add_station
+STATION_BATCH = BatchWriter(ChargingStation, ChargingStation.station_id, ('location', 'capacity', 'available'))
+
 
 class ChargingStationDAO:
     @staticmethod
@@ -10,31 +34,61 @@ class ChargingStationDAO:
         return new_station
 
     @staticmethod
+    def apply_station_batch(operations):
+        return STATION_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(ChargingStation)
     def get_station(station_id):
         return ChargingStation.query.get(station_id)
 
     @staticmethod
-    def get_all_stations():
-        return ChargingStation.query.all()
+    def get_station_fields(station_id, fields):
+        return get_row(STATION_ROWS.only(fields), ChargingStation.station_id, station_id)
+
+    @staticmethod
+    def get_stations_by_ids(ids, fields=None):
+        return get_rows(STATION_ROWS.only(fields), ChargingStation.station_id, ids)
+
+    @staticmethod
+    def get_all_stations(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = STATION_FILTERS.compile(filters, sort)
+        return keyset_rows(STATION_ROWS.only(fields), ChargingStation.station_id, limit, after, query)
 
     @staticmethod
-    def update_station(station_id, location, capacity, available):
-        station = ChargingStation.query.get(station_id)
-        if station:
-            station.location = location
-            station.capacity = capacity
-            station.available = available
-            db.session.commit()
-        return station
+    def stream_all_stations(fields=None, filters=None, sort=None):
+        query = STATION_FILTERS.compile(filters, sort)
+        return stream_rows(STATION_ROWS.only(fields), ChargingStation.station_id, query=query)
+
+    @staticmethod
+    def patch_station(station_id, data, versions=None):
+        return STATION_BATCH.patch(station_id, data, versions)
+
+    @staticmethod
+    @invalidates(ChargingStation)
+    def update_station(station_id, location, capacity, available, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(ChargingStation, ChargingStation.station_id, station_id, {
+            'location': location,
+            'capacity': capacity,
+            'available': available
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(ChargingStation, cascade=True)
+    def delete_station(station_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(ChargingStation, ChargingStation.station_id, station_id, versions)
+        db.session.commit()
+        return deleted
 
     @staticmethod
-    def delete_station(station_id):
-        station = ChargingStation.query.get(station_id)
-        if station:
-            db.session.delete(station)
-            db.session.commit()
-        return station
+    def preview_station_delete(station_id):
+        return cascade_counts(ChargingStation.station_id, station_id)
 
     @staticmethod
-    def get_all_stations_with_robots():
-        return ChargingStation.query.options(db.joinedload(ChargingStation.robots)).all()
\ No newline at end of file
+    def get_all_stations_with_robots(limit=None, after=None):
+        return keyset_page(ChargingStation.query.options(db.joinedload(ChargingStation.robots)),
+                           ChargingStation.station_id, limit, after)
\ No newline at end of file
@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+
+from sqlalchemy.pool import QueuePool
+
+from auth.domain.models import db
+
+# Верхні межі бакетів гістограми очікування, мс
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class WaitHistogram:
+    def __init__(self, buckets=WAIT_BUCKETS_MS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._total = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms):
+        index = next((i for i, bound in enumerate(self.buckets) if value_ms <= bound), len(self.buckets))
+        with self._lock:
+            self._counts[index] += 1
+            self._total += value_ms
+            self._max = max(self._max, value_ms)
+
+    def snapshot(self):
+        with self._lock:
+            count = sum(self._counts)
+            bounds = list(self.buckets) + ['inf']
+            return {
+                'count': count,
+                'avg_ms': self._total / count if count else 0.0,
+                'max_ms': self._max,
+                'buckets': [{'le_ms': bound, 'count': n} for bound, n in zip(bounds, self._counts)]
+            }
+
+
+class TimedQueuePool(QueuePool):
+    """
+    QueuePool, що записує час очікування кожного checkout у гістограму.
+
+    Налаштований max_overflow зберігається тут: у QueuePool публічного
+    доступу до нього немає, лише приватний _max_overflow.
+    """
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, **kwargs):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.wait_histogram = WaitHistogram()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_histogram.observe((time.perf_counter() - started) * 1000)
+
+
+class DbPoolMonitor:
+    def __init__(self):
+        self._engines = []
+
+    def init_app(self, app):
+        with app.app_context():
+            self._engines = list(db.engines.values())
+        # Дочірній процес (gunicorn --preload, multiprocessing) не повинен
+        # користуватися сокетами батьківського пулу: відкидаємо їх без закриття
+        os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def _reset_after_fork(self):
+        for engine in self._engines:
+            engine.dispose(close=False)
+
+    def stats(self):
+        result = {}
+        for engine in self._engines:
+            pool = engine.pool
+            stats = {'pool_class': type(pool).__name__}
+            if isinstance(pool, QueuePool):
+                stats.update({
+                    'size': pool.size(),
+                    'checked_out': pool.checkedout(),
+                    'idle': pool.checkedin(),
+                    'overflow': max(pool.overflow(), 0),
+                    'timeout': pool.timeout()
+                })
+            if isinstance(pool, TimedQueuePool):
+                stats['max_overflow'] = pool.max_overflow
+                stats['checkout_wait'] = pool.wait_histogram.snapshot()
+            result[engine.url.render_as_string(hide_password=True)] = stats
+        return result
+
+
+db_pool_monitor = DbPoolMonitor()
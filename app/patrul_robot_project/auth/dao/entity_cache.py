@@ -0,0 +1,198 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import make_transient_to_detached
+
+from auth.dao.cascade import cascade_scope
+from auth.domain.models import db
+
+
+class LRUTTLCache:
+    """Кеш процесу з витісненням LRU, TTL і лімітами на кількість записів та байти."""
+
+    def __init__(self, max_entries=10000, max_bytes=32 * 1024 * 1024, ttl=5.0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self._data),
+                'bytes': self._bytes
+            }
+
+    def _remove(self, key):
+        self._bytes -= self._data.pop(key)[1]
+
+
+class EntityCache:
+    """
+    Read-through кеш для get_* методів DAO.
+
+    Зберігаються лише значення колонок; при влучанні з них будується
+    detached-екземпляр і приєднується до поточної сесії через merge(load=False),
+    тож SQL не надсилається, а lazy-зв'язки працюють як звичайно.
+    Бекенд замінюється через use() — достатньо методів get/set/delete/clear/stats.
+
+    Типовий LRUTTLCache живе в пам'яті процесу: зміну, зроблену одним
+    воркером Gunicorn, інші воркери побачать лише після TTL. Тому кеш
+    вимкнений за замовчуванням; вмикати його варто з одним воркером, з TTL,
+    який клієнти готові терпіти, або зі спільним бекендом.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.backend = LRUTTLCache()
+        # Таблиці, чиї get_* закешовані через cached_get: {назва таблиці: модель}
+        self.models = {}
+
+    def init_app(self, app):
+        self.enabled = app.config.get('ENTITY_CACHE_ENABLED', False)
+        self.use(LRUTTLCache(
+            max_entries=app.config.get('ENTITY_CACHE_MAX_ENTRIES', 10000),
+            max_bytes=app.config.get('ENTITY_CACHE_MAX_BYTES', 32 * 1024 * 1024),
+            ttl=app.config.get('ENTITY_CACHE_TTL', 5.0)
+        ))
+
+    def use(self, backend):
+        self.backend = backend
+
+    def invalidate(self, model, pk):
+        self.backend.delete((model.__tablename__, pk))
+
+    def cascade_keys(self, table, condition):
+        """
+        Ключі закешованих рядків, які прибере ON DELETE CASCADE при видаленні
+        рядків `table` за `condition`; викликати до DELETE.
+
+        Один SELECT ключів на кожну закешовану дочірню таблицю з cascade_scope;
+        з вимкненим кешем запитів немає.
+        """
+        if not self.enabled:
+            return []
+        keys = []
+        for scoped, where in cascade_scope(table, condition):
+            if scoped is table or scoped.name not in self.models:
+                continue
+            pk = scoped.primary_key.columns.values()[0]
+            keys.extend((scoped.name, child) for child in db.session.execute(select(pk).where(where)).scalars())
+        return keys
+
+    def invalidate_keys(self, keys):
+        for key in keys:
+            self.backend.delete(key)
+
+    def stats(self):
+        return {'enabled': self.enabled, **self.backend.stats()}
+
+
+entity_cache = EntityCache()
+
+
+def _snapshot(instance):
+    values = {attr.key: getattr(instance, attr.key) for attr in inspect(instance).mapper.column_attrs}
+    size = sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values.values())
+    return values, size
+
+
+def _attach(model, values):
+    instance = model(**values)
+    make_transient_to_detached(instance)
+    return db.session.merge(instance, load=False)
+
+
+def cached_get(model):
+    """Декоратор для get_<entity>(pk): спершу кеш, потім база."""
+    entity_cache.models[model.__tablename__] = model
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(pk):
+            if not entity_cache.enabled:
+                return func(pk)
+            key = (model.__tablename__, pk)
+            values = entity_cache.backend.get(key)
+            if values is not None:
+                return _attach(model, values)
+            instance = func(pk)
+            if instance is not None:
+                entity_cache.backend.set(key, *_snapshot(instance))
+            return instance
+        return wrapper
+    return decorator
+
+
+def invalidates(model, cascade=False):
+    """
+    Декоратор для update_/delete_<entity>(pk, ...): прибирає запис з кешу після зміни.
+
+    cascade=True — для delete_: також прибирає закешованих дітей, яких видалить
+    ON DELETE CASCADE.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(pk, *args, **kwargs):
+            children = []
+            if cascade:
+                pk_column = inspect(model).primary_key[0]
+                children = entity_cache.cascade_keys(pk_column.table, pk_column == pk)
+            try:
+                return func(pk, *args, **kwargs)
+            finally:
+                entity_cache.invalidate(model, pk)
+                entity_cache.invalidate_keys(children)
+        return wrapper
+    return decorator
@@ -0,0 +1,78 @@
+import sys
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from auth.domain.models import db
+from auth.domain.camera import Camera
+from auth.domain.charging_station import ChargingStation
+from auth.domain.robot import Robot
+from auth.domain.sensor import Sensor
+from auth.dao.entity_cache import LRUTTLCache
+
+# Зведення перераховується не частіше, ніж раз на TTL (FLEET_SUMMARY_CACHE_TTL), незалежно від кількості дашбордів
+fleet_summary_cache = LRUTTLCache(max_entries=1, ttl=10.0)
+SUMMARY_KEY = 'fleet_summary'
+
+
+def _counts(column):
+    rows = db.session.execute(select(column, func.count()).group_by(column).order_by(column))
+    return {value: count for value, count in rows}
+
+
+class FleetDAO:
+
+    @staticmethod
+    def get_fleet_summary():
+        """
+        Лічильники парку лише з GROUP BY: жоден рядок роботів, сенсорів чи камер
+        не вантажиться в Python.
+
+        Роботи по статусу × станції йдуть по ix_robot_status_station, станції —
+        LEFT JOIN на індексований robot.station_id, сенсори й камери — по
+        ix_sensor_trigger_status і ix_camera_status. Чотири запити на прорахунок.
+        """
+        if fleet_summary_cache.ttl > 0:
+            summary = fleet_summary_cache.get(SUMMARY_KEY)
+            if summary is not None:
+                return summary
+
+        by_station = {}
+        robots_by_status = {}
+        rows = db.session.execute(
+            select(Robot.status, Robot.station_id, func.count())
+            .group_by(Robot.status, Robot.station_id)
+        )
+        for status, station_id, count in rows:
+            by_station.setdefault(station_id, {})[status] = count
+            robots_by_status[status] = robots_by_status.get(status, 0) + count
+
+        stations = []
+        rows = db.session.execute(
+            select(ChargingStation.station_id, ChargingStation.capacity, func.count(Robot.robot_id))
+            .outerjoin(Robot, Robot.station_id == ChargingStation.station_id)
+            .group_by(ChargingStation.station_id, ChargingStation.capacity)
+            .order_by(ChargingStation.station_id)
+        )
+        for station_id, capacity, robots in rows:
+            stations.append({
+                'id': station_id,
+                'capacity': capacity,
+                'robots': robots,
+                'utilization': round(robots / capacity, 4) if capacity else None,
+                'robots_by_status': by_station.get(station_id, {})
+            })
+
+        summary = {
+            'generated_at': datetime.utcnow(),
+            'robots': {
+                'total': sum(robots_by_status.values()),
+                'by_status': robots_by_status
+            },
+            'stations': stations,
+            'sensors_by_trigger_status': _counts(Sensor.trigger_status),
+            'cameras_by_status': _counts(Camera.status)
+        }
+        if fleet_summary_cache.ttl > 0:
+            fleet_summary_cache.set(SUMMARY_KEY, summary, sys.getsizeof(summary))
+        return summary
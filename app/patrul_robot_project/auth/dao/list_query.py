@@ -0,0 +1,188 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime, time, timezone
+from decimal import Decimal, InvalidOperation
+
+from sqlalchemy import and_, or_
+
+# `?field__op=value`; без суфікса — рівність
+OPERATORS = {
+    'eq': lambda column, value: column == value,
+    'ne': lambda column, value: column != value,
+    'gt': lambda column, value: column > value,
+    'gte': lambda column, value: column >= value,
+    'lt': lambda column, value: column < value,
+    'lte': lambda column, value: column <= value,
+    'in': lambda column, values: column.in_(values),
+}
+# != не звужує діапазон індексу, тож такий фільтр не рятує від повного проходу
+INDEX_OPERATORS = frozenset(OPERATORS) - {'ne'}
+MAX_IN_VALUES = 100
+
+
+class FilterError(ValueError):
+    pass
+
+
+def parse_datetime(raw):
+    """
+    ISO 8601 у naive UTC, як зберігаються DATETIME-колонки: час зі зсувом
+    (Z, +02:00) переводиться в UTC, без зсуву — вважається вже UTC.
+    Не рядок (число з JSON) — TypeError, як у datetime.fromisoformat.
+    """
+    if not isinstance(raw, str):
+        raise TypeError(f'Expected an ISO 8601 string, got {type(raw).__name__}')
+    if raw.endswith(('Z', 'z')):
+        # fromisoformat приймає Z лише з Python 3.11, а образ і CI — на 3.10
+        raw = raw[:-1] + '+00:00'
+    moment = datetime.fromisoformat(raw)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def parse_value(key, column, raw):
+    """Рядок з query string у тип колонки; datetime і time — у форматі ISO."""
+    if not isinstance(raw, str):
+        return raw
+    python_type = column.type.python_type
+    try:
+        if python_type is datetime:
+            return parse_datetime(raw)
+        if python_type is date:
+            return date.fromisoformat(raw)
+        if python_type is time:
+            return time.fromisoformat(raw)
+        if python_type is Decimal:
+            return Decimal(raw)
+        if python_type is int:
+            return int(raw)
+        if python_type is float:
+            return float(raw)
+    except (ValueError, InvalidOperation):
+        raise FilterError(f'Invalid value for {key}: {raw}') from None
+    enums = getattr(column.type, 'enums', None)
+    if enums and raw not in enums:
+        raise FilterError(f"Invalid value for {key}: {raw}. Allowed: {', '.join(enums)}")
+    return raw
+
+
+def _cursor_value(value):
+    # Курсор має повертатися точно, тому ISO з мікросекундами, а не формат відповіді
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+class ListQuery:
+    """
+    Скомпільовані фільтри й сортування списку: WHERE, ORDER BY і keyset-курсор.
+
+    Без сортування курсор — це первинний ключ, як і раніше. Для `sort` по
+    іншій колонці порядок доповнюється ключем, а курсор кодує пару
+    (значення, ключ) останнього рядка.
+    """
+
+    def __init__(self, pk_key, pk_column, where=(), sort_key=None, sort_column=None, descending=False):
+        self.pk_key = pk_key
+        self.pk_column = pk_column
+        self.where = tuple(where)
+        self.sort_key = sort_key if sort_column is not None else pk_key
+        self.sort_column = sort_column if sort_column is not None else pk_column
+        self.descending = descending
+
+    @property
+    def by_pk(self):
+        return self.sort_column is self.pk_column
+
+    def apply(self, stmt, after=None):
+        if self.where:
+            stmt = stmt.where(*self.where)
+        if after is not None:
+            stmt = stmt.where(self._after(after))
+        order = [self.sort_column] if self.by_pk else [self.sort_column, self.pk_column]
+        return stmt.order_by(*(column.desc() if self.descending else column for column in order))
+
+    def _after(self, after):
+        if self.by_pk:
+            try:
+                pk = parse_value(self.pk_key, self.pk_column, after)
+            except FilterError:
+                raise FilterError(f'Invalid cursor: {after}') from None
+            return self.pk_column < pk if self.descending else self.pk_column > pk
+        value, pk = self._decode(after)
+        if self.descending:
+            return or_(self.sort_column < value, and_(self.sort_column == value, self.pk_column < pk))
+        return or_(self.sort_column > value, and_(self.sort_column == value, self.pk_column > pk))
+
+    def cursor(self, sort_value, pk):
+        if self.by_pk:
+            return pk
+        payload = json.dumps([_cursor_value(sort_value), pk], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def _decode(self, after):
+        try:
+            payload = base64.urlsafe_b64decode(after + '=' * (-len(after) % 4))
+            value, pk = json.loads(payload)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise FilterError(f'Invalid cursor: {after}') from None
+        return (parse_value(self.sort_key, self.sort_column, value),
+                parse_value(self.pk_key, self.pk_column, pk))
+
+
+class ListFilters:
+    """
+    Білий список фільтрів і сортувань для списку одного ресурсу.
+
+    Ключі ті самі, що в RowPlan. Сортувати можна лише по індексованих
+    колонках. Для `large` таблиць (ростуть з часом, а не з розміром парку)
+    фільтр лише по неіндексованих колонках відхиляється: LIMIT тут не
+    рятує, бо рідкісне значення змушує пройти всю таблицю.
+    """
+
+    def __init__(self, plan, pk_column, filterable, indexed=(), sortable=(), large=False):
+        self.columns = dict(zip(plan.keys, plan.columns))
+        self.pk_key = plan.keys[plan.index(pk_column)]
+        self.pk_column = pk_column
+        self.filterable = {key: self.columns[key] for key in (self.pk_key, *filterable)}
+        self.indexed = frozenset((self.pk_key, *indexed))
+        self.sortable = (self.pk_key, *sortable)
+        self.large = large
+
+    def compile(self, params=None, sort=None):
+        """`params` — {'accuracy__gte': '0.9'}, `sort` — 'timestamp' або '-timestamp'."""
+        where, uses_index = [], False
+        for name, raw in (params or {}).items():
+            key, _, operator = name.partition('__')
+            operator = operator or 'eq'
+            if key not in self.filterable:
+                raise FilterError(f"Unknown filter: {key}. Allowed: {', '.join(self.filterable)}")
+            if operator not in OPERATORS:
+                raise FilterError(f"Unknown operator: {operator}. Allowed: {', '.join(OPERATORS)}")
+            column = self.filterable[key]
+            if operator == 'in':
+                values = [part.strip() for part in raw.split(',') if part.strip()]
+                if not values or len(values) > MAX_IN_VALUES:
+                    raise FilterError(f'{name} takes 1 to {MAX_IN_VALUES} comma-separated values')
+                value = [parse_value(key, column, part) for part in values]
+            else:
+                value = parse_value(key, column, raw)
+            where.append(OPERATORS[operator](column, value))
+            uses_index = uses_index or (key in self.indexed and operator in INDEX_OPERATORS)
+
+        if self.large and where and not uses_index:
+            indexed = ', '.join(key for key in self.filterable if key in self.indexed)
+            raise FilterError(f'Filters on non-indexed columns need a filter on one of: {indexed}')
+
+        if not sort:
+            return ListQuery(self.pk_key, self.pk_column, where)
+        descending = sort.startswith('-')
+        # '+' у query string без кодування приходить пробілом
+        sort_key = sort.lstrip('+- ')
+        if sort_key not in self.sortable:
+            raise FilterError(f"Unknown sort: {sort_key}. Allowed: {', '.join(self.sortable)}")
+        return ListQuery(self.pk_key, self.pk_column, where, sort_key, self.columns[sort_key], descending)
@@ -1,5 +1,33 @@
 from auth.domain.models import db
 from auth.domain.maintance import Maintenance
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.pagination import keyset_rows
+from auth.dao.row_serializer import RowPlan, get_row, get_rows
+from auth.dao.streaming import stream_rows
+
+# Колонки maintenances для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+MAINTENANCE_ROWS = RowPlan(
+    ('id', Maintenance.maintenance_id),
+    ('maintenance_date', Maintenance.maintenance_date),
+    ('description', Maintenance.description),
+    ('technician_name', Maintenance.technician_name),
+    ('next_maintenance', Maintenance.next_maintenance),
+    ('version', Maintenance.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+MAINTENANCE_FILTERS = ListFilters(
+    MAINTENANCE_ROWS, Maintenance.maintenance_id,
+    filterable=('maintenance_date', 'technician_name', 'next_maintenance'),
+    indexed=('next_maintenance',),
+    sortable=('next_maintenance',),
+    large=True
+)
+# POST /maintenances/batch і PATCH /maintenances/<id>: поля ті самі, що в add_maintenance
+MAINTENANCE_BATCH = BatchWriter(Maintenance, Maintenance.maintenance_id, ('maintenance_date', 'description', 'technician_name', 'next_maintenance'))
+
 
 class MaintenanceDAO:
     @staticmethod
@@ -10,28 +38,57 @@ class MaintenanceDAO:
         return new_maintenance
 
     @staticmethod
+    def apply_maintenance_batch(operations):
+        return MAINTENANCE_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(Maintenance)
     def get_maintenance(maintenance_id):
         return Maintenance.query.get(maintenance_id)
+
+    @staticmethod
+    def get_maintenance_fields(maintenance_id, fields):
+        return get_row(MAINTENANCE_ROWS.only(fields), Maintenance.maintenance_id, maintenance_id)
+
+    @staticmethod
+    def get_maintenances_by_ids(ids, fields=None):
+        return get_rows(MAINTENANCE_ROWS.only(fields), Maintenance.maintenance_id, ids)
     
     @staticmethod
-    def get_all_maintenances():
-        return Maintenance.query.all()
+    def get_all_maintenances(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = MAINTENANCE_FILTERS.compile(filters, sort)
+        return keyset_rows(MAINTENANCE_ROWS.only(fields), Maintenance.maintenance_id, limit, after, query)
 
     @staticmethod
-    def update_maintenance(maintenance_id, maintenance_date, description, technician_name, next_maintenance):
-        maintenance = Maintenance.query.get(maintenance_id)
-        if maintenance:
-            maintenance.maintenance_date = maintenance_date
-            maintenance.description = description
-            maintenance.technician_name = technician_name
-            maintenance.next_maintenance = next_maintenance
-            db.session.commit()
-        return maintenance
+    def stream_all_maintenances(fields=None, filters=None, sort=None):
+        query = MAINTENANCE_FILTERS.compile(filters, sort)
+        return stream_rows(MAINTENANCE_ROWS.only(fields), Maintenance.maintenance_id, query=query)
+
+    @staticmethod
+    def patch_maintenance(maintenance_id, data, versions=None):
+        return MAINTENANCE_BATCH.patch(maintenance_id, data, versions)
+
+    @staticmethod
+    @invalidates(Maintenance)
+    def update_maintenance(maintenance_id, maintenance_date, description, technician_name, next_maintenance, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(Maintenance, Maintenance.maintenance_id, maintenance_id, {
+            'maintenance_date': maintenance_date,
+            'description': description,
+            'technician_name': technician_name,
+            'next_maintenance': next_maintenance
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(Maintenance, cascade=True)
+    def delete_maintenance(maintenance_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(Maintenance, Maintenance.maintenance_id, maintenance_id, versions)
+        db.session.commit()
+        return deleted
 
     @staticmethod
-    def delete_maintenance(maintenance_id):
-        maintenance = Maintenance.query.get(maintenance_id)
-        if maintenance:
-            db.session.delete(maintenance)
-            db.session.commit()
-        return maintenance
\ No newline at end of file
+    def preview_maintenance_delete(maintenance_id):
+        return cascade_counts(Maintenance.maintenance_id, maintenance_id)
\ No newline at end of file
@@ -1,5 +1,30 @@
 from auth.domain.models import db
 from auth.domain.operator import Operator
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.pagination import keyset_page, keyset_rows
+from auth.dao.row_serializer import RowPlan, get_row, get_rows
+from auth.dao.streaming import stream_rows
+
+# Колонки operators для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+OPERATOR_ROWS = RowPlan(
+    ('id', Operator.operators_id),
+    ('name', Operator.name),
+    ('shift_start', Operator.shift_start),
+    ('shift_end', Operator.shift_end),
+    ('contact_info', Operator.contact_info),
+    ('version', Operator.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+OPERATOR_FILTERS = ListFilters(
+    OPERATOR_ROWS, Operator.operators_id,
+    filterable=('name', 'shift_start', 'shift_end')
+)
+# POST /operators/batch і PATCH /operators/<id>: поля ті самі, що в add_operator
+OPERATOR_BATCH = BatchWriter(Operator, Operator.operators_id, ('name', 'shift_start', 'shift_end', 'contact_info'))
+
 
 class OperatorDAO:
     @staticmethod
@@ -10,31 +35,60 @@ class OperatorDAO:
         return new_operator
 
     @staticmethod
+    def apply_operator_batch(operations):
+        return OPERATOR_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(Operator)
     def get_operator(operator_id):
         return Operator.query.get(operator_id)
 
     @staticmethod
-    def get_all_operators():
-        return Operator.query.all()
+    def get_operator_fields(operator_id, fields):
+        return get_row(OPERATOR_ROWS.only(fields), Operator.operators_id, operator_id)
+
+    @staticmethod
+    def get_operators_by_ids(ids, fields=None):
+        return get_rows(OPERATOR_ROWS.only(fields), Operator.operators_id, ids)
+
+    @staticmethod
+    def get_all_operators(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = OPERATOR_FILTERS.compile(filters, sort)
+        return keyset_rows(OPERATOR_ROWS.only(fields), Operator.operators_id, limit, after, query)
 
     @staticmethod
-    def update_operator(operator_id, name, shift_start, shift_end, contact_info):
-        operator = Operator.query.get(operator_id)
-        if operator:
-            operator.name = name
-            operator.shift_start = shift_start
-            operator.shift_end = shift_end
-            operator.contact_info = contact_info
-            db.session.commit()
-        return operator
+    def stream_all_operators(fields=None, filters=None, sort=None):
+        query = OPERATOR_FILTERS.compile(filters, sort)
+        return stream_rows(OPERATOR_ROWS.only(fields), Operator.operators_id, query=query)
+
+    @staticmethod
+    def patch_operator(operator_id, data, versions=None):
+        return OPERATOR_BATCH.patch(operator_id, data, versions)
+
+    @staticmethod
+    @invalidates(Operator)
+    def update_operator(operator_id, name, shift_start, shift_end, contact_info, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(Operator, Operator.operators_id, operator_id, {
+            'name': name,
+            'shift_start': shift_start,
+            'shift_end': shift_end,
+            'contact_info': contact_info
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(Operator, cascade=True)
+    def delete_operator(operator_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(Operator, Operator.operators_id, operator_id, versions)
+        db.session.commit()
+        return deleted
 
     @staticmethod
-    def delete_operator(operator_id):
-        operator = Operator.query.get(operator_id)
-        if operator:
-            db.session.delete(operator)
-            db.session.commit()
-        return operator
+    def preview_operator_delete(operator_id):
+        return cascade_counts(Operator.operators_id, operator_id)
 
-    def get_all_operators_with_robots():
-        return Operator.query.options(db.joinedload(Operator.robots)).all()
\ No newline at end of file
+    def get_all_operators_with_robots(limit=None, after=None):
+        return keyset_page(Operator.query.options(db.joinedload(Operator.robots)), Operator.operators_id, limit, after)
\ No newline at end of file
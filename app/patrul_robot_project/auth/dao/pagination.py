@@ -0,0 +1,64 @@
+from auth.domain.models import db
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+def clamp_limit(limit):
+    """Обмежує розмір сторінки серверним максимумом."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def keyset_page(query, pk_column, limit=None, after=None):
+    """
+    Повертає сторінку записів з ключем більшим за `after` і курсор наступної сторінки.
+
+    Фільтр по первинному ключу замість OFFSET тримає вартість сторінки сталою
+    незалежно від глибини гортання.
+    """
+    limit = clamp_limit(limit)
+    if after is not None:
+        query = query.filter(pk_column > after)
+    rows = query.order_by(pk_column).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = getattr(rows[-1], pk_column.key)
+    return rows, next_cursor
+
+
+def keyset_rows(plan, pk_column, limit=None, after=None, query=None):
+    """
+    Те саме, що keyset_page, але вибирає колонки плану через Core і повертає готові dict.
+
+    `query` (ListQuery) додає фільтри й сортування; курсор тоді будується
+    по колонці сортування з ключем для однозначності.
+    """
+    limit = clamp_limit(limit)
+    stmt = plan.select()
+    pk_index = plan.index(pk_column)
+    if pk_index is None:
+        # Ключа немає серед ?fields=, але він потрібен для курсора; to_dict відкине зайву колонку
+        stmt = stmt.add_columns(pk_column)
+        pk_index = len(stmt.selected_columns) - 1
+    if query is None:
+        if after is not None:
+            stmt = stmt.where(pk_column > after)
+        stmt = stmt.order_by(pk_column)
+        sort_index = pk_index
+    else:
+        sort_index = plan.index(query.sort_column)
+        if sort_index is None:
+            stmt = stmt.add_columns(query.sort_column)
+            sort_index = len(stmt.selected_columns) - 1
+        stmt = query.apply(stmt, after)
+    rows = db.session.execute(stmt.limit(limit + 1)).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1][pk_index] if query is None else query.cursor(rows[-1][sort_index], rows[-1][pk_index])
+    return [plan.to_dict(row) for row in rows], next_cursor
@@ -1,5 +1,7 @@
 from auth.domain.models import db
 from auth.domain.patrol_report import PatrolReport
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.pagination import keyset_page
 
 class PatrolReportDAO:
     @staticmethod
@@ -10,14 +12,16 @@ class PatrolReportDAO:
         return new_report
 
     @staticmethod
+    @cached_get(PatrolReport)
     def get_report(report_id):
         return PatrolReport.query.get(report_id)
 
     @staticmethod
-    def get_all_reports():
-        return PatrolReport.query.all()
+    def get_all_reports(limit=None, after=None):
+        return keyset_page(PatrolReport.query, PatrolReport.report_id, limit, after)
 
     @staticmethod
+    @invalidates(PatrolReport)
     def update_report(report_id, start_time, end_time, observations, person_detected, routes_id):
         report = PatrolReport.query.get(report_id)
         if report:
@@ -30,6 +34,7 @@ class PatrolReportDAO:
         return report
 
     @staticmethod
+    @invalidates(PatrolReport, cascade=True)
     def delete_report(report_id):
         report = PatrolReport.query.get(report_id)
         if report:
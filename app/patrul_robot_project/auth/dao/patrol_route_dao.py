@@ -1,5 +1,18 @@
 from auth.domain.models import db
 from auth.domain.patrol_route import PatrolRoute
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.pagination import keyset_page
+from auth.dao.row_serializer import RowPlan
+
+# Колонки patrol_route для /robots/<id>/full
+ROUTE_ROWS = RowPlan(
+    ('id', PatrolRoute.routes_id),
+    ('start_point', PatrolRoute.start_point),
+    ('end_point', PatrolRoute.end_point),
+    ('difficulty_level', PatrolRoute.difficulty_level),
+    ('robot_id', PatrolRoute.robot_id)
+)
+
 
 class PatrolRouteDAO:
     @staticmethod
@@ -10,14 +23,16 @@ class PatrolRouteDAO:
         return new_route
 
     @staticmethod
+    @cached_get(PatrolRoute)
     def get_route(routes_id):
         return PatrolRoute.query.get(routes_id)
 
     @staticmethod
-    def get_all_routes():
-        return PatrolRoute.query.all()
+    def get_all_routes(limit=None, after=None):
+        return keyset_page(PatrolRoute.query, PatrolRoute.routes_id, limit, after)
 
     @staticmethod
+    @invalidates(PatrolRoute)
     def update_route(routes_id, start_point, end_point, difficulty_level, robot_id):
         route = PatrolRoute.query.get(routes_id)
         if route:
@@ -29,6 +44,7 @@ class PatrolRouteDAO:
         return route
 
     @staticmethod
+    @invalidates(PatrolRoute, cascade=True)
     def delete_route(routes_id):
         route = PatrolRoute.query.get(routes_id)
         if route:
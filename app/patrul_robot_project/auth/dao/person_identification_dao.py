@@ -1,5 +1,35 @@
 from auth.domain.models import db
 from auth.domain.person_identification import PersonIdentification
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.pagination import keyset_page, keyset_rows
+from auth.dao.row_serializer import RowPlan, get_row, get_rows
+from auth.dao.streaming import stream_rows
+
+# Колонки identifications для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+IDENTIFICATION_ROWS = RowPlan(
+    ('id', PersonIdentification.identification_id),
+    ('person_name', PersonIdentification.person_name),
+    ('timestamp', PersonIdentification.timestamp),
+    ('accuracy', PersonIdentification.accuracy),
+    ('sensor_id', PersonIdentification.sensor_id),
+    ('camera_id', PersonIdentification.camera_id),
+    ('report_id', PersonIdentification.report_id),
+    ('version', PersonIdentification.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+IDENTIFICATION_FILTERS = ListFilters(
+    IDENTIFICATION_ROWS, PersonIdentification.identification_id,
+    filterable=('person_name', 'timestamp', 'accuracy', 'sensor_id', 'camera_id', 'report_id'),
+    indexed=('timestamp', 'sensor_id', 'camera_id', 'report_id'),
+    sortable=('timestamp',),
+    large=True
+)
+# POST /person_identifications/batch і PATCH /person_identifications/<id>: поля ті самі, що в add_identification
+IDENTIFICATION_BATCH = BatchWriter(PersonIdentification, PersonIdentification.identification_id, ('person_name', 'timestamp', 'accuracy', 'sensor_id', 'camera_id', 'report_id'))
+
 
 class PersonIdentificationDAO:
     @staticmethod
@@ -10,36 +40,65 @@ class PersonIdentificationDAO:
         return new_identification
 
     @staticmethod
+    def apply_identification_batch(operations):
+        return IDENTIFICATION_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(PersonIdentification)
     def get_identification(identification_id):
         return PersonIdentification.query.get(identification_id)
 
     @staticmethod
-    def get_all_identifications():
-        return PersonIdentification.query.all()
+    def get_identification_fields(identification_id, fields):
+        return get_row(IDENTIFICATION_ROWS.only(fields), PersonIdentification.identification_id, identification_id)
+
+    @staticmethod
+    def get_identifications_by_ids(ids, fields=None):
+        return get_rows(IDENTIFICATION_ROWS.only(fields), PersonIdentification.identification_id, ids)
+
+    @staticmethod
+    def get_all_identifications(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = IDENTIFICATION_FILTERS.compile(filters, sort)
+        return keyset_rows(IDENTIFICATION_ROWS.only(fields), PersonIdentification.identification_id, limit, after, query)
 
     @staticmethod
-    def update_identification(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id):
-        identification = PersonIdentification.query.get(identification_id)
-        if identification:
-            identification.person_name = person_name
-            identification.timestamp = timestamp
-            identification.accuracy = accuracy
-            identification.sensor_id = sensor_id
-            identification.camera_id = camera_id
-            identification.report_id = report_id
-            db.session.commit()
-        return identification
+    def stream_all_identifications(fields=None, filters=None, sort=None):
+        query = IDENTIFICATION_FILTERS.compile(filters, sort)
+        return stream_rows(IDENTIFICATION_ROWS.only(fields), PersonIdentification.identification_id, query=query)
+
+    @staticmethod
+    def patch_identification(identification_id, data, versions=None):
+        return IDENTIFICATION_BATCH.patch(identification_id, data, versions)
+
+    @staticmethod
+    @invalidates(PersonIdentification)
+    def update_identification(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(PersonIdentification, PersonIdentification.identification_id, identification_id, {
+            'person_name': person_name,
+            'timestamp': timestamp,
+            'accuracy': accuracy,
+            'sensor_id': sensor_id,
+            'camera_id': camera_id,
+            'report_id': report_id
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(PersonIdentification, cascade=True)
+    def delete_identification(identification_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(PersonIdentification, PersonIdentification.identification_id, identification_id, versions)
+        db.session.commit()
+        return deleted
 
     @staticmethod
-    def delete_identification(identification_id):
-        identification = PersonIdentification.query.get(identification_id)
-        if identification:
-            db.session.delete(identification)
-            db.session.commit()
-        return identification
+    def preview_identification_delete(identification_id):
+        return cascade_counts(PersonIdentification.identification_id, identification_id)
 
     @staticmethod
-    def get_all_identifications_with_reports():
-        return db.session.query(PersonIdentification).options(
+    def get_all_identifications_with_reports(limit=None, after=None):
+        return keyset_page(db.session.query(PersonIdentification).options(
             db.joinedload(PersonIdentification.report)
-        ).all()
\ No newline at end of file
+        ), PersonIdentification.identification_id, limit, after)
\ No newline at end of file
@@ -0,0 +1,189 @@
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+from auth.domain.models import db
+
+logger = logging.getLogger(__name__)
+
+# Списки параметрів IN (?, ?, ?) різної довжини вважаються однією формою
+_IN_LIST = re.compile(r'\((?:\s*(?:\?|%s|%\(\w+\)s)\s*,)+\s*(?:\?|%s|%\(\w+\)s)\s*\)')
+_WHITESPACE = re.compile(r'\s+')
+# Ключ звіту для запитів, що не збіглися з жодним маршрутом
+UNMATCHED_ENDPOINT = '<unmatched>'
+
+
+def statement_shape(statement):
+    return _IN_LIST.sub('(?)', _WHITESPACE.sub(' ', statement).strip())
+
+
+class RequestQueryStats:
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.rows = 0
+        self.shapes = Counter()
+
+    def duplicates(self):
+        return {shape: n for shape, n in self.shapes.items() if n > 1}
+
+    def suspected_n_plus_one(self, threshold):
+        return {shape: n for shape, n in self.shapes.items()
+                if n >= threshold and shape.lstrip().upper().startswith('SELECT')}
+
+
+class _CountingCursor:
+    """
+    Обгортка DBAPI-курсора, що рахує рядки, які драйвер реально віддав.
+
+    cursor.rowcount для SELECT не переносний (sqlite3 повертає -1), тому рахуються
+    виклики fetch*. Решта атрибутів делегується справжньому курсору.
+    """
+
+    def __init__(self, cursor, stats):
+        self._cursor = cursor
+        self._stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._stats.rows += 1
+            yield row
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._stats.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._stats.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._stats.rows += len(rows)
+        return rows
+
+
+class SqlInstrumentation:
+    """
+    Опційний лічильник SQL-запитів на HTTP-запит.
+
+    Події рушія рахують оператори, час у базі й рядки, отримані з курсора, —
+    однаково для ORM і Core-запитів (column-only select, executemany). Після запиту підсумок іде в заголовок Server-Timing
+    і в агрегований звіт по ендпоінтах. Форма SELECT, що повторюється в межах
+    одного запиту threshold разів і більше, позначається як ймовірний N+1.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.threshold = 5
+        self.max_shapes = 5
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.enabled = app.config.get('SQL_INSTRUMENTATION_ENABLED', False)
+        self.threshold = app.config.get('SQL_N_PLUS_ONE_THRESHOLD', self.threshold)
+        if not self.enabled:
+            return
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+                event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+
+    @staticmethod
+    def _current():
+        return g.get('sql_query_stats') if has_request_context() else None
+
+    def _start_request(self):
+        g.sql_query_stats = RequestQueryStats()
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context.query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context.query_started
+        stats = self._current()
+        if stats is None:
+            return
+        stats.count += 1
+        stats.db_time += elapsed
+        stats.shapes[statement_shape(statement)] += 1
+        if cursor.description is not None:
+            # CursorResult бере курсор із контексту вже після цієї події
+            context.cursor = _CountingCursor(cursor, stats)
+
+    def _finish_request(self, response):
+        stats = self._current()
+        if stats is None:
+            return response
+        suspects = stats.suspected_n_plus_one(self.threshold)
+        timing = f'db;dur={stats.db_time * 1000:.2f};desc="{stats.count} queries, {stats.rows} rows"'
+        if suspects:
+            timing += f', n-plus-one;desc="{len(suspects)} repeated statement(s)"'
+            logger.warning('Likely N+1 in %s %s: %s', request.method, request.path,
+                           ', '.join(f'{n}x {shape[:120]}' for shape, n in suspects.items()))
+        response.headers.add('Server-Timing', timing)
+        # Без маршруту (404, 405, сканери) — один спільний ключ і без методу, який теж довільний:
+        # інакше кожен URL лишав би запис у звіті назавжди
+        endpoint = f'{request.method} {request.url_rule.rule}' if request.url_rule else UNMATCHED_ENDPOINT
+        self._aggregate(endpoint, stats, suspects)
+        return response
+
+    def _aggregate(self, endpoint, stats, suspects):
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, {
+                'requests': 0, 'queries': 0, 'max_queries': 0, 'db_time_ms': 0.0, 'rows': 0,
+                'duplicate_statements': 0, 'n_plus_one_requests': 0, 'n_plus_one_shapes': Counter()
+            })
+            entry['requests'] += 1
+            entry['queries'] += stats.count
+            entry['max_queries'] = max(entry['max_queries'], stats.count)
+            entry['db_time_ms'] += stats.db_time * 1000
+            entry['rows'] += stats.rows
+            entry['duplicate_statements'] += sum(n - 1 for n in stats.duplicates().values())
+            if suspects:
+                entry['n_plus_one_requests'] += 1
+                for shape, n in suspects.items():
+                    entry['n_plus_one_shapes'][shape] = max(entry['n_plus_one_shapes'][shape], n)
+
+    def report(self):
+        with self._lock:
+            endpoints = []
+            for endpoint, entry in self._endpoints.items():
+                requests = entry['requests']
+                endpoints.append({
+                    'endpoint': endpoint,
+                    'requests': requests,
+                    'avg_queries': entry['queries'] / requests,
+                    'max_queries': entry['max_queries'],
+                    'avg_db_time_ms': entry['db_time_ms'] / requests,
+                    'avg_rows': entry['rows'] / requests,
+                    'duplicate_statements': entry['duplicate_statements'],
+                    'n_plus_one_requests': entry['n_plus_one_requests'],
+                    'n_plus_one_shapes': [{'statement': shape, 'max_per_request': n}
+                                          for shape, n in entry['n_plus_one_shapes'].most_common(self.max_shapes)]
+                })
+        endpoints.sort(key=lambda item: item['avg_db_time_ms'] * item['requests'], reverse=True)
+        return {'enabled': self.enabled, 'pid': os.getpid(), 'n_plus_one_threshold': self.threshold,
+                'endpoints': endpoints}
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+sql_instrumentation = SqlInstrumentation()
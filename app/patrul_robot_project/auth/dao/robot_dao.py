@@ -1,5 +1,95 @@
 from auth.domain.models import db
+from auth.domain.audio_system import AudioSystem
+from auth.domain.battery import Battery
+from auth.domain.camera import Camera
+from auth.domain.charging_station import ChargingStation
+from auth.domain.maintance import Maintenance
+from auth.domain.patrol_route import PatrolRoute
 from auth.domain.robot import Robot
+from auth.domain.robot_maintenance import RobotMaintenance
+from auth.domain.sensor import Sensor
+from auth.dao.audio_system_dao import AUDIO_SYSTEM_ROWS
+from auth.dao.battery_dao import BATTERY_ROWS
+from auth.dao.camera_dao import CAMERA_ROWS
+from auth.dao.charging_station_dao import STATION_ROWS
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.maintenance_dao import MAINTENANCE_ROWS
+from auth.dao.pagination import keyset_rows
+from auth.dao.patrol_route_dao import ROUTE_ROWS
+from auth.dao.row_serializer import RowPlan, UnknownFieldError, get_row, get_rows
+from auth.dao.sensor_dao import SENSOR_ROWS
+from auth.dao.streaming import stream_rows
+
+# Колонки robots для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+ROBOT_ROWS = RowPlan(
+    ('id', Robot.robot_id),
+    ('status', Robot.status),
+    ('max_distance', Robot.max_distance),
+    ('operator_id', Robot.operator_id),
+    ('station_id', Robot.station_id),
+    ('alternative_power_source', Robot.alternative_power_source),
+    ('version', Robot.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+ROBOT_FILTERS = ListFilters(
+    ROBOT_ROWS, Robot.robot_id,
+    filterable=('status', 'max_distance', 'operator_id', 'station_id', 'alternative_power_source'),
+    indexed=('status', 'operator_id', 'station_id'),
+    sortable=('status', 'operator_id', 'station_id')
+)
+# POST /robots/batch і PATCH /robots/<id>: поля ті самі, що в add_robot
+ROBOT_BATCH = BatchWriter(Robot, Robot.robot_id, ('status', 'max_distance', 'operator_id', 'station_id', 'alternative_power_source'))
+
+
+def _children(plan, robot_column, pk_column):
+    def load(robot):
+        stmt = plan.select().where(robot_column == robot['id']).order_by(pk_column)
+        return [plan.to_dict(row) for row in db.session.execute(stmt)]
+    return load
+
+
+def _maintenances(robot):
+    stmt = (
+        MAINTENANCE_ROWS.select()
+        .join(RobotMaintenance, RobotMaintenance.maintenance_id == Maintenance.maintenance_id)
+        .where(RobotMaintenance.robot_id == robot['id'])
+        .order_by(Maintenance.maintenance_id)
+    )
+    return [MAINTENANCE_ROWS.to_dict(row) for row in db.session.execute(stmt)]
+
+
+def _latest_battery(robot):
+    # Лише останній запис по ix_battery_robot_log_time, а не вся колекція Robot.batteries
+    stmt = (
+        BATTERY_ROWS.select()
+        .where(Battery.robot_id == robot['id'])
+        .order_by(Battery.log_time.desc(), Battery.battery_id.desc())
+        .limit(1)
+    )
+    row = db.session.execute(stmt).first()
+    return BATTERY_ROWS.to_dict(row) if row is not None else None
+
+
+def _station(robot):
+    return get_row(STATION_ROWS, ChargingStation.station_id, robot['station_id'])
+
+
+# ?include= для /robots/<id>/full: кожен зв'язок — один запит, незалежно від кількості записів
+ROBOT_INCLUDES = {
+    'sensors': _children(SENSOR_ROWS, Sensor.robot_id, Sensor.sensor_id),
+    'cameras': _children(CAMERA_ROWS, Camera.robot_id, Camera.camera_id),
+    'audio_systems': _children(AUDIO_SYSTEM_ROWS, AudioSystem.robot_id, AudioSystem.audio_system_id),
+    'routes': _children(ROUTE_ROWS, PatrolRoute.robot_id, PatrolRoute.routes_id),
+    'maintenances': _maintenances,
+    'latest_battery': _latest_battery,
+    'station': _station,
+}
+# Зв'язки, що, як і /sensors, віддаються лише з JWT
+JWT_INCLUDES = frozenset({'sensors'})
+
 
 class RobotDAO:
     @staticmethod
@@ -10,29 +100,72 @@ class RobotDAO:
         return new_robot
 
     @staticmethod
+    def apply_robot_batch(operations):
+        return ROBOT_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(Robot)
     def get_robot(robot_id):
         return Robot.query.get(robot_id)
 
     @staticmethod
-    def get_all_robots():
-        return Robot.query.all()
+    def get_robot_fields(robot_id, fields):
+        return get_row(ROBOT_ROWS.only(fields), Robot.robot_id, robot_id)
 
     @staticmethod
-    def update_robot(robot_id, status, max_distance, operator_id, station_id, alternative_power_source):
-        robot = Robot.query.get(robot_id)
-        if robot:
-            robot.status = status
-            robot.max_distance = max_distance
-            robot.operator_id = operator_id
-            robot.station_id = station_id
-            robot.alternative_power_source = alternative_power_source
-            db.session.commit()
-        return robot
+    def get_robots_by_ids(ids, fields=None):
+        return get_rows(ROBOT_ROWS.only(fields), Robot.robot_id, ids)
 
     @staticmethod
-    def delete_robot(robot_id):
-        robot = Robot.query.get(robot_id)
-        if robot:
-            db.session.delete(robot)
-            db.session.commit()
+    def get_robot_full(robot_id, include=None):
+        """Робот разом зі зв'язками з `include` (усі, якщо не задано): 1 + len(include) запитів."""
+        include = list(ROBOT_INCLUDES) if include is None else include
+        unknown = [name for name in include if name not in ROBOT_INCLUDES]
+        if unknown:
+            raise UnknownFieldError(f"Unknown include: {', '.join(unknown)}. Allowed: {', '.join(ROBOT_INCLUDES)}")
+        robot = get_row(ROBOT_ROWS, Robot.robot_id, robot_id)
+        if robot is None:
+            return None
+        for name in dict.fromkeys(include):
+            robot[name] = ROBOT_INCLUDES[name](robot)
         return robot
+
+    @staticmethod
+    def get_all_robots(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = ROBOT_FILTERS.compile(filters, sort)
+        return keyset_rows(ROBOT_ROWS.only(fields), Robot.robot_id, limit, after, query)
+
+    @staticmethod
+    def stream_all_robots(fields=None, filters=None, sort=None):
+        query = ROBOT_FILTERS.compile(filters, sort)
+        return stream_rows(ROBOT_ROWS.only(fields), Robot.robot_id, query=query)
+
+    @staticmethod
+    def patch_robot(robot_id, data, versions=None):
+        return ROBOT_BATCH.patch(robot_id, data, versions)
+
+    @staticmethod
+    @invalidates(Robot)
+    def update_robot(robot_id, status, max_distance, operator_id, station_id, alternative_power_source, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(Robot, Robot.robot_id, robot_id, {
+            'status': status,
+            'max_distance': max_distance,
+            'operator_id': operator_id,
+            'station_id': station_id,
+            'alternative_power_source': alternative_power_source
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(Robot, cascade=True)
+    def delete_robot(robot_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(Robot, Robot.robot_id, robot_id, versions)
+        db.session.commit()
+        return deleted
+
+    @staticmethod
+    def preview_robot_delete(robot_id):
+        return cascade_counts(Robot.robot_id, robot_id)
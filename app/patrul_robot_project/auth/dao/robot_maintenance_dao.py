@@ -1,7 +1,10 @@
+from sqlalchemy import select
+from sqlalchemy.orm import contains_eager, selectinload
+
 from auth.domain.models import db
 from auth.domain.robot_maintenance import RobotMaintenance
 from auth.domain.maintance import Maintenance
-from auth.domain.robot import Robot
+from auth.dao.pagination import clamp_limit
 
 class RobotMaintenanceDAO:
     @staticmethod
@@ -20,20 +23,42 @@ class RobotMaintenanceDAO:
 
     @staticmethod
     def get_maintenances_for_robot(robot_id):
-        return RobotMaintenance.query.filter_by(robot_id=robot_id).all()
+        # Один запит: техобслуговування підтягується тим самим JOIN
+        return RobotMaintenance.query.join(RobotMaintenance.maintenance).options(
+            contains_eager(RobotMaintenance.maintenance)
+        ).filter(RobotMaintenance.robot_id == robot_id).order_by(RobotMaintenance.maintenance_id).all()
 
     @staticmethod
-    def get_all_maintenances_with_robots():
-        maintenances = db.session.query(Maintenance).join(RobotMaintenance).join(Robot).all()
-        return maintenances
-    
+    def get_all_maintenances_with_robots(limit=None, after=None):
+        # Один запит: зв'язки і роботи заповнюються з рядків JOIN, без lazy load на кожен запис.
+        # LIMIT по рядках JOIN урізав би роботів, тому сторінка ключів техобслуговувань —
+        # окрема похідна таблиця (MySQL не дозволяє LIMIT у підзапиті IN)
+        limit = clamp_limit(limit)
+        page = select(Maintenance.maintenance_id).where(Maintenance.robot_maintenances.any())
+        if after is not None:
+            page = page.where(Maintenance.maintenance_id > after)
+        page = page.order_by(Maintenance.maintenance_id).limit(limit + 1).subquery()
+
+        maintenances = db.session.query(Maintenance).join(page, Maintenance.maintenance_id == page.c.maintenance_id).join(
+            Maintenance.robot_maintenances
+        ).join(RobotMaintenance.robot).options(
+            contains_eager(Maintenance.robot_maintenances).contains_eager(RobotMaintenance.robot)
+        ).order_by(Maintenance.maintenance_id, RobotMaintenance.robot_id).all()
+
+        next_cursor = None
+        if len(maintenances) > limit:
+            maintenances = maintenances[:limit]
+            next_cursor = maintenances[-1].maintenance_id
+        return maintenances, next_cursor
+
     @staticmethod
     def get_maintenance_with_robots(maintenance_id):
-        # Отримуємо техобслуговування за його id
-        maintenance = Maintenance.query.get(maintenance_id)
+        # Два запити незалежно від кількості роботів: техобслуговування і зв'язки разом із роботами
+        maintenance = Maintenance.query.options(
+            selectinload(Maintenance.robot_maintenances).joinedload(RobotMaintenance.robot)
+        ).filter_by(maintenance_id=maintenance_id).first()
         if not maintenance:
             return None, []
 
-        # Отримуємо всіх роботів, пов'язаних з цим техобслуговуванням
         robots = [rm.robot for rm in maintenance.robot_maintenances]
         return maintenance, robots
@@ -0,0 +1,100 @@
+from sqlalchemy import select
+
+from auth.domain.models import db
+
+# ?ids= і POST /<resource>/lookup: ліміт на запит і розмір одного IN (...)
+MAX_BULK_IDS = 1000
+IN_CHUNK_SIZE = 500
+
+
+class UnknownFieldError(ValueError):
+    pass
+
+
+class InvalidIdsError(ValueError):
+    pass
+
+
+class RowPlan:
+    """
+    План колонок для read-only списків моделі.
+
+    Вибирає лише перелічені колонки через Core і перетворює кортежі Row у dict
+    без ORM-екземплярів та identity map. Поле задається як (ключ, колонка) або
+    (ключ, колонка, конвертер). datetime, Decimal тощо лишаються як є — їх
+    кодує JSON-провайдер застосунку.
+    """
+
+    def __init__(self, *fields):
+        self._fields = fields
+        self.keys = tuple(field[0] for field in fields)
+        self.columns = tuple(field[1] for field in fields)
+        self._converters = tuple((index, field[2]) for index, field in enumerate(fields) if len(field) > 2)
+
+    def only(self, keys):
+        """Підплан лише з ключами `keys` (?fields=) у порядку плану; порожній `keys` — весь план."""
+        if not keys:
+            return self
+        unknown = [key for key in keys if key not in self.keys]
+        if unknown:
+            raise UnknownFieldError(f"Unknown fields: {', '.join(unknown)}. Allowed: {', '.join(self.keys)}")
+        return RowPlan(*(field for field in self._fields if field[0] in keys))
+
+    def select(self):
+        return select(*self.columns)
+
+    def index(self, column):
+        return next((i for i, planned in enumerate(self.columns) if planned is column), None)
+
+    def to_dict(self, row):
+        if not self._converters:
+            return dict(zip(self.keys, row))
+        values = list(row)
+        for index, convert in self._converters:
+            value = values[index]
+            if value is not None:
+                values[index] = convert(value)
+        return dict(zip(self.keys, values))
+
+
+def get_row(plan, pk_column, pk):
+    """Один запис за первинним ключем, лише колонки плану."""
+    row = db.session.execute(plan.select().where(pk_column == pk)).first()
+    return plan.to_dict(row) if row is not None else None
+
+
+def parse_ids(ids):
+    """Перевіряє список ключів з ?ids= або тіла запиту; повертає int без повторів у порядку запиту."""
+    if not isinstance(ids, list) or not ids:
+        raise InvalidIdsError('ids must be a non-empty list of integers')
+    if len(ids) > MAX_BULK_IDS:
+        raise InvalidIdsError(f'At most {MAX_BULK_IDS} ids per request, got {len(ids)}')
+    parsed = []
+    for value in ids:
+        if isinstance(value, bool):
+            raise InvalidIdsError(f'Invalid id: {value}')
+        try:
+            parsed.append(int(value))
+        except (TypeError, ValueError):
+            raise InvalidIdsError(f'Invalid id: {value}') from None
+    return list(dict.fromkeys(parsed))
+
+
+def get_rows(plan, pk_column, ids, chunk_size=IN_CHUNK_SIZE):
+    """
+    Записи за списком ключів: один `IN (...)` на кожні `chunk_size` ключів.
+
+    Повертає (записи в порядку `ids`, ключі, яких немає в таблиці). Розмір
+    порції обмежує довжину SQL і кількість параметрів в одному запиті.
+    """
+    ids = parse_ids(ids)
+    stmt = plan.select()
+    pk_index = plan.index(pk_column)
+    if pk_index is None:
+        stmt = stmt.add_columns(pk_column)
+        pk_index = len(stmt.selected_columns) - 1
+    found = {}
+    for start in range(0, len(ids), chunk_size):
+        for row in db.session.execute(stmt.where(pk_column.in_(ids[start:start + chunk_size]))):
+            found[row[pk_index]] = plan.to_dict(row)
+    return [found[pk] for pk in ids if pk in found], [pk for pk in ids if pk not in found]
@@ -1,5 +1,32 @@
 from auth.domain.models import db
 from auth.domain.sensor import Sensor
+from auth.dao.batch import BatchWriter, delete_by_pk, update_by_pk
+from auth.dao.cascade import cascade_counts
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.list_query import ListFilters
+from auth.dao.pagination import keyset_page, keyset_rows
+from auth.dao.row_serializer import RowPlan, get_row, get_rows
+from auth.dao.streaming import stream_rows
+
+# Колонки sensors для списків і ?fields=: ті самі ключі, що й у _to_dict контролера
+SENSOR_ROWS = RowPlan(
+    ('id', Sensor.sensor_id),
+    ('robot_id', Sensor.robot_id),
+    ('technology_used', Sensor.technology_used),
+    ('detection_range', Sensor.detection_range),
+    ('trigger_status', Sensor.trigger_status),
+    ('version', Sensor.version)
+)
+# Фільтри й сортування списку (?status=..&sort=-..): індексовані колонки окремо
+SENSOR_FILTERS = ListFilters(
+    SENSOR_ROWS, Sensor.sensor_id,
+    filterable=('robot_id', 'technology_used', 'detection_range', 'trigger_status'),
+    indexed=('robot_id',),
+    sortable=('robot_id',)
+)
+# POST /sensors/batch і PATCH /sensors/<id>: поля ті самі, що в add_sensor
+SENSOR_BATCH = BatchWriter(Sensor, Sensor.sensor_id, ('robot_id', 'technology_used', 'detection_range', 'trigger_status'))
+
 
 class SensorDAO:
     @staticmethod
@@ -10,32 +37,61 @@ class SensorDAO:
         return new_sensor
 
     @staticmethod
+    def apply_sensor_batch(operations):
+        return SENSOR_BATCH.apply(operations)
+
+    @staticmethod
+    @cached_get(Sensor)
     def get_sensor(sensor_id):
         return Sensor.query.get(sensor_id)
 
     @staticmethod
-    def get_all_sensors():
-        return Sensor.query.all()
+    def get_sensor_fields(sensor_id, fields):
+        return get_row(SENSOR_ROWS.only(fields), Sensor.sensor_id, sensor_id)
+
+    @staticmethod
+    def get_sensors_by_ids(ids, fields=None):
+        return get_rows(SENSOR_ROWS.only(fields), Sensor.sensor_id, ids)
+
+    @staticmethod
+    def get_all_sensors(limit=None, after=None, fields=None, filters=None, sort=None):
+        query = SENSOR_FILTERS.compile(filters, sort)
+        return keyset_rows(SENSOR_ROWS.only(fields), Sensor.sensor_id, limit, after, query)
 
     @staticmethod
-    def update_sensor(sensor_id, robot_id, technology_used, detection_range, trigger_status):
-        sensor = Sensor.query.get(sensor_id)
-        if sensor:
-            sensor.robot_id = robot_id
-            sensor.technology_used = technology_used
-            sensor.detection_range = detection_range
-            sensor.trigger_status = trigger_status
-            db.session.commit()
-        return sensor
+    def stream_all_sensors(fields=None, filters=None, sort=None):
+        query = SENSOR_FILTERS.compile(filters, sort)
+        return stream_rows(SENSOR_ROWS.only(fields), Sensor.sensor_id, query=query)
+
+    @staticmethod
+    def patch_sensor(sensor_id, data, versions=None):
+        return SENSOR_BATCH.patch(sensor_id, data, versions)
+
+    @staticmethod
+    @invalidates(Sensor)
+    def update_sensor(sensor_id, robot_id, technology_used, detection_range, trigger_status, versions=None):
+        # Один UPDATE за ключем (і версією з If-Match) замість SELECT і flush через ORM
+        updated = update_by_pk(Sensor, Sensor.sensor_id, sensor_id, {
+            'robot_id': robot_id,
+            'technology_used': technology_used,
+            'detection_range': detection_range,
+            'trigger_status': trigger_status
+        }, versions)
+        db.session.commit()
+        return updated
+
+    @staticmethod
+    @invalidates(Sensor, cascade=True)
+    def delete_sensor(sensor_id, versions=None):
+        # Один DELETE за ключем; залежні записи прибирає ON DELETE CASCADE у базі
+        deleted = delete_by_pk(Sensor, Sensor.sensor_id, sensor_id, versions)
+        db.session.commit()
+        return deleted
 
     @staticmethod
-    def delete_sensor(sensor_id):
-        sensor = Sensor.query.get(sensor_id)
-        if sensor:
-            db.session.delete(sensor)
-            db.session.commit()
-        return sensor
+    def preview_sensor_delete(sensor_id):
+        return cascade_counts(Sensor.sensor_id, sensor_id)
 
     @staticmethod
-    def get_all_sensors_with_robot():
-        return Sensor.query.options(db.joinedload(Sensor.robot)).all()
\ No newline at end of file
+    def get_all_sensors_with_robot(limit=None, after=None):
+        return keyset_page(Sensor.query.options(db.joinedload(Sensor.robot)), Sensor.sensor_id, limit, after)
\ No newline at end of file
@@ -1,23 +1,32 @@
+from datetime import datetime
+
 from auth.domain.models import db
 from auth.domain.solar_system import SolarSystem
+from auth.dao.entity_cache import cached_get, invalidates
+from auth.dao.pagination import keyset_page
+from auth.dao.telemetry_rollup_dao import TelemetryRollupDAO
 
 class SolarSystemDAO:
     @staticmethod
     def add_solar_system(status, power_output, technology_used, station_id):
         new_solar_system = SolarSystem(status=status, power_output=power_output, technology_used=technology_used, station_id=station_id)
         db.session.add(new_solar_system)
+        # solar_system не має часової мітки, тому зразок отримує час запису
+        TelemetryRollupDAO.record('power_output', [(station_id, datetime.utcnow(), power_output)])
         db.session.commit()
         return new_solar_system
 
     @staticmethod
+    @cached_get(SolarSystem)
     def get_solar_system(solar_id):
         return SolarSystem.query.get(solar_id)
 
     @staticmethod
-    def get_all_solar_systems():
-        return SolarSystem.query.all()
+    def get_all_solar_systems(limit=None, after=None):
+        return keyset_page(SolarSystem.query, SolarSystem.solar_id, limit, after)
 
     @staticmethod
+    @invalidates(SolarSystem)
     def update_solar_system(solar_id, status, power_output, technology_used, station_id):
         solar_system = SolarSystem.query.get(solar_id)
         if solar_system:
@@ -25,10 +34,12 @@ class SolarSystemDAO:
             solar_system.power_output = power_output
             solar_system.technology_used = technology_used
             solar_system.station_id = station_id
+            TelemetryRollupDAO.record('power_output', [(station_id, datetime.utcnow(), power_output)])
             db.session.commit()
         return solar_system
 
     @staticmethod
+    @invalidates(SolarSystem, cascade=True)
     def delete_solar_system(solar_id):
         solar_system = SolarSystem.query.get(solar_id)
         if solar_system:
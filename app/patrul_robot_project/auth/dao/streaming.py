@@ -0,0 +1,16 @@
+from auth.domain.models import db
+
+STREAM_CHUNK_SIZE = 1000
+
+
+def stream_rows(plan, pk_column, chunk_size=STREAM_CHUNK_SIZE, query=None):
+    """
+    Ітерує всю таблицю порціями по `chunk_size` рядків і віддає dict за планом колонок.
+
+    `yield_per` вмикає серверний курсор, тож у пам'яті тримається лише одна
+    порція незалежно від розміру таблиці. `query` (ListQuery) додає фільтри
+    й сортування.
+    """
+    stmt = plan.select().order_by(pk_column) if query is None else query.apply(plan.select())
+    result = db.session.execute(stmt.execution_options(yield_per=chunk_size))
+    return (plan.to_dict(row) for row in result)
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import case
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from auth.domain.models import db
+from auth.domain.telemetry_rollup import TelemetryRollup
+
+# 1 хвилина, 1 година, 1 доба
+ROLLUP_RESOLUTIONS = (60, 3600, 86400)
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def bucket_start(moment, resolution):
+    seconds = int((moment - _EPOCH).total_seconds())
+    return _EPOCH + timedelta(seconds=seconds - seconds % resolution)
+
+
+def _merged_columns(current, new):
+    # Порядок важливий для MySQL: value_last має оновитися раніше за last_time
+    newer = new.last_time >= current.last_time
+    return [
+        ('sample_count', current.sample_count + new.sample_count),
+        ('value_sum', current.value_sum + new.value_sum),
+        ('value_min', case((new.value_min < current.value_min, new.value_min), else_=current.value_min)),
+        ('value_max', case((new.value_max > current.value_max, new.value_max), else_=current.value_max)),
+        ('value_last', case((newer, new.value_last), else_=current.value_last)),
+        ('last_time', case((newer, new.last_time), else_=current.last_time)),
+    ]
+
+
+def _upsert_statement():
+    table = TelemetryRollup.__table__
+    if db.session.get_bind().dialect.name == 'mysql':
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(_merged_columns(table.c, stmt.inserted))
+    stmt = sqlite_insert(table)
+    return stmt.on_conflict_do_update(
+        index_elements=[column.name for column in table.primary_key],
+        set_=dict(_merged_columns(table.c, stmt.excluded))
+    )
+
+
+class TelemetryRollupDAO:
+    @staticmethod
+    def record(metric, samples):
+        """
+        Додає зразки (entity_id, time, value) до агрегатів усіх роздільностей.
+
+        Пачка спершу згортається в пам'яті, тож на кожен зачеплений бакет
+        припадає один рядок upsert. Коміт робить викликач разом із сирими даними.
+        """
+        buckets = {}
+        for entity_id, moment, value in samples:
+            for resolution in ROLLUP_RESOLUTIONS:
+                key = (entity_id, resolution, bucket_start(moment, resolution))
+                aggregate = buckets.get(key)
+                if aggregate is None:
+                    buckets[key] = [1, value, value, value, value, moment]
+                    continue
+                aggregate[0] += 1
+                aggregate[1] += value
+                aggregate[2] = min(aggregate[2], value)
+                aggregate[3] = max(aggregate[3], value)
+                if moment >= aggregate[5]:
+                    aggregate[4] = value
+                    aggregate[5] = moment
+
+        if not buckets:
+            return 0
+        db.session.execute(_upsert_statement(), [{
+            'metric': metric,
+            'entity_id': entity_id,
+            'resolution': resolution,
+            'bucket_start': start,
+            'sample_count': count,
+            'value_sum': total,
+            'value_min': low,
+            'value_max': high,
+            'value_last': last,
+            'last_time': last_time
+        } for (entity_id, resolution, start), (count, total, low, high, last, last_time) in buckets.items()])
+        return len(buckets)
+
+    @staticmethod
+    def get_series(metric, entity_id, resolution, start, end):
+        return TelemetryRollup.query.filter(
+            TelemetryRollup.metric == metric,
+            TelemetryRollup.entity_id == entity_id,
+            TelemetryRollup.resolution == resolution,
+            TelemetryRollup.bucket_start >= bucket_start(start, resolution),
+            TelemetryRollup.bucket_start < end
+        ).order_by(TelemetryRollup.bucket_start).all()
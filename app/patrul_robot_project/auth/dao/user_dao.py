@@ -1,3 +1,5 @@
+from sqlalchemy.exc import IntegrityError
+
 from ..domain.models import User, db
 
 class UserDAO:
@@ -9,5 +11,10 @@ class UserDAO:
     def create_user(username: str, password: str):
         user = User(username=username, password=password)
         db.session.add(user)
-        db.session.commit()
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Паралельна реєстрація з тим самим username
+            db.session.rollback()
+            return None
         return user
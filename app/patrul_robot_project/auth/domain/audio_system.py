@@ -7,4 +7,4 @@ class AudioSystem(db.Model):
     has_speaker = db.Column(db.Enum('yes', 'no'), nullable=False)
     has_microphone = db.Column(db.Enum('yes', 'no'), nullable=False)
     has_panic_button = db.Column(db.Enum('yes', 'no'), nullable=False)
-    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id'), nullable=False)
+    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id', ondelete='CASCADE'), nullable=False)
@@ -2,10 +2,13 @@ from auth.domain.models import db
 
 class Battery(db.Model):
     __tablename__ = 'battery'
+    __table_args__ = (
+        db.Index('ix_battery_robot_log_time', 'robot_id', 'log_time'),
+    )
     
     battery_id = db.Column(db.Integer, primary_key=True)
     log_time = db.Column(db.DateTime, nullable=False)
     battery_level = db.Column(db.Integer, nullable=False)
-    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id'), nullable=False)
+    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id', ondelete='CASCADE'), nullable=False)
     temperature = db.Column(db.String(45), nullable=False)
 
@@ -0,0 +1,16 @@
+from auth.domain.models import db
+
+class ChangeLog(db.Model):
+    __tablename__ = 'change_log'
+    __table_args__ = (
+        db.Index('ix_change_log_sequence', 'sequence', unique=True),
+    )
+
+    # Автоінкремент видається при вставці, тож за ним рядки йдуть у порядку вставок, а не комітів
+    version = db.Column(db.BigInteger().with_variant(db.Integer, 'sqlite'), primary_key=True, autoincrement=True)
+    entity = db.Column(db.String(32), nullable=False)
+    entity_id = db.Column(db.Integer, nullable=False)
+    op = db.Column(db.Enum('insert', 'update', 'delete'), nullable=False)
+    changed_at = db.Column(db.DateTime, nullable=False)
+    # Номер у стрічці GET /changes (її since і next_since): ставиться вже закомітченим рядкам, у порядку комітів
+    sequence = db.Column(db.BigInteger().with_variant(db.Integer, 'sqlite'), nullable=True)
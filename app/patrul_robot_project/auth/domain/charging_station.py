@@ -7,5 +7,8 @@ class ChargingStation(db.Model):
     location = db.Column(db.String(45), nullable=False)
     capacity = db.Column(db.Integer, nullable=False)
     available = db.Column(db.Enum('yes', 'no'), nullable=False)
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
     
-    robots = db.relationship('Robot', backref='charging_station', cascade='all, delete-orphan')
+    robots = db.relationship('Robot', backref='charging_station', cascade='all, delete-orphan', passive_deletes=True)
@@ -2,14 +2,21 @@ from auth.domain.models import db
 
 class Maintenance(db.Model):
     __tablename__ = 'maintenance'
+    __table_args__ = (
+        db.Index('ix_maintenance_next_maintenance', 'next_maintenance'),
+    )
     
     maintenance_id = db.Column(db.Integer, primary_key=True)
     maintenance_date = db.Column(db.DateTime, nullable=False)
     description = db.Column(db.Text, nullable=False)
     technician_name = db.Column(db.String(50), nullable=False)
     next_maintenance = db.Column(db.DateTime, nullable=False)
+    version = db.Column(db.Integer, nullable=False, server_default='1')
 
-    robot_maintenances = db.relationship('RobotMaintenance', back_populates='maintenance')
+    __mapper_args__ = {'version_id_col': version}
+
+    robot_maintenances = db.relationship('RobotMaintenance', back_populates='maintenance',
+                                         cascade='all, delete-orphan', passive_deletes=True)
     
     @property
     def robots(self):
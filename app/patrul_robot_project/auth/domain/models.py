@@ -19,3 +19,5 @@ from .person_identification import PersonIdentification
 from .solar_system import SolarSystem
 from .robot_maintenance import RobotMaintenance
 from .user import User
+from .telemetry_rollup import TelemetryRollup
+from .change_log import ChangeLog
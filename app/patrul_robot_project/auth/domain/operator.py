@@ -8,5 +8,8 @@ class Operator(db.Model):
     shift_start = db.Column(db.Time, nullable=False)
     shift_end = db.Column(db.Time, nullable=False)
     contact_info = db.Column(db.String(100), nullable=False)
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
     
-    robots = db.relationship('Robot', backref='operator', cascade='all, delete-orphan')
+    robots = db.relationship('Robot', backref='operator', cascade='all, delete-orphan', passive_deletes=True)
@@ -8,6 +8,7 @@ class PatrolReport(db.Model):
     end_time = db.Column(db.DateTime, nullable=False)
     observations = db.Column(db.Text, nullable=False)
     person_detected = db.Column(db.Enum('yes', 'no'), nullable=False)
-    routes_id = db.Column(db.Integer, db.ForeignKey('patrol_route.routes_id'), nullable=False)
+    routes_id = db.Column(db.Integer, db.ForeignKey('patrol_route.routes_id', ondelete='CASCADE'), nullable=False)
 
-    route = db.relationship('PatrolRoute', backref='reports', lazy=True)
\ No newline at end of file
+    route = db.relationship('PatrolRoute', lazy=True,
+                            backref=db.backref('reports', cascade='all, delete-orphan', passive_deletes=True))
\ No newline at end of file
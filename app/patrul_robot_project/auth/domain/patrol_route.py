@@ -7,4 +7,4 @@ class PatrolRoute(db.Model):
     start_point = db.Column(db.String(100), nullable=False)
     end_point = db.Column(db.String(100), nullable=False)
     difficulty_level = db.Column(db.Float, nullable=False)
-    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id'), nullable=False)
+    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id', ondelete='CASCADE'), nullable=False)
@@ -2,13 +2,21 @@ from auth.domain.models import db
 
 class PersonIdentification(db.Model):
     __tablename__ = 'person_identification'
+    __table_args__ = (
+        db.Index('ix_person_identification_timestamp', 'timestamp'),
+        db.Index('ix_person_identification_camera_timestamp', 'camera_id', 'timestamp'),
+    )
     
     identification_id = db.Column(db.Integer, primary_key=True)
     person_name = db.Column(db.String(50), nullable=False)
     timestamp = db.Column(db.DateTime, nullable=False)
     accuracy = db.Column(db.Numeric(5, 2), nullable=False)
-    sensor_id = db.Column(db.Integer, db.ForeignKey('sensor.sensor_id'), nullable=False)
-    camera_id = db.Column(db.Integer, db.ForeignKey('camera.camera_id'), nullable=False)
-    report_id = db.Column(db.Integer, db.ForeignKey('patrol_report.report_id'), nullable=False)
+    sensor_id = db.Column(db.Integer, db.ForeignKey('sensor.sensor_id', ondelete='CASCADE'), nullable=False)
+    camera_id = db.Column(db.Integer, db.ForeignKey('camera.camera_id', ondelete='CASCADE'), nullable=False)
+    report_id = db.Column(db.Integer, db.ForeignKey('patrol_report.report_id', ondelete='CASCADE'), nullable=False)
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
     
-    report = db.relationship('PatrolReport', backref='person_identifications')
+    report = db.relationship('PatrolReport', backref=db.backref(
+        'person_identifications', cascade='all, delete-orphan', passive_deletes=True))
@@ -2,17 +2,25 @@ from auth.domain.models import db
 
 class Robot(db.Model):
     __tablename__ = 'robot'
+    __table_args__ = (
+        db.Index('ix_robot_status_station', 'status', 'station_id'),
+    )
     
     robot_id = db.Column(db.Integer, primary_key=True)
     status = db.Column(db.String(50), nullable=False)
     max_distance = db.Column(db.Integer, nullable=False)
-    operator_id = db.Column(db.Integer, db.ForeignKey('operator.operators_id'), nullable=False)
-    station_id = db.Column(db.Integer, db.ForeignKey('charging_station.station_id'), nullable=False)
+    operator_id = db.Column(db.Integer, db.ForeignKey('operator.operators_id', ondelete='CASCADE'), nullable=False)
+    station_id = db.Column(db.Integer, db.ForeignKey('charging_station.station_id', ondelete='CASCADE'), nullable=False)
     alternative_power_source = db.Column(db.Enum('yes', 'no'), nullable=False)
+    # Оптимістичне блокування: ORM пише version у WHERE кожного UPDATE і збільшує її; це ж ETag для If-Match
+    version = db.Column(db.Integer, nullable=False, server_default='1')
 
-    audio_systems = db.relationship('AudioSystem', backref='robot', cascade='all, delete-orphan')
-    batteries = db.relationship('Battery', backref='robot', cascade='all, delete-orphan')
-    cameras = db.relationship('Camera', backref='robot', cascade='all, delete-orphan')
-    maintenances = db.relationship('RobotMaintenance', back_populates='robot', lazy='dynamic')
-    patrol_routes = db.relationship('PatrolRoute', backref='robot', cascade='all, delete-orphan')
-    sensors = db.relationship('Sensor', backref='robot', cascade='all, delete-orphan')
\ No newline at end of file
+    __mapper_args__ = {'version_id_col': version}
+
+    audio_systems = db.relationship('AudioSystem', backref='robot', cascade='all, delete-orphan', passive_deletes=True)
+    batteries = db.relationship('Battery', backref='robot', cascade='all, delete-orphan', passive_deletes=True)
+    cameras = db.relationship('Camera', backref='robot', cascade='all, delete-orphan', passive_deletes=True)
+    maintenances = db.relationship('RobotMaintenance', back_populates='robot', lazy='dynamic',
+                                   cascade='all, delete-orphan', passive_deletes=True)
+    patrol_routes = db.relationship('PatrolRoute', backref='robot', cascade='all, delete-orphan', passive_deletes=True)
+    sensors = db.relationship('Sensor', backref='robot', cascade='all, delete-orphan', passive_deletes=True)
\ No newline at end of file
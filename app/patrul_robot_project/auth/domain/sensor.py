@@ -2,10 +2,16 @@ from auth.domain.models import db
 
 class Sensor(db.Model):
     __tablename__ = 'sensor'
+    __table_args__ = (
+        db.Index('ix_sensor_trigger_status', 'trigger_status'),
+    )
     
     sensor_id = db.Column(db.Integer, primary_key=True)
-    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id'), nullable=False)
+    robot_id = db.Column(db.Integer, db.ForeignKey('robot.robot_id', ondelete='CASCADE'), nullable=False)
     technology_used = db.Column(db.String(50), nullable=False)
     detection_range = db.Column(db.Integer, nullable=False)
     trigger_status = db.Column(db.String(45), nullable=False)
+    version = db.Column(db.Integer, nullable=False, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
 
@@ -7,4 +7,4 @@ class SolarSystem(db.Model):
     status = db.Column(db.String(45), nullable=False)
     power_output = db.Column(db.Float, nullable=False)
     technology_used = db.Column(db.String(45), nullable=False)
-    station_id = db.Column(db.Integer, db.ForeignKey('charging_station.station_id'), nullable=False)
+    station_id = db.Column(db.Integer, db.ForeignKey('charging_station.station_id', ondelete='CASCADE'), nullable=False)
@@ -0,0 +1,15 @@
+from auth.domain.models import db
+
+class TelemetryRollup(db.Model):
+    __tablename__ = 'telemetry_rollup'
+
+    metric = db.Column(db.String(32), primary_key=True)
+    entity_id = db.Column(db.Integer, primary_key=True)
+    resolution = db.Column(db.Integer, primary_key=True)
+    bucket_start = db.Column(db.DateTime, primary_key=True)
+    sample_count = db.Column(db.Integer, nullable=False)
+    value_sum = db.Column(db.Float, nullable=False)
+    value_min = db.Column(db.Float, nullable=False)
+    value_max = db.Column(db.Float, nullable=False)
+    value_last = db.Column(db.Float, nullable=False)
+    last_time = db.Column(db.DateTime, nullable=False)
@@ -0,0 +1,65 @@
+from flask import Blueprint, jsonify
+from flask_jwt_extended import jwt_required
+from auth.dao.db_pool import db_pool_monitor
+from auth.dao.query_stats import sql_instrumentation
+
+admin_blueprint = Blueprint('admin', __name__, url_prefix='/admin')
+
+
+@admin_blueprint.route('/db_pool', methods=['GET'])
+@jwt_required()
+def get_db_pool():
+    """
+    Connection pool state of this worker process
+    ---
+    tags:
+      - Admin
+    security:
+      - BearerAuth: []
+    responses:
+      200:
+        description: Checked-out, idle and overflow connections and checkout wait-time histogram per engine
+      401:
+        description: Missing or invalid token
+    """
+    return jsonify(db_pool_monitor.stats()), 200
+
+
+@admin_blueprint.route('/sql_report', methods=['GET'])
+@jwt_required()
+def get_sql_report():
+    """
+    Per-endpoint SQL statistics of this worker process
+    ---
+    tags:
+      - Admin
+    security:
+      - BearerAuth: []
+    description: Collected only when SQL_INSTRUMENTATION_ENABLED is set. Endpoints are ordered by total DB time.
+    responses:
+      200:
+        description: Average queries, DB time and loaded rows per endpoint, duplicate statements and likely N+1 statements
+      401:
+        description: Missing or invalid token
+    """
+    return jsonify(sql_instrumentation.report()), 200
+
+
+@admin_blueprint.route('/sql_report', methods=['DELETE'])
+@jwt_required()
+def reset_sql_report():
+    """
+    Clear the SQL statistics of this worker process
+    ---
+    tags:
+      - Admin
+    security:
+      - BearerAuth: []
+    responses:
+      204:
+        description: Statistics cleared
+      401:
+        description: Missing or invalid token
+    """
+    sql_instrumentation.reset()
+    return '', 204
@@ -0,0 +1,58 @@
+from flask import Blueprint, request, jsonify
+from auth.controller.battery_controller import BatteryController
+
+battery_blueprint = Blueprint('battery', __name__)
+
+
+@battery_blueprint.route('/robots/<int:robot_id>/battery', methods=['POST'])
+def add_battery_readings(robot_id):
+    """
+    Ingest battery telemetry for a robot
+    ---
+    tags:
+      - Battery
+    consumes:
+      - application/json
+    parameters:
+      - name: robot_id
+        in: path
+        type: integer
+        required: true
+        description: ID of the robot
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: array
+          items:
+            type: object
+            required:
+              - log_time
+              - battery_level
+              - temperature
+            properties:
+              log_time:
+                type: string
+                description: ISO 8601; stored as UTC, a timestamp with an offset is converted
+                example: "2024-09-19T08:00:00"
+              battery_level:
+                type: integer
+                example: 85
+              temperature:
+                type: string
+                example: "35.5"
+    responses:
+      201:
+        description: Readings inserted
+      202:
+        description: Readings accepted by the write-behind buffer
+      400:
+        description: Invalid input
+      404:
+        description: Robot not found
+      413:
+        description: Too many readings in one request
+    """
+    data = request.json
+    response, status_code = BatteryController.add_readings(robot_id, data)
+    return jsonify(response), status_code
@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
 from auth.controller.camera_controller import CameraController
+from auth.route.conditional import if_match_required, requested_versions, versioned_response
+from auth.route.query_params import requested_dry_run, requested_fields, requested_filters, requested_ids, requested_sort
+from auth.route.streaming import ndjson_response, wants_ndjson
 
 camera_blueprint = Blueprint('camera', __name__)
 
@@ -58,6 +61,56 @@ def add_camera():
     return jsonify(response), status_code
 
 
+@camera_blueprint.route('/cameras/batch', methods=['POST'])
+def apply_camera_batch():
+    """
+    Create, update and delete cameras in one transaction
+    ---
+    tags:
+      - Camera
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - operations
+          properties:
+            operations:
+              type: array
+              description: >
+                Up to 1000 items. create takes data with every field of the create route;
+                update takes id, version and data with the fields to change; delete takes id and version.
+                version is the ETag from GET; a stale one fails the batch with 412
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, delete]
+                  id:
+                    type: integer
+                  version:
+                    type: integer
+                  data:
+                    type: object
+    responses:
+      200:
+        description: Every operation applied; results hold the status and id of each item
+      400:
+        description: Nothing applied; results hold the error of each invalid item
+      409:
+        description: The database rejected the batch and it was rolled back
+      412:
+        description: Nothing applied; a record was changed since the version in its item was read
+    """
+    response, status_code = CameraController.apply_camera_batch(request.get_json(silent=True))
+    return jsonify(response), status_code
+
+
 @camera_blueprint.route('/cameras/<int:camera_id>', methods=['GET'])
 def get_camera(camera_id):
     """
@@ -71,32 +124,137 @@ def get_camera(camera_id):
         required: true
         type: integer
         description: ID of the camera
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if the record has not changed
     responses:
       200:
-        description: Camera data
+        description: Camera data, with its version as the ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown field in fields
       404:
         description: Camera not found
     """
-    response, status_code = CameraController.get_camera(camera_id)
-    return jsonify(response), status_code
+    response, status_code = CameraController.get_camera(camera_id, requested_fields())
+    return versioned_response(response, status_code)
 
 
 @camera_blueprint.route('/cameras', methods=['GET'])
 def get_all_cameras():
     """
     Get all cameras
+
+    Filter with field=value or field__op=value (op: ne, gt, gte, lt, lte, in)
+    on id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view.
     ---
     tags:
       - Camera
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: false
+        description: Comma-separated IDs to fetch in one request instead of a page; the response lists missing IDs
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from next_cursor of the previous page
+      - name: stream
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to stream every record as NDJSON (same as Accept application/x-ndjson)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: Sort by one of id, robot_id; prefix with - for descending, e.g. -robot_id
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
         description: List of all cameras
+      400:
+        description: Unknown field, filter or sort
+    """
+    fields, filters, sort = requested_fields(), requested_filters(), requested_sort()
+    ids = requested_ids()
+    if ids is not None:
+        response, status_code = CameraController.get_cameras_by_ids(ids, fields)
+        return jsonify(response), status_code
+    if wants_ndjson():
+        response, status_code = CameraController.stream_all_cameras(fields, filters, sort)
+        return ndjson_response(response) if status_code == 200 else (jsonify(response), status_code)
+
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after')
+    response, status_code = CameraController.get_all_cameras(limit, after, fields, filters, sort)
+    return jsonify(response), status_code
+
+
+@camera_blueprint.route('/cameras/lookup', methods=['POST'])
+def lookup_cameras():
+    """
+    Get cameras by a list of IDs
+    ---
+    tags:
+      - Camera
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+    responses:
+      200:
+        description: Found records in the order of ids, and the IDs that do not exist
+      400:
+        description: Invalid ids or unknown field in fields
     """
-    response, status_code = CameraController.get_all_cameras()
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    response, status_code = CameraController.get_cameras_by_ids(ids, requested_fields())
     return jsonify(response), status_code
 
 
 @camera_blueprint.route('/cameras/<int:camera_id>', methods=['PUT'])
+@if_match_required
 def update_camera(camera_id):
     """
     Update a camera
@@ -133,18 +291,90 @@ def update_camera(camera_id):
               type: string
               enum: [yes, no]
               example: yes
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
     responses:
       200:
         description: Camera updated successfully
       404:
         description: Camera not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
     data = request.json
-    response, status_code = CameraController.update_camera(camera_id, data)
+    response, status_code = CameraController.update_camera(camera_id, data, requested_versions())
+    return jsonify(response), status_code
+
+
+@camera_blueprint.route('/cameras/<int:camera_id>', methods=['PATCH'])
+@if_match_required
+def patch_camera(camera_id):
+    """
+    Partially update a camera
+    ---
+    tags:
+      - Camera
+    consumes:
+      - application/json
+    parameters:
+      - name: camera_id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        description: Only the fields to change
+        schema:
+          type: object
+          properties:
+            resolution:
+              type: string
+              example: "3840x2160"
+            zoom_level:
+              type: integer
+              example: 10
+            status:
+              type: string
+              example: "inactive"
+            night_vision:
+              type: string
+              enum: [yes, no]
+              example: no
+            panoramic_view:
+              type: string
+              enum: [yes, no]
+              example: yes
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
+    responses:
+      200:
+        description: Updated with a single UPDATE statement
+      400:
+        description: Empty body, unknown field or invalid value
+      404:
+        description: Not found
+      409:
+        description: Rejected by the database, e.g. a missing referenced record
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
+    """
+    response, status_code = CameraController.patch_camera(camera_id, request.get_json(silent=True), requested_versions())
     return jsonify(response), status_code
 
 
 @camera_blueprint.route('/cameras/<int:camera_id>', methods=['DELETE'])
+@if_match_required
 def delete_camera(camera_id):
     """
     Delete a camera
@@ -157,11 +387,25 @@ def delete_camera(camera_id):
         required: true
         type: integer
         description: ID of the camera
+      - name: dry_run
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to only count the rows the delete would remove, per table (cascades included)
+      - name: If-Match
+        in: header
+        type: string
+        required: false
+        description: ETag from GET of this record, required unless dry_run=1; * skips the version check
     responses:
       200:
-        description: Camera deleted successfully
+        description: Camera deleted successfully (or, with dry_run=1, counts per table)
       404:
         description: Camera not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
-    response, status_code = CameraController.delete_camera(camera_id)
+    response, status_code = CameraController.delete_camera(camera_id, requested_dry_run(), requested_versions())
     return jsonify(response), status_code
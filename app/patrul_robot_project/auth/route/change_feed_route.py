@@ -0,0 +1,56 @@
+from flask import Blueprint, request, jsonify
+from auth.controller.change_feed_controller import ChangeFeedController
+from auth.route.query_params import requested_entities
+from flask_jwt_extended import jwt_required
+
+change_feed_blueprint = Blueprint('change_feed', __name__)
+
+
+@change_feed_blueprint.route('/changes', methods=['GET'])
+@jwt_required()
+def get_changes():
+    """
+    Get inserts, updates and deletes of robots, sensors, cameras, operators and charging stations since a version
+    ---
+    tags:
+      - Changes
+    description: >
+      Call without `since` to get the current version, then download the full
+      lists and poll with `since=<next_since>`. Apply items in order: insert and
+      update carry the current state of the record in `data` (null if it was
+      deleted later), delete removes it. Deletes done by ON DELETE CASCADE
+      (e.g. robots of a deleted charging station) are listed too. Keep polling
+      while `has_more` is true. Versions follow commit order: a change that
+      commits later always gets a higher version than every version already
+      returned, so polling from next_since never skips a slow transaction.
+      Requires a JWT, as the feed returns sensor records.
+    parameters:
+      - name: since
+        in: query
+        type: integer
+        required: false
+        description: Version from the previous response (next_since)
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, 100 by default, 500 at most
+      - name: entities
+        in: query
+        type: string
+        required: false
+        description: Comma-separated entity types (robot,sensor,camera,operator,charging_station), all by default
+    responses:
+      200:
+        description: Changes in version order and next_since
+      400:
+        description: Invalid since or unknown entity
+      401:
+        description: Missing or invalid JWT
+    """
+    response, status_code = ChangeFeedController.get_changes(
+        request.args.get('since'),
+        request.args.get('limit', type=int),
+        requested_entities()
+    )
+    return jsonify(response), status_code
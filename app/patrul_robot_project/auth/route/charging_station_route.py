@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
 from auth.controller.charging_station_controller import ChargingStationController
+from auth.route.conditional import if_match_required, requested_versions, versioned_response
+from auth.route.query_params import requested_dry_run, requested_fields, requested_filters, requested_ids, requested_sort
+from auth.route.streaming import ndjson_response, wants_ndjson
 
 charging_station_blueprint = Blueprint('charging_station', __name__)
 
@@ -45,6 +48,56 @@ def add_station():
     return jsonify(response), status_code
 
 
+@charging_station_blueprint.route('/charging_stations/batch', methods=['POST'])
+def apply_station_batch():
+    """
+    Create, update and delete charging stations in one transaction
+    ---
+    tags:
+      - Charging Station
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - operations
+          properties:
+            operations:
+              type: array
+              description: >
+                Up to 1000 items. create takes data with every field of the create route;
+                update takes id, version and data with the fields to change; delete takes id and version.
+                version is the ETag from GET; a stale one fails the batch with 412
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, delete]
+                  id:
+                    type: integer
+                  version:
+                    type: integer
+                  data:
+                    type: object
+    responses:
+      200:
+        description: Every operation applied; results hold the status and id of each item
+      400:
+        description: Nothing applied; results hold the error of each invalid item
+      409:
+        description: The database rejected the batch and it was rolled back
+      412:
+        description: Nothing applied; a record was changed since the version in its item was read
+    """
+    response, status_code = ChargingStationController.apply_station_batch(request.get_json(silent=True))
+    return jsonify(response), status_code
+
+
 @charging_station_blueprint.route('/charging_stations/<int:station_id>', methods=['GET'])
 def get_station(station_id):
     """
@@ -58,32 +111,137 @@ def get_station(station_id):
         required: true
         type: integer
         description: ID of the charging station
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if the record has not changed
     responses:
       200:
-        description: Charging station data
+        description: Charging station data, with its version as the ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown field in fields
       404:
         description: Charging station not found
     """
-    response, status_code = ChargingStationController.get_station(station_id)
-    return jsonify(response), status_code
+    response, status_code = ChargingStationController.get_station(station_id, requested_fields())
+    return versioned_response(response, status_code)
 
 
 @charging_station_blueprint.route('/charging_stations', methods=['GET'])
 def get_all_stations():
     """
     Get all charging stations
+
+    Filter with field=value or field__op=value (op: ne, gt, gte, lt, lte, in)
+    on id, location, capacity, available.
     ---
     tags:
       - Charging Station
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: false
+        description: Comma-separated IDs to fetch in one request instead of a page; the response lists missing IDs
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from next_cursor of the previous page
+      - name: stream
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to stream every record as NDJSON (same as Accept application/x-ndjson)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: Sort by one of id; prefix with - for descending, e.g. -id
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
         description: List of all charging stations
+      400:
+        description: Unknown field, filter or sort
+    """
+    fields, filters, sort = requested_fields(), requested_filters(), requested_sort()
+    ids = requested_ids()
+    if ids is not None:
+        response, status_code = ChargingStationController.get_stations_by_ids(ids, fields)
+        return jsonify(response), status_code
+    if wants_ndjson():
+        response, status_code = ChargingStationController.stream_all_stations(fields, filters, sort)
+        return ndjson_response(response) if status_code == 200 else (jsonify(response), status_code)
+
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after')
+    response, status_code = ChargingStationController.get_all_stations(limit, after, fields, filters, sort)
+    return jsonify(response), status_code
+
+
+@charging_station_blueprint.route('/charging_stations/lookup', methods=['POST'])
+def lookup_stations():
+    """
+    Get charging stations by a list of IDs
+    ---
+    tags:
+      - Charging Station
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+    responses:
+      200:
+        description: Found records in the order of ids, and the IDs that do not exist
+      400:
+        description: Invalid ids or unknown field in fields
     """
-    response, status_code = ChargingStationController.get_all_stations()
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    response, status_code = ChargingStationController.get_stations_by_ids(ids, requested_fields())
     return jsonify(response), status_code
 
 
 @charging_station_blueprint.route('/charging_stations/<int:station_id>', methods=['PUT'])
+@if_match_required
 def update_station(station_id):
     """
     Update a charging station
@@ -113,18 +271,83 @@ def update_station(station_id):
               type: string
               enum: ["yes", "no"]
               example: "no"
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
     responses:
       200:
         description: Charging station updated successfully
       404:
         description: Charging station not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
     data = request.json
-    response, status_code = ChargingStationController.update_station(station_id, data)
+    response, status_code = ChargingStationController.update_station(station_id, data, requested_versions())
+    return jsonify(response), status_code
+
+
+@charging_station_blueprint.route('/charging_stations/<int:station_id>', methods=['PATCH'])
+@if_match_required
+def patch_station(station_id):
+    """
+    Partially update a charging station
+    ---
+    tags:
+      - Charging Station
+    consumes:
+      - application/json
+    parameters:
+      - name: station_id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        description: Only the fields to change
+        schema:
+          type: object
+          properties:
+            location:
+              type: string
+              example: "Sector B - Dock 1"
+            capacity:
+              type: integer
+              example: 6
+            available:
+              type: string
+              enum: ["yes", "no"]
+              example: "no"
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
+    responses:
+      200:
+        description: Updated with a single UPDATE statement
+      400:
+        description: Empty body, unknown field or invalid value
+      404:
+        description: Not found
+      409:
+        description: Rejected by the database, e.g. a missing referenced record
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
+    """
+    response, status_code = ChargingStationController.patch_station(station_id, request.get_json(silent=True), requested_versions())
     return jsonify(response), status_code
 
 
 @charging_station_blueprint.route('/charging_stations/<int:station_id>', methods=['DELETE'])
+@if_match_required
 def delete_station(station_id):
     """
     Delete a charging station
@@ -137,13 +360,27 @@ def delete_station(station_id):
         required: true
         type: integer
         description: ID of the charging station
+      - name: dry_run
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to only count the rows the delete would remove, per table (cascades included)
+      - name: If-Match
+        in: header
+        type: string
+        required: false
+        description: ETag from GET of this record, required unless dry_run=1; * skips the version check
     responses:
       200:
-        description: Charging station deleted successfully
+        description: Charging station deleted successfully (or, with dry_run=1, counts per table)
       404:
         description: Charging station not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
-    response, status_code = ChargingStationController.delete_station(station_id)
+    response, status_code = ChargingStationController.delete_station(station_id, requested_dry_run(), requested_versions())
     return jsonify(response), status_code
 
 
@@ -154,9 +391,22 @@ def get_charging_stations_with_robots():
     ---
     tags:
       - Charging Station
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor from next_cursor of the previous page
     responses:
       200:
-        description: List of charging stations and their robots
+        description: Page of charging stations with their robots and next_cursor for the following page
     """
-    response, status_code = ChargingStationController.get_charging_stations_with_robots()
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after', type=int)
+    response, status_code = ChargingStationController.get_charging_stations_with_robots(limit, after)
     return jsonify(response), status_code
\ No newline at end of file
@@ -0,0 +1,59 @@
+from functools import wraps
+
+from flask import jsonify, request
+
+from auth.route.query_params import requested_dry_run
+
+
+def etag_response(payload, status_code=200):
+    """
+    JSON-відповідь з ETag за вмістом тіла.
+
+    Якщо If-None-Match клієнта збігається, make_conditional віддає 304 без
+    тіла. no-cache змушує клієнта перевіряти ETag при кожному запиті, тож
+    застарілий стан робота не показується.
+    """
+    response = jsonify(payload)
+    response.status_code = status_code
+    if status_code != 200:
+        return response
+    response.add_etag()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def versioned_response(payload, status_code=200):
+    """
+    JSON-відповідь запису з ETag за його колонкою version.
+
+    Той самий ETag клієнт надсилає в If-Match на PUT/PATCH/DELETE. Без
+    version у тілі (?fields= без неї) ETag не ставиться.
+    """
+    response = jsonify(payload)
+    response.status_code = status_code
+    if status_code != 200 or 'version' not in payload:
+        return response
+    response.set_etag(str(payload['version']))
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def requested_versions():
+    """Версії з If-Match; None для If-Match: *, коли підходить будь-яка."""
+    if request.if_match.star_tag:
+        return None
+    return {int(tag) for tag in request.if_match.as_set() if tag.isdigit()}
+
+
+def if_match_required(view):
+    """
+    Без If-Match зміна запису відхиляється з 428: клієнт, що не читав
+    версію, інакше тихо перезаписав би чужі зміни. DELETE з ?dry_run=1
+    нічого не змінює, тож йому заголовок не потрібен.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if 'If-Match' not in request.headers and not (request.method == 'DELETE' and requested_dry_run()):
+            return jsonify({'error': 'If-Match header with the ETag from GET is required'}), 428
+        return view(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,24 @@
+from flask import Blueprint, jsonify
+from auth.controller.fleet_controller import FleetController
+
+fleet_blueprint = Blueprint('fleet', __name__)
+
+
+@fleet_blueprint.route('/fleet/summary', methods=['GET'])
+def get_fleet_summary():
+    """
+    Get fleet-wide counters for dashboards
+    ---
+    tags:
+      - Fleet
+    description: >
+      Robots by status and by station, station utilization (robots / capacity),
+      sensors by trigger_status and cameras by status. Every counter comes from
+      a GROUP BY query; the result is cached on the server for
+      FLEET_SUMMARY_CACHE_TTL seconds, so generated_at may lag behind writes.
+    responses:
+      200:
+        description: Fleet summary
+    """
+    response, status_code = FleetController.get_fleet_summary()
+    return jsonify(response), status_code
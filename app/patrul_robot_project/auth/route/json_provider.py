@@ -0,0 +1,84 @@
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson не обов'язковий
+    orjson = None
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+TIME_FORMAT = '%H:%M:%S'
+
+
+def encode_value(value):
+    """Єдине кодування типів, яких немає в JSON. datetime перевіряється раніше за date."""
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, time):
+        return value.strftime(TIME_FORMAT)
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        # Рядок, як і раніше в jsonify: без втрати точності Numeric
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    return DefaultJSONProvider.default(value)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    JSON-провайдер для app.json: orjson, якщо встановлений, інакше стандартний json.
+
+    Обидва шляхи кодують datetime, time, date, Decimal і Enum через encode_value,
+    тож контролери віддають значення моделей як є. Відповідь з orjson
+    збирається одразу в bytes без проміжного str.
+    """
+
+    default = staticmethod(encode_value)
+    use_orjson = orjson is not None
+
+    def _orjson_option(self, pretty=False):
+        # Дати віддаються в encode_value, щоб формат не залежав від кодувальника
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def _orjson_dumps(self, obj, pretty=False):
+        try:
+            return orjson.dumps(obj, default=encode_value, option=self._orjson_option(pretty))
+        except TypeError:
+            # Те, чого orjson не вміє (напр. цілі понад 64 біти), кодує стандартний json
+            return None
+
+    def dumps(self, obj, **kwargs):
+        if self.use_orjson and not kwargs:
+            encoded = self._orjson_dumps(obj)
+            if encoded is not None:
+                return encoded.decode()
+        kwargs.setdefault('default', self.default)
+        kwargs.setdefault('ensure_ascii', self.ensure_ascii)
+        kwargs.setdefault('sort_keys', self.sort_keys)
+        return json.dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        if self.use_orjson and not kwargs:
+            return orjson.loads(s)
+        return json.loads(s, **kwargs)
+
+    def response(self, *args, **kwargs):
+        if not self.use_orjson:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = (self.compact is None and self._app.debug) or self.compact is False
+        encoded = self._orjson_dumps(obj, pretty)
+        if encoded is None:
+            return super().response(obj)
+        return self._app.response_class(encoded + b'\n', mimetype=self.mimetype)
@@ -0,0 +1,22 @@
+from flask import Blueprint, jsonify
+from auth.dao.entity_cache import entity_cache
+from auth.dao.fleet_dao import fleet_summary_cache
+
+metrics_blueprint = Blueprint('metrics', __name__)
+
+
+@metrics_blueprint.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Runtime counters of this worker process
+    ---
+    tags:
+      - Metrics
+    responses:
+      200:
+        description: Entity cache and fleet summary cache hit/miss counters and size
+    """
+    return jsonify({
+        'entity_cache': entity_cache.stats(),
+        'fleet_summary_cache': fleet_summary_cache.stats()
+    }), 200
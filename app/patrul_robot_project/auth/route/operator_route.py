@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
 from auth.controller.operator_controller import OperatorController
+from auth.route.conditional import if_match_required, requested_versions, versioned_response
+from auth.route.query_params import requested_dry_run, requested_fields, requested_filters, requested_ids, requested_sort
+from auth.route.streaming import ndjson_response, wants_ndjson
 
 operator_blueprint = Blueprint('operator', __name__)
 
@@ -50,6 +53,56 @@ def add_operator():
     return jsonify(response), status_code
 
 
+@operator_blueprint.route('/operators/batch', methods=['POST'])
+def apply_operator_batch():
+    """
+    Create, update and delete operators in one transaction
+    ---
+    tags:
+      - Operator
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - operations
+          properties:
+            operations:
+              type: array
+              description: >
+                Up to 1000 items. create takes data with every field of the create route;
+                update takes id, version and data with the fields to change; delete takes id and version.
+                version is the ETag from GET; a stale one fails the batch with 412
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, delete]
+                  id:
+                    type: integer
+                  version:
+                    type: integer
+                  data:
+                    type: object
+    responses:
+      200:
+        description: Every operation applied; results hold the status and id of each item
+      400:
+        description: Nothing applied; results hold the error of each invalid item
+      409:
+        description: The database rejected the batch and it was rolled back
+      412:
+        description: Nothing applied; a record was changed since the version in its item was read
+    """
+    response, status_code = OperatorController.apply_operator_batch(request.get_json(silent=True))
+    return jsonify(response), status_code
+
+
 @operator_blueprint.route('/operators/<int:operator_id>', methods=['GET'])
 def get_operator(operator_id):
     """
@@ -63,32 +116,137 @@ def get_operator(operator_id):
         required: true
         type: integer
         description: ID of the operator
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if the record has not changed
     responses:
       200:
-        description: Operator data
+        description: Operator data, with its version as the ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown field in fields
       404:
         description: Operator not found
     """
-    response, status_code = OperatorController.get_operator(operator_id)
-    return jsonify(response), status_code
+    response, status_code = OperatorController.get_operator(operator_id, requested_fields())
+    return versioned_response(response, status_code)
 
 
 @operator_blueprint.route('/operators', methods=['GET'])
 def get_all_operators():
     """
     Get all operators
+
+    Filter with field=value or field__op=value (op: ne, gt, gte, lt, lte, in)
+    on id, name, shift_start, shift_end.
     ---
     tags:
       - Operator
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: false
+        description: Comma-separated IDs to fetch in one request instead of a page; the response lists missing IDs
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from next_cursor of the previous page
+      - name: stream
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to stream every record as NDJSON (same as Accept application/x-ndjson)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: Sort by one of id; prefix with - for descending, e.g. -id
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
         description: List of all operators with their details
+      400:
+        description: Unknown field, filter or sort
+    """
+    fields, filters, sort = requested_fields(), requested_filters(), requested_sort()
+    ids = requested_ids()
+    if ids is not None:
+        response, status_code = OperatorController.get_operators_by_ids(ids, fields)
+        return jsonify(response), status_code
+    if wants_ndjson():
+        response, status_code = OperatorController.stream_all_operators(fields, filters, sort)
+        return ndjson_response(response) if status_code == 200 else (jsonify(response), status_code)
+
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after')
+    response, status_code = OperatorController.get_all_operators(limit, after, fields, filters, sort)
+    return jsonify(response), status_code
+
+
+@operator_blueprint.route('/operators/lookup', methods=['POST'])
+def lookup_operators():
+    """
+    Get operators by a list of IDs
+    ---
+    tags:
+      - Operator
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+    responses:
+      200:
+        description: Found records in the order of ids, and the IDs that do not exist
+      400:
+        description: Invalid ids or unknown field in fields
     """
-    response, status_code = OperatorController.get_all_operators()
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    response, status_code = OperatorController.get_operators_by_ids(ids, requested_fields())
     return jsonify(response), status_code
 
 
 @operator_blueprint.route('/operators/<int:operator_id>', methods=['PUT'])
+@if_match_required
 def update_operator(operator_id):
     """
     Update an operator
@@ -122,18 +280,87 @@ def update_operator(operator_id):
             contact_info:
               type: string
               example: "+380671234567"
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
     responses:
       200:
         description: Operator updated successfully
       404:
         description: Operator not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
     data = request.json
-    response, status_code = OperatorController.update_operator(operator_id, data)
+    response, status_code = OperatorController.update_operator(operator_id, data, requested_versions())
+    return jsonify(response), status_code
+
+
+@operator_blueprint.route('/operators/<int:operator_id>', methods=['PATCH'])
+@if_match_required
+def patch_operator(operator_id):
+    """
+    Partially update an operator
+    ---
+    tags:
+      - Operator
+    consumes:
+      - application/json
+    parameters:
+      - name: operator_id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        description: Only the fields to change
+        schema:
+          type: object
+          properties:
+            name:
+              type: string
+              example: Jane Doe
+            shift_start:
+              type: string
+              format: time
+              example: "09:00:00"
+            shift_end:
+              type: string
+              format: time
+              example: "17:00:00"
+            contact_info:
+              type: string
+              example: "+380671234567"
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
+    responses:
+      200:
+        description: Updated with a single UPDATE statement
+      400:
+        description: Empty body, unknown field or invalid value
+      404:
+        description: Not found
+      409:
+        description: Rejected by the database, e.g. a missing referenced record
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
+    """
+    response, status_code = OperatorController.patch_operator(operator_id, request.get_json(silent=True), requested_versions())
     return jsonify(response), status_code
 
 
 @operator_blueprint.route('/operators/<int:operator_id>', methods=['DELETE'])
+@if_match_required
 def delete_operator(operator_id):
     """
     Delete an operator
@@ -146,13 +373,27 @@ def delete_operator(operator_id):
         required: true
         type: integer
         description: ID of the operator
+      - name: dry_run
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to only count the rows the delete would remove, per table (cascades included)
+      - name: If-Match
+        in: header
+        type: string
+        required: false
+        description: ETag from GET of this record, required unless dry_run=1; * skips the version check
     responses:
       200:
-        description: Operator deleted successfully
+        description: Operator deleted successfully (or, with dry_run=1, counts per table)
       404:
         description: Operator not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
-    response, status_code = OperatorController.delete_operator(operator_id)
+    response, status_code = OperatorController.delete_operator(operator_id, requested_dry_run(), requested_versions())
     return jsonify(response), status_code
 
 
@@ -163,9 +404,22 @@ def get_operators_with_robots():
     ---
     tags:
       - Operator
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor from next_cursor of the previous page
     responses:
       200:
-        description: List of operators with their robots, including shift details and contact info
+        description: Page of operators with their robots, shift details and contact info, and next_cursor for the following page
     """
-    response, status_code = OperatorController.get_operators_with_robots()
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after', type=int)
+    response, status_code = OperatorController.get_operators_with_robots(limit, after)
     return jsonify(response), status_code
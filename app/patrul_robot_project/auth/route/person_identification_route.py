@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
 from auth.controller.person_identification_controller import PersonIdentificationController
+from auth.route.conditional import if_match_required, requested_versions, versioned_response
+from auth.route.query_params import requested_dry_run, requested_fields, requested_filters, requested_ids, requested_sort
+from auth.route.streaming import ndjson_response, wants_ndjson
 
 person_identification_blueprint = Blueprint('person_identification', __name__)
 
@@ -58,6 +61,56 @@ def add_identification():
     return jsonify(response), status_code
 
 
+@person_identification_blueprint.route('/person_identifications/batch', methods=['POST'])
+def apply_identification_batch():
+    """
+    Create, update and delete person identification records in one transaction
+    ---
+    tags:
+      - Person Identification
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - operations
+          properties:
+            operations:
+              type: array
+              description: >
+                Up to 1000 items. create takes data with every field of the create route;
+                update takes id, version and data with the fields to change; delete takes id and version.
+                version is the ETag from GET; a stale one fails the batch with 412
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, delete]
+                  id:
+                    type: integer
+                  version:
+                    type: integer
+                  data:
+                    type: object
+    responses:
+      200:
+        description: Every operation applied; results hold the status and id of each item
+      400:
+        description: Nothing applied; results hold the error of each invalid item
+      409:
+        description: The database rejected the batch and it was rolled back
+      412:
+        description: Nothing applied; a record was changed since the version in its item was read
+    """
+    response, status_code = PersonIdentificationController.apply_identification_batch(request.get_json(silent=True))
+    return jsonify(response), status_code
+
+
 @person_identification_blueprint.route('/person_identifications/<int:identification_id>', methods=['GET'])
 def get_identification(identification_id):
     """
@@ -71,32 +124,138 @@ def get_identification(identification_id):
         required: true
         type: integer
         description: ID of the person identification record
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if the record has not changed
     responses:
       200:
-        description: Person identification record data
+        description: Person identification record data, with its version as the ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown field in fields
       404:
         description: Person identification record not found
     """
-    response, status_code = PersonIdentificationController.get_identification(identification_id)
-    return jsonify(response), status_code
+    response, status_code = PersonIdentificationController.get_identification(identification_id, requested_fields())
+    return versioned_response(response, status_code)
 
 
 @person_identification_blueprint.route('/person_identifications', methods=['GET'])
 def get_all_identifications():
     """
     Get all person identification records
+
+    Filter with field=value or field__op=value (op: ne, gt, gte, lt, lte, in)
+    on id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id.
+    Filters on non-indexed columns must be combined with one on id, timestamp, sensor_id, camera_id, report_id.
     ---
     tags:
       - Person Identification
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: false
+        description: Comma-separated IDs to fetch in one request instead of a page; the response lists missing IDs
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from next_cursor of the previous page
+      - name: stream
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to stream every record as NDJSON (same as Accept application/x-ndjson)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: Sort by one of id, timestamp; prefix with - for descending, e.g. -timestamp
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
         description: List of all person identifications
+      400:
+        description: Unknown field, filter or sort, or a filter that would scan the whole table
+    """
+    fields, filters, sort = requested_fields(), requested_filters(), requested_sort()
+    ids = requested_ids()
+    if ids is not None:
+        response, status_code = PersonIdentificationController.get_identifications_by_ids(ids, fields)
+        return jsonify(response), status_code
+    if wants_ndjson():
+        response, status_code = PersonIdentificationController.stream_all_identifications(fields, filters, sort)
+        return ndjson_response(response) if status_code == 200 else (jsonify(response), status_code)
+
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after')
+    response, status_code = PersonIdentificationController.get_all_identifications(limit, after, fields, filters, sort)
+    return jsonify(response), status_code
+
+
+@person_identification_blueprint.route('/person_identifications/lookup', methods=['POST'])
+def lookup_identifications():
+    """
+    Get person identification records by a list of IDs
+    ---
+    tags:
+      - Person Identification
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+    responses:
+      200:
+        description: Found records in the order of ids, and the IDs that do not exist
+      400:
+        description: Invalid ids or unknown field in fields
     """
-    response, status_code = PersonIdentificationController.get_all_identifications()
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    response, status_code = PersonIdentificationController.get_identifications_by_ids(ids, requested_fields())
     return jsonify(response), status_code
 
 
 @person_identification_blueprint.route('/person_identifications/<int:identification_id>', methods=['PUT'])
+@if_match_required
 def update_identification(identification_id):
     """
     Update a person identification record
@@ -136,18 +295,93 @@ def update_identification(identification_id):
             report_id:
               type: integer
               example: 3
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
     responses:
       200:
         description: Person identification record updated successfully
       404:
         description: Person identification record not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
     data = request.json
-    response, status_code = PersonIdentificationController.update_identification(identification_id, data)
+    response, status_code = PersonIdentificationController.update_identification(identification_id, data, requested_versions())
+    return jsonify(response), status_code
+
+
+@person_identification_blueprint.route('/person_identifications/<int:identification_id>', methods=['PATCH'])
+@if_match_required
+def patch_identification(identification_id):
+    """
+    Partially update a person identification record
+    ---
+    tags:
+      - Person Identification
+    consumes:
+      - application/json
+    parameters:
+      - name: identification_id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        description: Only the fields to change
+        schema:
+          type: object
+          properties:
+            person_name:
+              type: string
+              example: "Jane Smith"
+            timestamp:
+              type: string
+              format: date-time
+              example: "2025-11-01T09:15:00"
+            accuracy:
+              type: number
+              format: float
+              example: 95.40
+            sensor_id:
+              type: integer
+              example: 1
+            camera_id:
+              type: integer
+              example: 2
+            report_id:
+              type: integer
+              example: 3
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
+    responses:
+      200:
+        description: Updated with a single UPDATE statement
+      400:
+        description: Empty body, unknown field or invalid value
+      404:
+        description: Not found
+      409:
+        description: Rejected by the database, e.g. a missing referenced record
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
+    """
+    response, status_code = PersonIdentificationController.patch_identification(identification_id, request.get_json(silent=True), requested_versions())
     return jsonify(response), status_code
 
 
 @person_identification_blueprint.route('/person_identifications/<int:identification_id>', methods=['DELETE'])
+@if_match_required
 def delete_identification(identification_id):
     """
     Delete a person identification record
@@ -160,13 +394,27 @@ def delete_identification(identification_id):
         required: true
         type: integer
         description: ID of the person identification record
+      - name: dry_run
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to only count the rows the delete would remove, per table (cascades included)
+      - name: If-Match
+        in: header
+        type: string
+        required: false
+        description: ETag from GET of this record, required unless dry_run=1; * skips the version check
     responses:
       200:
-        description: Person identification record deleted successfully
+        description: Person identification record deleted successfully (or, with dry_run=1, counts per table)
       404:
         description: Person identification record not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
-    response, status_code = PersonIdentificationController.delete_identification(identification_id)
+    response, status_code = PersonIdentificationController.delete_identification(identification_id, requested_dry_run(), requested_versions())
     return jsonify(response), status_code
 
 
@@ -177,9 +425,22 @@ def get_person_identifications_with_reports():
     ---
     tags:
       - Person Identification
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor from next_cursor of the previous page
     responses:
       200:
-        description: List of person identifications with related reports
+        description: Page of person identifications with related reports and next_cursor for the following page
     """
-    response, status_code = PersonIdentificationController.get_person_identifications_with_reports()
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after', type=int)
+    response, status_code = PersonIdentificationController.get_person_identifications_with_reports(limit, after)
     return jsonify(response), status_code
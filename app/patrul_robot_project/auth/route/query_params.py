@@ -0,0 +1,46 @@
+from flask import request
+
+# Службові параметри списків; решта query string — фільтри
+LIST_PARAMS = frozenset({'limit', 'after', 'stream', 'fields', 'sort', 'ids'})
+
+
+def _csv_param(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def requested_fields():
+    """Список полів з `?fields=id,status` або None, якщо параметр не задано."""
+    return _csv_param('fields')
+
+
+def requested_ids():
+    """Ключі з `?ids=1,2,3` або None, якщо параметр не задано; перевіряє їх parse_ids у DAO."""
+    return _csv_param('ids')
+
+
+def requested_include():
+    """Зв'язки з `?include=sensors,latest_battery` або None, якщо параметр не задано."""
+    return _csv_param('include')
+
+
+def requested_entities():
+    """Типи сутностей з `?entities=robot,sensor` або None, якщо параметр не задано."""
+    return _csv_param('entities')
+
+
+def requested_filters():
+    """Фільтри з `?status=active&accuracy__gte=0.9` як {'status': 'active', 'accuracy__gte': '0.9'}."""
+    return {key: value for key, value in request.args.items() if key not in LIST_PARAMS}
+
+
+def requested_sort():
+    """Значення `?sort=-timestamp` або None."""
+    return request.args.get('sort') or None
+
+
+def requested_dry_run():
+    """Чи запросив клієнт `?dry_run=1`: лише порахувати, що буде змінено, нічого не змінюючи."""
+    return request.args.get('dry_run') in ('1', 'true')
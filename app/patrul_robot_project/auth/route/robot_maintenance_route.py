@@ -33,11 +33,24 @@ def get_all_maintenances_with_robots():
     ---
     tags:
       - Robot Maintenance
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor from next_cursor of the previous page
     responses:
       200:
-        description: List of maintenance records with related robots
+        description: Page of maintenance records with related robots and next_cursor for the following page
     """
-    response, status_code = RobotMaintenanceController.get_all_maintenances_with_robots()
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after', type=int)
+    response, status_code = RobotMaintenanceController.get_all_maintenances_with_robots(limit, after)
     return jsonify(response), status_code
 
 
@@ -1,5 +1,9 @@
 from flask import Blueprint, request, jsonify
 from auth.controller.robot_controller import RobotController
+from auth.route.conditional import etag_response, if_match_required, requested_versions, versioned_response
+from auth.route.query_params import requested_dry_run, requested_fields, requested_filters, requested_ids, requested_include, requested_sort
+from auth.route.streaming import ndjson_response, wants_ndjson
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
 
 robot_blueprint = Blueprint('robot', __name__)
 
@@ -53,6 +57,56 @@ def add_robot():
     return jsonify(response), status_code
 
 
+@robot_blueprint.route('/robots/batch', methods=['POST'])
+def apply_robot_batch():
+    """
+    Create, update and delete robots in one transaction
+    ---
+    tags:
+      - Robot
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - operations
+          properties:
+            operations:
+              type: array
+              description: >
+                Up to 1000 items. create takes data with every field of the create route;
+                update takes id, version and data with the fields to change; delete takes id and version.
+                version is the ETag from GET; a stale one fails the batch with 412
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, delete]
+                  id:
+                    type: integer
+                  version:
+                    type: integer
+                  data:
+                    type: object
+    responses:
+      200:
+        description: Every operation applied; results hold the status and id of each item
+      400:
+        description: Nothing applied; results hold the error of each invalid item
+      409:
+        description: The database rejected the batch and it was rolled back
+      412:
+        description: Nothing applied; a record was changed since the version in its item was read
+    """
+    response, status_code = RobotController.apply_robot_batch(request.get_json(silent=True))
+    return jsonify(response), status_code
+
+
 @robot_blueprint.route('/robots/<int:robot_id>', methods=['GET'])
 def get_robot(robot_id):
     """
@@ -66,32 +120,186 @@ def get_robot(robot_id):
         type: integer
         required: true
         description: ID of the robot
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if the record has not changed
     responses:
       200:
-        description: Robot data
+        description: Robot data, with its version as the ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown field in fields
       404:
         description: Robot not found
     """
-    response, status_code = RobotController.get_robot(robot_id)
-    return jsonify(response), status_code
+    response, status_code = RobotController.get_robot(robot_id, requested_fields())
+    return versioned_response(response, status_code)
+
+
+@robot_blueprint.route('/robots/<int:robot_id>/full', methods=['GET'])
+def get_robot_full(robot_id):
+    """
+    Get a robot with its related records in one response
+    ---
+    tags:
+      - Robot
+    parameters:
+      - name: robot_id
+        in: path
+        type: integer
+        required: true
+        description: ID of the robot
+      - name: include
+        in: query
+        type: string
+        required: false
+        description: >
+          Comma-separated relations to load: sensors, cameras, audio_systems, routes,
+          maintenances, latest_battery, station. All of them when omitted.
+          sensors need a JWT, as on /sensors: without one they are left out of the
+          default set, and asking for them explicitly returns 401
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if nothing changed
+    responses:
+      200:
+        description: Robot with the requested relations, with an ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown relation in include
+      401:
+        description: sensors requested without a valid JWT
+      404:
+        description: Robot not found
+    """
+    verify_jwt_in_request(optional=True)
+    response, status_code = RobotController.get_robot_full(
+        robot_id, requested_include(), authenticated=get_jwt_identity() is not None
+    )
+    response = etag_response(response, status_code)
+    # Тіло залежить від токена, тож кеші мають розрізняти відповіді за ним
+    response.vary.add('Authorization')
+    return response
 
 
 @robot_blueprint.route('/robots', methods=['GET'])
 def get_all_robots():
     """
     Get all robots
+
+    Filter with field=value or field__op=value (op: ne, gt, gte, lt, lte, in)
+    on id, status, max_distance, operator_id, station_id, alternative_power_source.
     ---
     tags:
       - Robot
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: false
+        description: Comma-separated IDs to fetch in one request instead of a page; the response lists missing IDs
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from next_cursor of the previous page
+      - name: stream
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to stream every record as NDJSON (same as Accept application/x-ndjson)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: Sort by one of id, status, operator_id, station_id; prefix with - for descending, e.g. -station_id
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
         description: List of robots
+      400:
+        description: Unknown field, filter or sort
     """
-    response, status_code = RobotController.get_all_robots()
+    fields, filters, sort = requested_fields(), requested_filters(), requested_sort()
+    ids = requested_ids()
+    if ids is not None:
+        response, status_code = RobotController.get_robots_by_ids(ids, fields)
+        return jsonify(response), status_code
+    if wants_ndjson():
+        response, status_code = RobotController.stream_all_robots(fields, filters, sort)
+        return ndjson_response(response) if status_code == 200 else (jsonify(response), status_code)
+
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after')
+    response, status_code = RobotController.get_all_robots(limit, after, fields, filters, sort)
+    return jsonify(response), status_code
+
+
+@robot_blueprint.route('/robots/lookup', methods=['POST'])
+def lookup_robots():
+    """
+    Get robots by a list of IDs
+    ---
+    tags:
+      - Robot
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+    responses:
+      200:
+        description: Found records in the order of ids, and the IDs that do not exist
+      400:
+        description: Invalid ids or unknown field in fields
+    """
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    response, status_code = RobotController.get_robots_by_ids(ids, requested_fields())
     return jsonify(response), status_code
 
 
 @robot_blueprint.route('/robots/<int:robot_id>', methods=['PUT'])
+@if_match_required
 def update_robot(robot_id):
     """
     Update a robot
@@ -127,18 +335,89 @@ def update_robot(robot_id):
               type: string
               enum: [yes, no]
               example: no
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
     responses:
       200:
         description: Robot updated successfully
       404:
         description: Robot not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
     data = request.json
-    response, status_code = RobotController.update_robot(robot_id, data)
+    response, status_code = RobotController.update_robot(robot_id, data, requested_versions())
+    return jsonify(response), status_code
+
+
+@robot_blueprint.route('/robots/<int:robot_id>', methods=['PATCH'])
+@if_match_required
+def patch_robot(robot_id):
+    """
+    Partially update a robot
+    ---
+    tags:
+      - Robot
+    consumes:
+      - application/json
+    parameters:
+      - name: robot_id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        description: Only the fields to change
+        schema:
+          type: object
+          properties:
+            status:
+              type: string
+              example: inactive
+            max_distance:
+              type: integer
+              example: 120
+            operator_id:
+              type: integer
+              example: 1
+            station_id:
+              type: integer
+              example: 2
+            alternative_power_source:
+              type: string
+              enum: [yes, no]
+              example: no
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
+    responses:
+      200:
+        description: Updated with a single UPDATE statement
+      400:
+        description: Empty body, unknown field or invalid value
+      404:
+        description: Not found
+      409:
+        description: Rejected by the database, e.g. a missing referenced record
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
+    """
+    response, status_code = RobotController.patch_robot(robot_id, request.get_json(silent=True), requested_versions())
     return jsonify(response), status_code
 
 
 @robot_blueprint.route('/robots/<int:robot_id>', methods=['DELETE'])
+@if_match_required
 def delete_robot(robot_id):
     """
     Delete a robot
@@ -151,11 +430,25 @@ def delete_robot(robot_id):
         type: integer
         required: true
         description: ID of the robot
+      - name: dry_run
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to only count the rows the delete would remove, per table (cascades included)
+      - name: If-Match
+        in: header
+        type: string
+        required: false
+        description: ETag from GET of this record, required unless dry_run=1; * skips the version check
     responses:
       200:
-        description: Robot deleted successfully
+        description: Robot deleted successfully (or, with dry_run=1, counts per table)
       404:
         description: Robot not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
-    response, status_code = RobotController.delete_robot(robot_id)
+    response, status_code = RobotController.delete_robot(robot_id, requested_dry_run(), requested_versions())
     return jsonify(response), status_code
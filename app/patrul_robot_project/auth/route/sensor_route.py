@@ -1,5 +1,8 @@
 from flask import Blueprint, request, jsonify
 from auth.controller.sensor_controller import SensorController
+from auth.route.conditional import if_match_required, requested_versions, versioned_response
+from auth.route.query_params import requested_dry_run, requested_fields, requested_filters, requested_ids, requested_sort
+from auth.route.streaming import ndjson_response, wants_ndjson
 from flask_jwt_extended import jwt_required
 
 sensor_blueprint = Blueprint('sensor', __name__)
@@ -51,6 +54,59 @@ def add_sensor():
     return jsonify(response), status_code
 
 
+@sensor_blueprint.route('/sensors/batch', methods=['POST'])
+@jwt_required()
+def apply_sensor_batch():
+    """
+    Create, update and delete sensors in one transaction
+    ---
+    tags:
+      - Sensor
+    security:
+      - BearerAuth: []
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - operations
+          properties:
+            operations:
+              type: array
+              description: >
+                Up to 1000 items. create takes data with every field of the create route;
+                update takes id, version and data with the fields to change; delete takes id and version.
+                version is the ETag from GET; a stale one fails the batch with 412
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    enum: [create, update, delete]
+                  id:
+                    type: integer
+                  version:
+                    type: integer
+                  data:
+                    type: object
+    responses:
+      200:
+        description: Every operation applied; results hold the status and id of each item
+      400:
+        description: Nothing applied; results hold the error of each invalid item
+      409:
+        description: The database rejected the batch and it was rolled back
+      412:
+        description: Nothing applied; a record was changed since the version in its item was read
+    """
+    response, status_code = SensorController.apply_sensor_batch(request.get_json(silent=True))
+    return jsonify(response), status_code
+
+
 @sensor_blueprint.route('/sensors/<int:sensor_id>', methods=['GET'])
 @jwt_required()
 def get_sensor(sensor_id):
@@ -67,14 +123,28 @@ def get_sensor(sensor_id):
         required: true
         type: integer
         description: ID of the sensor
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: If-None-Match
+        in: header
+        type: string
+        required: false
+        description: ETag of a previous response; 304 is returned if the record has not changed
     responses:
       200:
-        description: Sensor data
+        description: Sensor data, with its version as the ETag header
+      304:
+        description: Not modified since the ETag in If-None-Match
+      400:
+        description: Unknown field in fields
       404:
         description: Sensor not found
     """
-    response, status_code = SensorController.get_sensor(sensor_id)
-    return jsonify(response), status_code
+    response, status_code = SensorController.get_sensor(sensor_id, requested_fields())
+    return versioned_response(response, status_code)
 
 
 @sensor_blueprint.route('/sensors', methods=['GET'])
@@ -82,21 +152,115 @@ def get_sensor(sensor_id):
 def get_all_sensors():
     """
     Get all sensors
+
+    Filter with field=value or field__op=value (op: ne, gt, gte, lt, lte, in)
+    on id, robot_id, technology_used, detection_range, trigger_status.
     ---
     tags:
       - Sensor
     security:
       - BearerAuth: []
+    parameters:
+      - name: ids
+        in: query
+        type: string
+        required: false
+        description: Comma-separated IDs to fetch in one request instead of a page; the response lists missing IDs
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: string
+        required: false
+        description: Cursor from next_cursor of the previous page
+      - name: stream
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to stream every record as NDJSON (same as Accept application/x-ndjson)
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+      - name: sort
+        in: query
+        type: string
+        required: false
+        description: Sort by one of id, robot_id; prefix with - for descending, e.g. -robot_id
+    produces:
+      - application/json
+      - application/x-ndjson
     responses:
       200:
         description: List of all sensors
+      400:
+        description: Unknown field, filter or sort
     """
-    response, status_code = SensorController.get_all_sensors()
+    fields, filters, sort = requested_fields(), requested_filters(), requested_sort()
+    ids = requested_ids()
+    if ids is not None:
+        response, status_code = SensorController.get_sensors_by_ids(ids, fields)
+        return jsonify(response), status_code
+    if wants_ndjson():
+        response, status_code = SensorController.stream_all_sensors(fields, filters, sort)
+        return ndjson_response(response) if status_code == 200 else (jsonify(response), status_code)
+
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after')
+    response, status_code = SensorController.get_all_sensors(limit, after, fields, filters, sort)
+    return jsonify(response), status_code
+
+
+@sensor_blueprint.route('/sensors/lookup', methods=['POST'])
+@jwt_required()
+def lookup_sensors():
+    """
+    Get sensors by a list of IDs
+    ---
+    tags:
+      - Sensor
+    security:
+      - BearerAuth: []
+    consumes:
+      - application/json
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: object
+          required:
+            - ids
+          properties:
+            ids:
+              type: array
+              items:
+                type: integer
+              example: [1, 2, 3]
+      - name: fields
+        in: query
+        type: string
+        required: false
+        description: Comma-separated fields to return, e.g. id,status; only these columns are selected
+    responses:
+      200:
+        description: Found records in the order of ids, and the IDs that do not exist
+      400:
+        description: Invalid ids or unknown field in fields
+    """
+    data = request.get_json(silent=True)
+    ids = data.get('ids') if isinstance(data, dict) else None
+    response, status_code = SensorController.get_sensors_by_ids(ids, requested_fields())
     return jsonify(response), status_code
 
 
 @sensor_blueprint.route('/sensors/<int:sensor_id>', methods=['PUT'])
 @jwt_required()
+@if_match_required
 def update_sensor(sensor_id):
     """
     Update a sensor
@@ -130,19 +294,89 @@ def update_sensor(sensor_id):
             trigger_status:
               type: string
               example: "Inactive"
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
     responses:
       200:
         description: Sensor updated successfully
       404:
         description: Sensor not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
     data = request.json
-    response, status_code = SensorController.update_sensor(sensor_id, data)
+    response, status_code = SensorController.update_sensor(sensor_id, data, requested_versions())
+    return jsonify(response), status_code
+
+
+@sensor_blueprint.route('/sensors/<int:sensor_id>', methods=['PATCH'])
+@jwt_required()
+@if_match_required
+def patch_sensor(sensor_id):
+    """
+    Partially update a sensor
+    ---
+    tags:
+      - Sensor
+    security:
+      - BearerAuth: []
+    consumes:
+      - application/json
+    parameters:
+      - name: sensor_id
+        in: path
+        type: integer
+        required: true
+      - in: body
+        name: body
+        required: true
+        description: Only the fields to change
+        schema:
+          type: object
+          properties:
+            robot_id:
+              type: integer
+              example: 2
+            technology_used:
+              type: string
+              example: "Ultrasonic"
+            detection_range:
+              type: integer
+              example: 200
+            trigger_status:
+              type: string
+              example: "Inactive"
+      - name: If-Match
+        in: header
+        type: string
+        required: true
+        description: ETag from GET of this record; * skips the version check
+    responses:
+      200:
+        description: Updated with a single UPDATE statement
+      400:
+        description: Empty body, unknown field or invalid value
+      404:
+        description: Not found
+      409:
+        description: Rejected by the database, e.g. a missing referenced record
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
+    """
+    response, status_code = SensorController.patch_sensor(sensor_id, request.get_json(silent=True), requested_versions())
     return jsonify(response), status_code
 
 
 @sensor_blueprint.route('/sensors/<int:sensor_id>', methods=['DELETE'])
 @jwt_required()
+@if_match_required
 def delete_sensor(sensor_id):
     """
     Delete a sensor
@@ -157,13 +391,27 @@ def delete_sensor(sensor_id):
         required: true
         type: integer
         description: ID of the sensor
+      - name: dry_run
+        in: query
+        type: integer
+        required: false
+        description: Set to 1 to only count the rows the delete would remove, per table (cascades included)
+      - name: If-Match
+        in: header
+        type: string
+        required: false
+        description: ETag from GET of this record, required unless dry_run=1; * skips the version check
     responses:
       200:
-        description: Sensor deleted successfully
+        description: Sensor deleted successfully (or, with dry_run=1, counts per table)
       404:
         description: Sensor not found
+      412:
+        description: The record was changed since the ETag in If-Match was read
+      428:
+        description: If-Match header is missing
     """
-    response, status_code = SensorController.delete_sensor(sensor_id)
+    response, status_code = SensorController.delete_sensor(sensor_id, requested_dry_run(), requested_versions())
     return jsonify(response), status_code
 
 
@@ -177,9 +425,22 @@ def get_sensors_with_robot():
       - Sensor
     security:
       - BearerAuth: []
+    parameters:
+      - name: limit
+        in: query
+        type: integer
+        required: false
+        description: Page size, capped on the server
+      - name: after
+        in: query
+        type: integer
+        required: false
+        description: Cursor from next_cursor of the previous page
     responses:
       200:
-        description: List of sensors with associated robot
+        description: Page of sensors with associated robot and next_cursor for the following page
     """
-    response, status_code = SensorController.get_sensors_with_robot()
+    limit = request.args.get('limit', type=int)
+    after = request.args.get('after', type=int)
+    response, status_code = SensorController.get_sensors_with_robot(limit, after)
     return jsonify(response), status_code
@@ -0,0 +1,19 @@
+from flask import Response, current_app, request, stream_with_context
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def wants_ndjson():
+    """Чи запросив клієнт потокову видачу (`?stream=1` або `Accept: application/x-ndjson`)."""
+    if request.args.get('stream') in ('1', 'true'):
+        return True
+    return request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def ndjson_response(items):
+    """Пише кожен елемент окремим JSON-рядком одразу після серіалізації."""
+    def generate():
+        for item in items:
+            yield current_app.json.dumps(item) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
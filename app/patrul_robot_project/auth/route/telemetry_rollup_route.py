@@ -0,0 +1,111 @@
+from flask import Blueprint, request, jsonify
+from auth.controller.telemetry_rollup_controller import TelemetryRollupController
+
+telemetry_rollup_blueprint = Blueprint('telemetry_rollup', __name__)
+
+
+@telemetry_rollup_blueprint.route('/robots/<int:robot_id>/battery/rollup', methods=['GET'])
+def get_battery_rollup(robot_id):
+    """
+    Get aggregated battery telemetry for a robot
+    ---
+    tags:
+      - Telemetry
+    parameters:
+      - name: robot_id
+        in: path
+        type: integer
+        required: true
+        description: ID of the robot
+      - name: metric
+        in: query
+        type: string
+        enum: [battery_level, temperature]
+        required: false
+        description: Metric to aggregate, battery_level by default
+      - name: from
+        in: query
+        type: string
+        required: false
+        description: Range start (ISO 8601, UTC unless an offset is given), one day before `to` by default
+      - name: to
+        in: query
+        type: string
+        required: false
+        description: Range end (ISO 8601, UTC unless an offset is given), now by default
+      - name: max_points
+        in: query
+        type: integer
+        required: false
+        description: Upper bound on returned buckets, used to pick the resolution
+      - name: resolution
+        in: query
+        type: integer
+        enum: [60, 3600, 86400]
+        required: false
+        description: Force a bucket size in seconds
+    responses:
+      200:
+        description: min/max/avg/last per bucket
+      400:
+        description: Invalid range, metric or resolution
+    """
+    response, status_code = TelemetryRollupController.get_battery_rollup(
+        robot_id,
+        request.args.get('metric'),
+        request.args.get('from'),
+        request.args.get('to'),
+        request.args.get('max_points', type=int),
+        request.args.get('resolution', type=int)
+    )
+    return jsonify(response), status_code
+
+
+@telemetry_rollup_blueprint.route('/charging_stations/<int:station_id>/solar/rollup', methods=['GET'])
+def get_solar_rollup(station_id):
+    """
+    Get aggregated solar power output for a charging station
+    ---
+    tags:
+      - Telemetry
+    parameters:
+      - name: station_id
+        in: path
+        type: integer
+        required: true
+        description: ID of the charging station
+      - name: from
+        in: query
+        type: string
+        required: false
+        description: Range start (ISO 8601, UTC unless an offset is given), one day before `to` by default
+      - name: to
+        in: query
+        type: string
+        required: false
+        description: Range end (ISO 8601, UTC unless an offset is given), now by default
+      - name: max_points
+        in: query
+        type: integer
+        required: false
+        description: Upper bound on returned buckets, used to pick the resolution
+      - name: resolution
+        in: query
+        type: integer
+        enum: [60, 3600, 86400]
+        required: false
+        description: Force a bucket size in seconds
+    responses:
+      200:
+        description: min/max/avg/last of power_output per bucket
+      400:
+        description: Invalid range or resolution
+    """
+    response, status_code = TelemetryRollupController.get_solar_rollup(
+        station_id,
+        request.args.get('from'),
+        request.args.get('to'),
+        request.args.get('max_points', type=int),
+        request.args.get('resolution', type=int)
+    )
+    return jsonify(response), status_code
@@ -10,8 +10,8 @@ class AudioSystemService:
         return AudioSystemDAO.get_audio_system(audio_system_id)
 
     @staticmethod
-    def get_all_audio_systems():
-        return AudioSystemDAO.get_all_audio_systems()
+    def get_all_audio_systems(limit=None, after=None):
+        return AudioSystemDAO.get_all_audio_systems(limit, after)
 
     @staticmethod
     def update_audio_system(audio_system_id, has_speaker, has_microphone, has_panic_button, robot_id):
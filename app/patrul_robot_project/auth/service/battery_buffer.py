@@ -0,0 +1,118 @@
+import atexit
+import logging
+import os
+import threading
+
+from sqlalchemy.exc import OperationalError
+
+from auth.domain.models import db
+from auth.dao.battery_dao import BatteryDAO
+
+logger = logging.getLogger(__name__)
+
+
+class BatteryWriteBuffer:
+    """
+    Write-behind буфер для телеметрії батареї.
+
+    Показники накопичуються в пам'яті воркера і записуються однією пачкою,
+    коли набирається `max_size` рядків або минає `interval` секунд.
+    Показники, що ще не записані, втрачаються при аварійному завершенні процесу.
+
+    Клієнт уже отримав 202, тож невдалий запис не скидає пачку цілком. Якщо
+    база недоступна (OperationalError), пачка повертається в чергу до
+    наступного flush; черга обмежена `max_backlog` рядками, понад це
+    відкидаються найстаріші. Якщо базу не влаштовують самі дані, пачка
+    ділиться навпіл, доки відхилені показники не залишаться поодинці: лише
+    вони логуються й відкидаються, решта записується.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.max_size = 1000
+        self.interval = 1.0
+        self.max_backlog = 100000
+        self.dropped = 0
+        self._app = None
+        self._rows = []
+        self._lock = threading.Lock()
+        self._flusher_pid = None
+
+    def init_app(self, app):
+        self._app = app
+        self.enabled = app.config.get('BATTERY_BUFFER_ENABLED', False)
+        self.max_size = app.config.get('BATTERY_BUFFER_SIZE', self.max_size)
+        self.interval = app.config.get('BATTERY_BUFFER_INTERVAL', self.interval)
+        self.max_backlog = app.config.get('BATTERY_BUFFER_MAX_BACKLOG', self.max_backlog)
+        if self.enabled:
+            atexit.register(self.flush)
+
+    def add(self, readings):
+        self._ensure_flusher()
+        with self._lock:
+            self._rows.extend(readings)
+            if len(self._rows) < self.max_size:
+                return
+            batch, self._rows = self._rows, []
+        self._write(batch)
+
+    def flush(self):
+        with self._lock:
+            batch, self._rows = self._rows, []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch):
+        with self._app.app_context():
+            try:
+                self._write_isolated(batch)
+            except OperationalError:
+                db.session.rollback()
+                logger.exception('Battery buffer flush failed, %d readings requeued', len(batch))
+                self._requeue(batch)
+
+    def _write_isolated(self, batch):
+        try:
+            BatteryDAO.add_batteries(batch)
+        except OperationalError:
+            raise
+        except Exception:
+            db.session.rollback()
+            if len(batch) == 1:
+                self.dropped += 1
+                logger.exception('Battery reading rejected and dropped: %s', batch[0])
+                return
+            middle = len(batch) // 2
+            self._write_isolated(batch[:middle])
+            self._write_isolated(batch[middle:])
+
+    def _requeue(self, batch):
+        with self._lock:
+            self._rows[:0] = batch
+            overflow = len(self._rows) - self.max_backlog
+            if overflow > 0:
+                del self._rows[:overflow]
+                self.dropped += overflow
+        if overflow > 0:
+            logger.error('Battery buffer backlog is full, dropped %d oldest readings', overflow)
+
+    def _ensure_flusher(self):
+        # Потік стартує ліниво в кожному воркері: після fork потоки майстра не існують
+        if self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            threading.Thread(target=self._run, name='battery-buffer-flusher', daemon=True).start()
+
+    def _run(self):
+        stop = threading.Event()
+        while not stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Battery buffer flush failed')
+
+
+battery_buffer = BatteryWriteBuffer()
@@ -0,0 +1,32 @@
+from auth.dao.battery_dao import BatteryDAO
+from auth.service.battery_buffer import battery_buffer
+
+class BatteryService:
+    @staticmethod
+    def add_battery(log_time, battery_level, robot_id, temperature):
+        return BatteryDAO.add_battery(log_time, battery_level, robot_id, temperature)
+
+    @staticmethod
+    def add_readings(readings):
+        """Записує пачку показників; повертає True, якщо вони лише поставлені в буфер."""
+        if battery_buffer.enabled:
+            battery_buffer.add(readings)
+            return True
+        BatteryDAO.add_batteries(readings)
+        return False
+
+    @staticmethod
+    def get_battery(battery_id):
+        return BatteryDAO.get_battery(battery_id)
+
+    @staticmethod
+    def get_all_batteries(limit=None, after=None):
+        return BatteryDAO.get_all_batteries(limit, after)
+
+    @staticmethod
+    def update_battery(battery_id, log_time, battery_level, robot_id, temperature):
+        return BatteryDAO.update_battery(battery_id, log_time, battery_level, robot_id, temperature)
+
+    @staticmethod
+    def delete_battery(battery_id):
+        return BatteryDAO.delete_battery(battery_id)
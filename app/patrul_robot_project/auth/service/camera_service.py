@@ -5,18 +5,42 @@ class CameraService:
     def add_camera(robot_id, resolution, zoom_level, status, night_vision, panoramic_view):
         return CameraDAO.add_camera(robot_id, resolution, zoom_level, status, night_vision, panoramic_view)
 
+    @staticmethod
+    def apply_camera_batch(operations):
+        return CameraDAO.apply_camera_batch(operations)
+
     @staticmethod
     def get_camera(camera_id):
         return CameraDAO.get_camera(camera_id)
 
     @staticmethod
-    def get_all_cameras():
-        return CameraDAO.get_all_cameras()
+    def get_camera_fields(camera_id, fields):
+        return CameraDAO.get_camera_fields(camera_id, fields)
+
+    @staticmethod
+    def get_cameras_by_ids(ids, fields=None):
+        return CameraDAO.get_cameras_by_ids(ids, fields)
+
+    @staticmethod
+    def get_all_cameras(limit=None, after=None, fields=None, filters=None, sort=None):
+        return CameraDAO.get_all_cameras(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_cameras(fields=None, filters=None, sort=None):
+        return CameraDAO.stream_all_cameras(fields, filters, sort)
+
+    @staticmethod
+    def patch_camera(camera_id, data, versions=None):
+        return CameraDAO.patch_camera(camera_id, data, versions)
+
+    @staticmethod
+    def update_camera(camera_id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view, versions=None):
+        return CameraDAO.update_camera(camera_id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view, versions)
 
     @staticmethod
-    def update_camera(camera_id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view):
-        return CameraDAO.update_camera(camera_id, robot_id, resolution, zoom_level, status, night_vision, panoramic_view)
+    def delete_camera(camera_id, versions=None):
+        return CameraDAO.delete_camera(camera_id, versions)
 
     @staticmethod
-    def delete_camera(camera_id):
-        return CameraDAO.delete_camera(camera_id)
+    def preview_camera_delete(camera_id):
+        return CameraDAO.preview_camera_delete(camera_id)
@@ -0,0 +1,10 @@
+from auth.dao.change_feed_dao import ChangeFeedDAO
+
+class ChangeFeedService:
+    @staticmethod
+    def get_current_version():
+        return ChangeFeedDAO.get_current_version()
+
+    @staticmethod
+    def get_changes(since, limit=None, entities=None):
+        return ChangeFeedDAO.get_changes(since, limit, entities)
@@ -5,22 +5,46 @@ class ChargingStationService:
     def add_station(location, capacity, available):
         return ChargingStationDAO.add_station(location, capacity, available)
 
+    @staticmethod
+    def apply_station_batch(operations):
+        return ChargingStationDAO.apply_station_batch(operations)
+
     @staticmethod
     def get_station(station_id):
         return ChargingStationDAO.get_station(station_id)
 
     @staticmethod
-    def get_all_stations():
-        return ChargingStationDAO.get_all_stations()
+    def get_station_fields(station_id, fields):
+        return ChargingStationDAO.get_station_fields(station_id, fields)
+
+    @staticmethod
+    def get_stations_by_ids(ids, fields=None):
+        return ChargingStationDAO.get_stations_by_ids(ids, fields)
+
+    @staticmethod
+    def get_all_stations(limit=None, after=None, fields=None, filters=None, sort=None):
+        return ChargingStationDAO.get_all_stations(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_stations(fields=None, filters=None, sort=None):
+        return ChargingStationDAO.stream_all_stations(fields, filters, sort)
+
+    @staticmethod
+    def patch_station(station_id, data, versions=None):
+        return ChargingStationDAO.patch_station(station_id, data, versions)
+
+    @staticmethod
+    def update_station(station_id, location, capacity, available, versions=None):
+        return ChargingStationDAO.update_station(station_id, location, capacity, available, versions)
 
     @staticmethod
-    def update_station(station_id, location, capacity, available):
-        return ChargingStationDAO.update_station(station_id, location, capacity, available)
+    def delete_station(station_id, versions=None):
+        return ChargingStationDAO.delete_station(station_id, versions)
 
     @staticmethod
-    def delete_station(station_id):
-        return ChargingStationDAO.delete_station(station_id)
+    def preview_station_delete(station_id):
+        return ChargingStationDAO.preview_station_delete(station_id)
 
     @staticmethod
-    def get_all_stations_with_robots():
-        return ChargingStationDAO.get_all_stations_with_robots()
+    def get_all_stations_with_robots(limit=None, after=None):
+        return ChargingStationDAO.get_all_stations_with_robots(limit, after)
@@ -0,0 +1,6 @@
+from auth.dao.fleet_dao import FleetDAO
+
+class FleetService:
+    @staticmethod
+    def get_fleet_summary():
+        return FleetDAO.get_fleet_summary()
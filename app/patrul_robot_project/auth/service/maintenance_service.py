@@ -5,18 +5,42 @@ class MaintenanceService:
     def add_maintenance(maintenance_date, description, technician_name, next_maintenance):
         return MaintenanceDAO.add_maintenance(maintenance_date, description, technician_name, next_maintenance)
 
+    @staticmethod
+    def apply_maintenance_batch(operations):
+        return MaintenanceDAO.apply_maintenance_batch(operations)
+
     @staticmethod
     def get_maintenance(maintenance_id):
         return MaintenanceDAO.get_maintenance(maintenance_id)
 
     @staticmethod
-    def get_all_maintenances():
-        return MaintenanceDAO.get_all_maintenances()
+    def get_maintenance_fields(maintenance_id, fields):
+        return MaintenanceDAO.get_maintenance_fields(maintenance_id, fields)
+
+    @staticmethod
+    def get_maintenances_by_ids(ids, fields=None):
+        return MaintenanceDAO.get_maintenances_by_ids(ids, fields)
+
+    @staticmethod
+    def get_all_maintenances(limit=None, after=None, fields=None, filters=None, sort=None):
+        return MaintenanceDAO.get_all_maintenances(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_maintenances(fields=None, filters=None, sort=None):
+        return MaintenanceDAO.stream_all_maintenances(fields, filters, sort)
+
+    @staticmethod
+    def patch_maintenance(maintenance_id, data, versions=None):
+        return MaintenanceDAO.patch_maintenance(maintenance_id, data, versions)
+
+    @staticmethod
+    def update_maintenance(maintenance_id, maintenance_date, description, technician_name, next_maintenance, versions=None):
+        return MaintenanceDAO.update_maintenance(maintenance_id, maintenance_date, description, technician_name, next_maintenance, versions)
 
     @staticmethod
-    def update_maintenance(maintenance_id, maintenance_date, description, technician_name, next_maintenance):
-        return MaintenanceDAO.update_maintenance(maintenance_id, maintenance_date, description, technician_name, next_maintenance)
+    def delete_maintenance(maintenance_id, versions=None):
+        return MaintenanceDAO.delete_maintenance(maintenance_id, versions)
 
     @staticmethod
-    def delete_maintenance(maintenance_id):
-        return MaintenanceDAO.delete_maintenance(maintenance_id)
+    def preview_maintenance_delete(maintenance_id):
+        return MaintenanceDAO.preview_maintenance_delete(maintenance_id)
@@ -5,21 +5,45 @@ class OperatorService:
     def add_operator(name, shift_start, shift_end, contact_info):
         return OperatorDAO.add_operator(name, shift_start, shift_end, contact_info)
 
+    @staticmethod
+    def apply_operator_batch(operations):
+        return OperatorDAO.apply_operator_batch(operations)
+
     @staticmethod
     def get_operator(operator_id):
         return OperatorDAO.get_operator(operator_id)
 
     @staticmethod
-    def get_all_operators():
-        return OperatorDAO.get_all_operators()
+    def get_operator_fields(operator_id, fields):
+        return OperatorDAO.get_operator_fields(operator_id, fields)
+
+    @staticmethod
+    def get_operators_by_ids(ids, fields=None):
+        return OperatorDAO.get_operators_by_ids(ids, fields)
+
+    @staticmethod
+    def get_all_operators(limit=None, after=None, fields=None, filters=None, sort=None):
+        return OperatorDAO.get_all_operators(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_operators(fields=None, filters=None, sort=None):
+        return OperatorDAO.stream_all_operators(fields, filters, sort)
+
+    @staticmethod
+    def patch_operator(operator_id, data, versions=None):
+        return OperatorDAO.patch_operator(operator_id, data, versions)
+
+    @staticmethod
+    def update_operator(operator_id, name, shift_start, shift_end, contact_info, versions=None):
+        return OperatorDAO.update_operator(operator_id, name, shift_start, shift_end, contact_info, versions)
 
     @staticmethod
-    def update_operator(operator_id, name, shift_start, shift_end, contact_info):
-        return OperatorDAO.update_operator(operator_id, name, shift_start, shift_end, contact_info)
+    def delete_operator(operator_id, versions=None):
+        return OperatorDAO.delete_operator(operator_id, versions)
 
     @staticmethod
-    def delete_operator(operator_id):
-        return OperatorDAO.delete_operator(operator_id)
+    def preview_operator_delete(operator_id):
+        return OperatorDAO.preview_operator_delete(operator_id)
 
-    def get_all_operators_with_robots():
-        return OperatorDAO.get_all_operators_with_robots()
\ No newline at end of file
+    def get_all_operators_with_robots(limit=None, after=None):
+        return OperatorDAO.get_all_operators_with_robots(limit, after)
\ No newline at end of file
@@ -0,0 +1,66 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from passlib.hash import pbkdf2_sha256
+
+
+def _hash(password, rounds):
+    return pbkdf2_sha256.using(rounds=rounds).hash(password)
+
+
+def _verify(password, hashed):
+    return pbkdf2_sha256.verify(password, hashed)
+
+
+def default_workers():
+    """
+    Розмір пулу за замовчуванням: ядра, поділені між воркерами Gunicorn.
+
+    Кожен воркер створює власний пул, тож os.cpu_count() на воркер дав би
+    cpu_count * WEB_CONCURRENCY процесів, що змагаються за ті самі ядра.
+    WEB_CONCURRENCY — кількість воркерів, яку читає і сам Gunicorn.
+    """
+    return max(1, (os.cpu_count() or 1) // int(os.getenv('WEB_CONCURRENCY', '1')))
+
+
+class PasswordHasher:
+    """
+    Виконує PBKDF2 у пулі процесів, щоб повільне виведення ключа не займало
+    потік запиту. PASSWORD_HASH_WORKERS=0 вимикає пул і хешує в поточному потоці;
+    без налаштування розмір пулу береться з default_workers().
+    Кількість раундів зашита в сам хеш, тож старі паролі перевіряються і після зміни.
+    """
+
+    def __init__(self):
+        self.rounds = pbkdf2_sha256.default_rounds
+        self.workers = default_workers()
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.rounds = app.config.get('PASSWORD_HASH_ROUNDS', self.rounds)
+        self.workers = app.config.get('PASSWORD_HASH_WORKERS', self.workers)
+
+    def hash(self, password):
+        return self._run(_hash, password, self.rounds)
+
+    def verify(self, password, hashed):
+        return self._run(_verify, password, hashed)
+
+    def _run(self, func, *args):
+        if not self.workers:
+            return func(*args)
+        return self._pool().submit(func, *args).result()
+
+    def _pool(self):
+        # Пул створюється в кожному воркері окремо: після fork процеси майстра недоступні
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                self._pid = os.getpid()
+            return self._executor
+
+
+password_hasher = PasswordHasher()
@@ -10,8 +10,8 @@ class PatrolReportService:
         return PatrolReportDAO.get_report(report_id)
 
     @staticmethod
-    def get_all_reports():
-        return PatrolReportDAO.get_all_reports()
+    def get_all_reports(limit=None, after=None):
+        return PatrolReportDAO.get_all_reports(limit, after)
 
     @staticmethod
     def update_report(report_id, start_time, end_time, observations, person_detected, routes_id):
@@ -5,22 +5,46 @@ class PersonIdentificationService:
     def add_identification(person_name, timestamp, accuracy, sensor_id, camera_id, report_id):
         return PersonIdentificationDAO.add_identification(person_name, timestamp, accuracy, sensor_id, camera_id, report_id)
 
+    @staticmethod
+    def apply_identification_batch(operations):
+        return PersonIdentificationDAO.apply_identification_batch(operations)
+
     @staticmethod
     def get_identification(identification_id):
         return PersonIdentificationDAO.get_identification(identification_id)
 
     @staticmethod
-    def get_all_identifications():
-        return PersonIdentificationDAO.get_all_identifications()
+    def get_identification_fields(identification_id, fields):
+        return PersonIdentificationDAO.get_identification_fields(identification_id, fields)
+
+    @staticmethod
+    def get_identifications_by_ids(ids, fields=None):
+        return PersonIdentificationDAO.get_identifications_by_ids(ids, fields)
+
+    @staticmethod
+    def get_all_identifications(limit=None, after=None, fields=None, filters=None, sort=None):
+        return PersonIdentificationDAO.get_all_identifications(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_identifications(fields=None, filters=None, sort=None):
+        return PersonIdentificationDAO.stream_all_identifications(fields, filters, sort)
+
+    @staticmethod
+    def patch_identification(identification_id, data, versions=None):
+        return PersonIdentificationDAO.patch_identification(identification_id, data, versions)
+
+    @staticmethod
+    def update_identification(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id, versions=None):
+        return PersonIdentificationDAO.update_identification(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id, versions)
 
     @staticmethod
-    def update_identification(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id):
-        return PersonIdentificationDAO.update_identification(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id)
+    def delete_identification(identification_id, versions=None):
+        return PersonIdentificationDAO.delete_identification(identification_id, versions)
 
     @staticmethod
-    def delete_identification(identification_id):
-        return PersonIdentificationDAO.delete_identification(identification_id)
+    def preview_identification_delete(identification_id):
+        return PersonIdentificationDAO.preview_identification_delete(identification_id)
     
     @staticmethod
-    def get_all_identifications_with_reports():
-        return PersonIdentificationDAO.get_all_identifications_with_reports()
+    def get_all_identifications_with_reports(limit=None, after=None):
+        return PersonIdentificationDAO.get_all_identifications_with_reports(limit, after)
@@ -17,9 +17,9 @@ class RobotMaintenanceService:
         return RobotMaintenanceDAO.get_maintenances_for_robot(robot_id)
 
     @staticmethod
-    def get_all_maintenances_with_robots():
-        """Отримує всі техобслуговування разом з роботами, які їх виконують."""
-        return RobotMaintenanceDAO.get_all_maintenances_with_robots()
+    def get_all_maintenances_with_robots(limit=None, after=None):
+        """Отримує сторінку техобслуговувань разом з роботами, які їх виконують, і курсор наступної."""
+        return RobotMaintenanceDAO.get_all_maintenances_with_robots(limit, after)
 
     @staticmethod
     def get_maintenance_with_robots(maintenance_id):
@@ -5,18 +5,46 @@ class RobotService:
     def add_robot(status, max_distance, operator_id, station_id, alternative_power_source):
         return RobotDAO.add_robot(status, max_distance, operator_id, station_id, alternative_power_source)
 
+    @staticmethod
+    def apply_robot_batch(operations):
+        return RobotDAO.apply_robot_batch(operations)
+
     @staticmethod
     def get_robot(robot_id):
         return RobotDAO.get_robot(robot_id)
 
     @staticmethod
-    def get_all_robots():
-        return RobotDAO.get_all_robots()
+    def get_robot_fields(robot_id, fields):
+        return RobotDAO.get_robot_fields(robot_id, fields)
+
+    @staticmethod
+    def get_robots_by_ids(ids, fields=None):
+        return RobotDAO.get_robots_by_ids(ids, fields)
+
+    @staticmethod
+    def get_robot_full(robot_id, include=None):
+        return RobotDAO.get_robot_full(robot_id, include)
+
+    @staticmethod
+    def get_all_robots(limit=None, after=None, fields=None, filters=None, sort=None):
+        return RobotDAO.get_all_robots(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_robots(fields=None, filters=None, sort=None):
+        return RobotDAO.stream_all_robots(fields, filters, sort)
+
+    @staticmethod
+    def patch_robot(robot_id, data, versions=None):
+        return RobotDAO.patch_robot(robot_id, data, versions)
+
+    @staticmethod
+    def update_robot(robot_id, status, max_distance, operator_id, station_id, alternative_power_source, versions=None):
+        return RobotDAO.update_robot(robot_id, status, max_distance, operator_id, station_id, alternative_power_source, versions)
 
     @staticmethod
-    def update_robot(robot_id, status, max_distance, operator_id, station_id, alternative_power_source):
-        return RobotDAO.update_robot(robot_id, status, max_distance, operator_id, station_id, alternative_power_source)
+    def delete_robot(robot_id, versions=None):
+        return RobotDAO.delete_robot(robot_id, versions)
 
     @staticmethod
-    def delete_robot(robot_id):
-        return RobotDAO.delete_robot(robot_id)
+    def preview_robot_delete(robot_id):
+        return RobotDAO.preview_robot_delete(robot_id)
@@ -5,22 +5,46 @@ class SensorService:
     def add_sensor(robot_id, technology_used, detection_range, trigger_status):
         return SensorDAO.add_sensor(robot_id, technology_used, detection_range, trigger_status)
 
+    @staticmethod
+    def apply_sensor_batch(operations):
+        return SensorDAO.apply_sensor_batch(operations)
+
     @staticmethod
     def get_sensor(sensor_id):
         return SensorDAO.get_sensor(sensor_id)
 
     @staticmethod
-    def get_all_sensors():
-        return SensorDAO.get_all_sensors()
+    def get_sensor_fields(sensor_id, fields):
+        return SensorDAO.get_sensor_fields(sensor_id, fields)
+
+    @staticmethod
+    def get_sensors_by_ids(ids, fields=None):
+        return SensorDAO.get_sensors_by_ids(ids, fields)
+
+    @staticmethod
+    def get_all_sensors(limit=None, after=None, fields=None, filters=None, sort=None):
+        return SensorDAO.get_all_sensors(limit, after, fields, filters, sort)
+
+    @staticmethod
+    def stream_all_sensors(fields=None, filters=None, sort=None):
+        return SensorDAO.stream_all_sensors(fields, filters, sort)
+
+    @staticmethod
+    def patch_sensor(sensor_id, data, versions=None):
+        return SensorDAO.patch_sensor(sensor_id, data, versions)
+
+    @staticmethod
+    def update_sensor(sensor_id, robot_id, technology_used, detection_range, trigger_status, versions=None):
+        return SensorDAO.update_sensor(sensor_id, robot_id, technology_used, detection_range, trigger_status, versions)
 
     @staticmethod
-    def update_sensor(sensor_id, robot_id, technology_used, detection_range, trigger_status):
-        return SensorDAO.update_sensor(sensor_id, robot_id, technology_used, detection_range, trigger_status)
+    def delete_sensor(sensor_id, versions=None):
+        return SensorDAO.delete_sensor(sensor_id, versions)
 
     @staticmethod
-    def delete_sensor(sensor_id):
-        return SensorDAO.delete_sensor(sensor_id)
+    def preview_sensor_delete(sensor_id):
+        return SensorDAO.preview_sensor_delete(sensor_id)
     
     @staticmethod
-    def get_all_sensors_with_robot():
-        return SensorDAO.get_all_sensors_with_robot()
+    def get_all_sensors_with_robot(limit=None, after=None):
+        return SensorDAO.get_all_sensors_with_robot(limit, after)
@@ -0,0 +1,19 @@
+from auth.dao.telemetry_rollup_dao import ROLLUP_RESOLUTIONS, TelemetryRollupDAO
+
+DEFAULT_MAX_POINTS = 500
+
+class TelemetryRollupService:
+    @staticmethod
+    def choose_resolution(start, end, max_points=DEFAULT_MAX_POINTS):
+        """Найгрубша роздільність, потрібна, щоб діапазон вмістився в max_points бакетів."""
+        span = (end - start).total_seconds()
+        for resolution in ROLLUP_RESOLUTIONS:
+            if span / resolution <= max_points:
+                return resolution
+        return ROLLUP_RESOLUTIONS[-1]
+
+    @staticmethod
+    def get_series(metric, entity_id, start, end, max_points=DEFAULT_MAX_POINTS, resolution=None):
+        if resolution is None:
+            resolution = TelemetryRollupService.choose_resolution(start, end, max_points)
+        return resolution, TelemetryRollupDAO.get_series(metric, entity_id, resolution, start, end)
@@ -1,15 +1,19 @@
 from ..dao.user_dao import UserDAO
-from passlib.hash import pbkdf2_sha256
+from .password_hasher import password_hasher
 
 class UserService:
+    @staticmethod
+    def exists(username: str) -> bool:
+        return UserDAO.get_by_username(username) is not None
+
     @staticmethod
     def register(username: str, password: str):
-        hashed_password = pbkdf2_sha256.hash(password)
+        hashed_password = password_hasher.hash(password)
         return UserDAO.create_user(username, hashed_password)
 
     @staticmethod
     def authenticate(username: str, password: str):
         user = UserDAO.get_by_username(username)
-        if user and pbkdf2_sha256.verify(password, user.password):
+        if user and password_hasher.verify(password, user.password):
             return user
         return None
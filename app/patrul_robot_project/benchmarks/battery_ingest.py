@@ -0,0 +1,114 @@
+"""
+Бенчмарк запису телеметрії батареї на локальній SQLite замість MySQL.
+
+Порівнює запис по одному рядку (BatteryDAO.add_battery), пакетний INSERT
+(BatteryDAO.add_batteries), HTTP-ендпоінт POST /robots/<id>/battery і
+write-behind буфер.
+
+    python benchmarks/battery_ingest.py --readings 50000 --batch 500
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+
+from auth.domain.models import db, Operator, ChargingStation, Robot, Battery
+from auth.dao.battery_dao import BatteryDAO
+from auth.route.battery_route import battery_blueprint
+from auth.service.battery_buffer import BatteryWriteBuffer
+
+
+def make_app(db_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    db.init_app(app)
+    app.register_blueprint(battery_blueprint)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Operator(name='bench', shift_start=datetime.min.time(), shift_end=datetime.min.time(), contact_info='-'))
+        db.session.add(ChargingStation(location='bench', capacity=1, available='yes'))
+        db.session.flush()
+        db.session.add(Robot(status='Active', max_distance=1, operator_id=1, station_id=1, alternative_power_source='no'))
+        db.session.commit()
+    return app
+
+
+def readings(count, start=datetime(2024, 1, 1)):
+    return [{
+        'log_time': start + timedelta(seconds=i),
+        'battery_level': i % 100,
+        'robot_id': 1,
+        'temperature': '35.5'
+    } for i in range(count)]
+
+
+def report(name, count, elapsed):
+    print(f'{name:<28} {count:>8} rows {elapsed:8.3f}s {count / elapsed:>12,.0f} rows/s')
+
+
+def bench_single(app, count):
+    rows = readings(count)
+    with app.app_context():
+        started = time.perf_counter()
+        for row in rows:
+            BatteryDAO.add_battery(**row)
+        report('add_battery (row/commit)', count, time.perf_counter() - started)
+
+
+def bench_batched(app, count, batch):
+    rows = readings(count)
+    with app.app_context():
+        started = time.perf_counter()
+        for i in range(0, count, batch):
+            BatteryDAO.add_batteries(rows[i:i + batch])
+        report(f'add_batteries (batch={batch})', count, time.perf_counter() - started)
+
+
+def bench_http(app, count, batch):
+    payload = [{**row, 'log_time': row['log_time'].isoformat()} for row in readings(count)]
+    client = app.test_client()
+    started = time.perf_counter()
+    for i in range(0, count, batch):
+        response = client.post('/robots/1/battery', json=payload[i:i + batch])
+        assert response.status_code == 201, response.json
+    report('POST /robots/1/battery', count, time.perf_counter() - started)
+
+
+def bench_buffer(app, count, batch):
+    buffer = BatteryWriteBuffer()
+    app.config['BATTERY_BUFFER_ENABLED'] = True
+    app.config['BATTERY_BUFFER_SIZE'] = 5000
+    buffer.init_app(app)
+    rows = readings(count)
+    started = time.perf_counter()
+    for i in range(0, count, batch):
+        buffer.add(rows[i:i + batch])
+    buffer.flush()
+    report('write-behind buffer', count, time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--readings', type=int, default=50000)
+    parser.add_argument('--single', type=int, default=2000, help='readings for the row-per-commit baseline')
+    parser.add_argument('--batch', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'))
+        bench_single(app, args.single)
+        bench_batched(app, args.readings, args.batch)
+        bench_http(app, args.readings, args.batch)
+        bench_buffer(app, args.readings, args.batch)
+        with app.app_context():
+            print(f'battery rows stored: {Battery.query.count()}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+План виконання гарячих запитів до і після міграції з індексами.
+
+Будує SQLite-базу з усіма таблицями, прибирає вторинні індекси, заповнює
+даними, друкує EXPLAIN QUERY PLAN і час запитів, потім запускає
+migrations.upgrade (двічі, щоб перевірити ідемпотентність) і повторює заміри.
+
+    python benchmarks/explain_indexes.py --rows 200000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from sqlalchemy import text
+
+from auth.domain.models import db
+from migrations import upgrade
+
+HOT_QUERIES = {
+    'latest battery of a robot':
+        "SELECT * FROM battery WHERE robot_id = 7 ORDER BY log_time DESC LIMIT 1",
+    'identifications of a camera in a day':
+        "SELECT * FROM person_identification WHERE camera_id = 7 "
+        "AND timestamp >= '2024-03-01' AND timestamp < '2024-03-02'",
+    'alerts in the last hour':
+        "SELECT * FROM alert WHERE timestamp >= '2024-06-30 23:00:00'",
+    'maintenance due this week':
+        "SELECT * FROM maintenance WHERE next_maintenance < '2024-01-08'",
+    'robots by status':
+        "SELECT robot_id FROM robot WHERE status = 'Maintenance'",
+    'login lookup':
+        "SELECT * FROM users WHERE username = 'user123'",
+}
+
+SECONDARY_INDEXES = [
+    'ix_battery_robot_log_time', 'ix_alert_timestamp', 'ix_alert_audio_system_timestamp',
+    'ix_person_identification_timestamp', 'ix_person_identification_camera_timestamp',
+    'ix_maintenance_next_maintenance', 'ix_robot_status_station',
+]
+
+
+def seed(connection, rows):
+    rnd = random.Random(1)
+    start = datetime(2024, 1, 1)
+    robots = max(rows // 1000, 10)
+
+    def stamp():
+        return (start + timedelta(seconds=rnd.randrange(182 * 86400))).isoformat(' ')
+
+    # Колонки названо явно: нові колонки з DEFAULT (version тощо) не ламають заповнення
+    connection.execute(text("INSERT INTO operator (operators_id, name, shift_start, shift_end, contact_info) "
+                            "VALUES (1, 'op', '08:00:00', '16:00:00', '-')"))
+    connection.execute(text("INSERT INTO charging_station (station_id, location, capacity, available) VALUES (1, 'st', 10, 'yes')"))
+    connection.execute(text("INSERT INTO robot (robot_id, status, max_distance, operator_id, station_id, alternative_power_source) "
+                            "VALUES (:id, :status, 100, 1, 1, 'no')"), [
+        {'id': i, 'status': rnd.choice(['Active', 'Inactive', 'Maintenance'])} for i in range(1, robots + 1)])
+    connection.execute(text("INSERT INTO battery (battery_id, log_time, battery_level, robot_id, temperature) "
+                            "VALUES (:id, :t, 50, :robot, '35.5')"), [
+        {'id': i, 't': stamp(), 'robot': rnd.randint(1, robots)} for i in range(1, rows + 1)])
+    connection.execute(text("INSERT INTO audio_system (audio_system_id, has_speaker, has_microphone, has_panic_button, robot_id) "
+                            "VALUES (:id, 'yes', 'yes', 'yes', :id)"), [
+        {'id': i} for i in range(1, robots + 1)])
+    connection.execute(text("INSERT INTO alert (alerts_id, type, timestamp, status, audio_system_id) VALUES (:id, 'a', :t, 'Active', :audio)"), [
+        {'id': i, 't': stamp(), 'audio': rnd.randint(1, robots)} for i in range(1, rows + 1)])
+    connection.execute(text("INSERT INTO maintenance (maintenance_id, maintenance_date, description, technician_name, next_maintenance) "
+                            "VALUES (:id, :t, 'd', 'tech', :t)"), [
+        {'id': i, 't': stamp()} for i in range(1, rows // 10 + 1)])
+    connection.execute(text("INSERT INTO person_identification "
+                            "(identification_id, person_name, timestamp, accuracy, sensor_id, camera_id, report_id) "
+                            "VALUES (:id, 'p', :t, 0.9, 1, :camera, 1)"), [
+        {'id': i, 't': stamp(), 'camera': rnd.randint(1, robots)} for i in range(1, rows + 1)])
+    connection.execute(text("INSERT INTO users (id, username, password) VALUES (:id, :name, 'x')"), [
+        {'id': i, 'name': f'user{i}'} for i in range(1, rows // 10 + 1)])
+
+
+def explain(connection, title):
+    print(f'\n## {title}\n')
+    for name, sql in HOT_QUERIES.items():
+        plan = [row[-1] for row in connection.execute(text('EXPLAIN QUERY PLAN ' + sql))]
+        started = time.perf_counter()
+        for _ in range(20):
+            connection.execute(text(sql)).fetchall()
+        elapsed = (time.perf_counter() - started) / 20 * 1000
+        print(f'- {name}: {elapsed:.2f} ms')
+        for step in plan:
+            print(f'    {step}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = Flask(__name__)
+        app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(tmp, 'explain.db')}"
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            with db.engine.begin() as connection:
+                for name in SECONDARY_INDEXES:
+                    connection.execute(text(f'DROP INDEX {name}'))
+                seed(connection, args.rows)
+                connection.execute(text('ANALYZE'))
+            with db.engine.connect() as connection:
+                explain(connection, 'Before')
+
+            print(f'\nApplied migrations: {upgrade(db.engine)}')
+            print(f'Second run applied: {upgrade(db.engine)}')
+
+            with db.engine.begin() as connection:
+                connection.execute(text('ANALYZE'))
+            with db.engine.connect() as connection:
+                explain(connection, 'After')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Кодування великого списку в JSON: стандартний провайдер Flask проти FastJSONProvider.
+
+Список схожий на відповідь /person_identifications: datetime, Decimal, рядки
+й цілі. FastJSONProvider міряється з orjson і з резервним стандартним json.
+
+    python benchmarks/json_encoding.py --items 100000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from auth.route.json_provider import FastJSONProvider, orjson
+
+
+def payload(count):
+    start = datetime(2024, 1, 1)
+    return {'items': [{
+        'id': i,
+        'person_name': f'person {i}',
+        'timestamp': start + timedelta(seconds=i),
+        'accuracy': Decimal('95.50'),
+        'sensor_id': i % 50,
+        'camera_id': i % 70,
+        'report_id': i % 30
+    } for i in range(count)], 'next_cursor': None}
+
+
+def measure(name, provider, obj, repeat):
+    app = provider._app
+    with app.test_request_context():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            body = provider.response(obj).get_data()
+        elapsed = (time.perf_counter() - started) / repeat
+    items = len(obj['items'])
+    print(f'{name:<32} {elapsed * 1000:9.1f} ms {items / elapsed:>12,.0f} items/s {len(body) / 2 ** 20:7.1f} MiB')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    obj = payload(args.items)
+    measure('Flask DefaultJSONProvider', DefaultJSONProvider(app), obj, args.repeat)
+    fallback = FastJSONProvider(app)
+    fallback.use_orjson = False
+    measure('FastJSONProvider (json)', fallback, obj, args.repeat)
+    if orjson is not None:
+        measure('FastJSONProvider (orjson)', FastJSONProvider(app), obj, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
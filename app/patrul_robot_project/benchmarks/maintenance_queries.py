@@ -0,0 +1,113 @@
+"""
+Кількість SQL-запитів ендпоінтів техобслуговування з роботами.
+
+Заповнює SQLite-базу флотом різного розміру, викликає контролери
+RobotMaintenanceController і рахує оператори, що дійшли до курсора.
+Кількість запитів не повинна залежати від розміру флоту; якщо залежить,
+скрипт завершується з кодом 1. Та сама перевірка для pytest —
+tests/test_maintenance_queries.py.
+
+    python benchmarks/maintenance_queries.py --sizes 10 100 1000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from sqlalchemy import event, insert
+
+from auth.controller.robot_maintenance_controller import RobotMaintenanceController
+from auth.domain.models import db, Operator, ChargingStation, Robot, Maintenance, RobotMaintenance
+
+# Очікувана кількість запитів на виклик
+EXPECTED_QUERIES = {
+    'get_all_maintenances_with_robots': 1,
+    'get_maintenances_for_robot': 1,
+    'get_maintenance_with_robots': 2,
+}
+
+# Виклики контролера з аргументами; ключі збігаються з EXPECTED_QUERIES
+CALLS = {
+    'get_all_maintenances_with_robots': (RobotMaintenanceController.get_all_maintenances_with_robots,),
+    'get_maintenances_for_robot': (RobotMaintenanceController.get_maintenances_for_robot, 1),
+    'get_maintenance_with_robots': (RobotMaintenanceController.get_maintenance_with_robots, 1),
+}
+
+
+def make_app(db_path):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    db.init_app(app)
+    return app
+
+
+def seed(app, robots, robots_per_maintenance=5):
+    start = datetime(2024, 1, 1)
+    maintenances = robots
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        db.session.add(Operator(name='bench', shift_start=datetime.min.time(), shift_end=datetime.min.time(), contact_info='-'))
+        db.session.add(ChargingStation(location='bench', capacity=1, available='yes'))
+        db.session.flush()
+        db.session.execute(insert(Robot), [{
+            'robot_id': i, 'status': 'Active', 'max_distance': 100, 'operator_id': 1, 'station_id': 1,
+            'alternative_power_source': 'no'
+        } for i in range(1, robots + 1)])
+        db.session.execute(insert(Maintenance), [{
+            'maintenance_id': i, 'maintenance_date': start + timedelta(days=i % 365), 'description': f'service {i}',
+            'technician_name': 'bench', 'next_maintenance': start + timedelta(days=i % 365 + 30)
+        } for i in range(1, maintenances + 1)])
+        db.session.execute(insert(RobotMaintenance), [
+            {'robot_id': (i + k) % robots + 1, 'maintenance_id': i}
+            for i in range(1, maintenances + 1) for k in range(min(robots_per_maintenance, robots))
+        ])
+        db.session.commit()
+
+
+def count_queries(app, func, *args):
+    statements = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+        event.listen(engine, 'before_cursor_execute', on_execute)
+        try:
+            started = time.perf_counter()
+            response, status = func(*args)
+            elapsed = time.perf_counter() - started
+        finally:
+            event.remove(engine, 'before_cursor_execute', on_execute)
+            db.session.remove()
+    assert status == 200, response
+    return len(statements), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'))
+        for size in args.sizes:
+            seed(app, size)
+            for name, (func, *call_args) in CALLS.items():
+                queries, elapsed = count_queries(app, func, *call_args)
+                ok = queries == EXPECTED_QUERIES[name]
+                failures += not ok
+                print(f'{size:>6} robots  {name:<34} {queries:>4} queries {elapsed * 1000:9.1f} ms'
+                      f'{"" if ok else f"  (expected {EXPECTED_QUERIES[name]})"}')
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Пропускна здатність /user/register і /user/login під паралельним навантаженням.
+
+Порівнює хешування в потоці запиту (PASSWORD_HASH_WORKERS=0) з пулом процесів.
+Запити йдуть з кількох потоків через тестовий клієнт Flask у SQLite.
+
+    python benchmarks/password_hashing.py --threads 8 --requests 200 --rounds 29000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from flask_jwt_extended import JWTManager
+
+from auth.domain.models import db
+from auth.route.user_route import user_blueprint
+from auth.service.password_hasher import password_hasher
+
+
+def make_app(db_path, rounds, workers):
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['JWT_SECRET_KEY'] = 'benchmark-secret-key-of-at-least-32-bytes'
+    app.config['PASSWORD_HASH_ROUNDS'] = rounds
+    app.config['PASSWORD_HASH_WORKERS'] = workers
+    JWTManager(app)
+    db.init_app(app)
+    password_hasher.init_app(app)
+    app.register_blueprint(user_blueprint)
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def run(app, path, usernames, threads, expected):
+    def call(username):
+        client = app.test_client()
+        started = time.perf_counter()
+        response = client.post(path, json={'username': username, 'password': 'secret'})
+        assert response.status_code == expected, (path, response.status_code)
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = sorted(pool.map(call, usernames))
+    elapsed = time.perf_counter() - started
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    return len(usernames) / elapsed, statistics.median(latencies) * 1000, p95 * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=password_hasher.rounds)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='process pool size')
+    args = parser.parse_args()
+
+    print(f'rounds={args.rounds} threads={args.threads} requests={args.requests} cpus={os.cpu_count()}')
+    for label, workers in (('inline', 0), (f'pool({args.workers})', args.workers)):
+        with tempfile.TemporaryDirectory() as tmp:
+            app = make_app(os.path.join(tmp, 'users.db'), args.rounds, workers)
+            usernames = [f'user{i}' for i in range(args.requests)]
+            for path, expected in (('/user/register', 201), ('/user/login', 200)):
+                rate, p50, p95 = run(app, path, usernames, args.threads, expected)
+                print(f'{label:<10} {path:<15} {rate:8.1f} req/s  p50 {p50:7.1f} ms  p95 {p95:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
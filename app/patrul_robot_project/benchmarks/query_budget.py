@@ -0,0 +1,256 @@
+"""
+Бюджет SQL-запитів і часу для кожного GET-маршруту блюпринтів.
+
+Піднімає app з app.py на SQLite у пам'яті (DATABASE_URL=sqlite://), заповнює
+базу даними з data.sql, розмноженими до заданої кількості рядків на таблицю,
+і викликає кожен маршрут через test client. Кількість операторів рахує
+SQL-інструментація (SQL_INSTRUMENTATION_ENABLED), entity cache і кеш
+зведення парку вимкнено, щоб результат не залежав від порядку викликів.
+
+Бюджети лежать у benchmarks/query_budgets.json. Якщо статус або кількість
+запитів маршруту розходиться з бюджетом або бюджету немає, скрипт друкує
+різницю й завершується з кодом 1. Час лише звітується: він залежить від
+машини, тож повільніший за записаний маршрут позначається, але не валить
+перевірку. Маршрути, що змінюють дані, не перевіряються: вони псували б
+спільні дані. Те саме для pytest і CI — tests/test_query_budget.py.
+
+    python benchmarks/query_budget.py                      # 10, 1000, 100000 рядків
+    python benchmarks/query_budget.py --sizes 10 1000
+    python benchmarks/query_budget.py --update             # переписати бюджети за поточними замірами
+"""
+import argparse
+import ast
+import json
+import math
+import os
+import re
+import sys
+import time
+from datetime import date, datetime
+from datetime import time as time_of_day
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ.setdefault('JWT_SECRET_KEY', 'query-budget-check-secret-key-0123456789')
+os.environ['SQL_INSTRUMENTATION_ENABLED'] = '1'
+os.environ['SQL_N_PLUS_ONE_THRESHOLD'] = '1000000000'
+os.environ['ENTITY_CACHE_ENABLED'] = '0'
+os.environ['FLEET_SUMMARY_CACHE_TTL'] = '0'
+os.environ['BATTERY_BUFFER_ENABLED'] = '0'
+os.environ['PASSWORD_HASH_WORKERS'] = '0'
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+
+from app import app
+from auth.dao.query_stats import sql_instrumentation
+from auth.domain.models import db
+
+DATA_SQL = os.path.join(os.path.dirname(__file__), '..', 'data.sql')
+BUDGETS = os.path.join(os.path.dirname(__file__), 'query_budgets.json')
+DEFAULT_SIZES = (10, 1000, 100000)
+# Запас для --update: записаний час — орієнтир для звіту, а не жорсткий бюджет
+TIME_HEADROOM = 5
+MIN_TIME_BUDGET_MS = 100
+
+_INSERT = re.compile(r"INSERT INTO `(\w+)` \(([^)]*)\) VALUES \((.*)\);")
+_PARSERS = {datetime: datetime.fromisoformat, date: date.fromisoformat, time_of_day: time_of_day.fromisoformat}
+
+
+def load_base_rows():
+    rows = {}
+    with open(DATA_SQL, encoding='utf-8') as f:
+        for line in f:
+            match = _INSERT.match(line.strip())
+            if not match:
+                continue
+            table, columns, values = match.groups()
+            columns = [column.strip(' `') for column in columns.split(',')]
+            rows.setdefault(table, []).append(dict(zip(columns, ast.literal_eval(f'({values},)'))))
+    return rows
+
+
+def _convert(column, value):
+    try:
+        parser = _PARSERS.get(column.type.python_type)
+    except NotImplementedError:
+        parser = None
+    return parser(value) if parser and isinstance(value, str) else value
+
+
+def seed(size, base_rows):
+    """Кожна таблиця отримує щонайменше size рядків: цілі копії data.sql зі зсунутими ключами."""
+    tables = db.metadata.tables
+    copies = {name: math.ceil(size / len(rows)) for name, rows in base_rows.items()}
+    max_pk = {}
+    for name, rows in base_rows.items():
+        pk = list(tables[name].primary_key)
+        if len(pk) == 1:
+            max_pk[name] = max(row[pk[0].name] for row in rows)
+
+    db.drop_all()
+    db.create_all()
+    for name in (table.name for table in db.metadata.sorted_tables):
+        if name not in base_rows:
+            continue
+        table = tables[name]
+        references = {}
+        for column in table.columns:
+            for fk in column.foreign_keys:
+                references[column.name] = fk.column.table.name
+        batch = []
+        for copy in range(copies[name]):
+            for row in base_rows[name]:
+                values = {}
+                for column_name, value in row.items():
+                    column = table.c[column_name]
+                    if column_name in references:
+                        target = references[column_name]
+                        value += (copy % copies[target]) * max_pk[target]
+                    elif column.primary_key and name in max_pk:
+                        value += copy * max_pk[name]
+                    values[column_name] = _convert(column, value)
+                batch.append(values)
+        db.session.execute(insert(table).prefix_with('OR IGNORE'), batch)
+    db.session.commit()
+
+
+def existing_ids(base_rows):
+    # Параметр маршруту -> найменший id з data.sql у таблиці з таким первинним ключем
+    ids = {}
+    for name, rows in base_rows.items():
+        pk = list(db.metadata.tables[name].primary_key)
+        if len(pk) == 1:
+            ids.setdefault(pk[0].name, min(row[pk[0].name] for row in rows))
+    return ids
+
+
+def get_routes(ids):
+    routes = []
+    for rule in app.url_map.iter_rules():
+        if '.' not in rule.endpoint or rule.endpoint.startswith('flasgger.') or 'GET' not in rule.methods:
+            continue
+        path = re.sub(r'<(?:\w+:)?(\w+)>', lambda match: str(ids.get(match.group(1), 1)), rule.rule)
+        routes.append((f'GET {rule.rule}', path))
+    return sorted(routes)
+
+
+def measure(client, headers, path):
+    sql_instrumentation.reset()
+    started = time.perf_counter()
+    response = client.get(path, headers=headers)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    endpoints = sql_instrumentation.report()['endpoints']
+    return response.status_code, endpoints[0]['max_queries'] if endpoints else 0, elapsed_ms
+
+
+def measure_warm(client, headers, path):
+    # Перший виклик прогріває кеш компіляції SQL і імпорти, тож час береться з другого
+    measure(client, headers, path)
+    return measure(client, headers, path)
+
+
+def auth_headers():
+    """Заголовок з JWT для маршрутів під @jwt_required; потрібен контекст застосунку."""
+    return {'Authorization': f'Bearer {create_access_token(identity="1")}'}
+
+
+def run(sizes):
+    base_rows = load_base_rows()
+    client = app.test_client()
+    results = {}
+    with app.app_context():
+        headers = auth_headers()
+        for size in sizes:
+            started = time.perf_counter()
+            seed(size, base_rows)
+            print(f'seeded {size} rows per table in {time.perf_counter() - started:.1f}s')
+            for name, path in get_routes(existing_ids(base_rows)):
+                status, queries, elapsed_ms = measure_warm(client, headers, path)
+                results.setdefault(name, {})[str(size)] = {'status': status, 'queries': queries, 'ms': elapsed_ms}
+    return results
+
+
+def load_budgets():
+    if not os.path.exists(BUDGETS):
+        return {}
+    with open(BUDGETS) as f:
+        return json.load(f)
+
+
+def compare(name, size, measured, budget):
+    """
+    (провали, повільні) для одного заміру маршруту на `size` рядках.
+
+    Провал — інший статус, більше запитів, ніж у бюджеті, або відсутній
+    бюджет; повільні — лише перевищення записаного часу, для звіту.
+    """
+    if budget is None:
+        return [f'{name} @ {size} rows: no budget (measured {measured["queries"]} queries)'], []
+    failures = []
+    if measured['status'] != budget['status']:
+        failures.append(f'{name} @ {size} rows: status {budget["status"]} -> {measured["status"]}')
+    if measured['queries'] > budget['queries']:
+        failures.append(f'{name} @ {size} rows: queries {budget["queries"]} -> {measured["queries"]}')
+    slow = []
+    if measured['ms'] > budget['ms']:
+        slow.append(f'{name} @ {size} rows: time {budget["ms"]} ms -> {measured["ms"]:.0f} ms')
+    return failures, slow
+
+
+def check(results, budgets):
+    failures, slow = [], []
+    print(f"\n{'route':<58} {'rows':>7} {'status':>9} {'queries':>13} {'ms':>19}")
+    for name, by_size in sorted(results.items()):
+        for size, measured in by_size.items():
+            budget = budgets.get(name, {}).get(size)
+            route_failures, route_slow = compare(name, size, measured, budget)
+            failures += route_failures
+            slow += route_slow
+            budget = budget or {'status': '-', 'queries': '-', 'ms': '-'}
+            print(f'{name:<58} {size:>7} {measured["status"]:>3} / {budget["status"]:<3} '
+                  f'{measured["queries"]:>5} / {budget["queries"]:<5} {measured["ms"]:>9.1f} / {budget["ms"]:<7}')
+    if slow:
+        print('\nSlower than recorded (not a failure):')
+        for note in slow:
+            print(f'  {note}')
+    return failures
+
+
+def update(results, budgets):
+    for name, by_size in results.items():
+        for size, measured in by_size.items():
+            budgets.setdefault(name, {})[size] = {
+                'status': measured['status'],
+                'queries': measured['queries'],
+                'ms': max(MIN_TIME_BUDGET_MS, math.ceil(measured['ms'] * TIME_HEADROOM))
+            }
+    with open(BUDGETS, 'w') as f:
+        json.dump(dict(sorted(budgets.items())), f, indent=2)
+        f.write('\n')
+    print(f'budgets written to {BUDGETS}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--update', action='store_true', help='overwrite budgets with the measured values')
+    args = parser.parse_args()
+
+    budgets = load_budgets()
+    results = run(args.sizes)
+    if args.update:
+        update(results, budgets)
+        return
+    failures = check(results, budgets)
+    if failures:
+        print('\nQuery budget exceeded:')
+        for failure in failures:
+            print(f'  {failure}')
+        sys.exit(1)
+    print('\nAll routes within budget')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Серіалізація списків: ORM-екземпляри + _to_dict проти Core-рядків за RowPlan.
+
+Заповнює SQLite-базу роботами й ідентифікаціями осіб (у других є DateTime і
+Numeric, тож працюють конвертери), потім для кожного шляху міряє рядки за
+секунду до готового JSON і піковий обсяг пам'яті (tracemalloc) на повному
+проході таблиці та на сторінках максимального розміру.
+
+    python benchmarks/row_serializers.py --rows 200000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask
+from sqlalchemy import insert
+
+from auth.controller.person_identification_controller import PersonIdentificationController
+from auth.controller.robot_controller import RobotController
+from auth.dao.pagination import MAX_PAGE_SIZE, keyset_page, keyset_rows
+from auth.dao.person_identification_dao import IDENTIFICATION_ROWS
+from auth.dao.robot_dao import ROBOT_ROWS
+from auth.domain.models import db, Operator, ChargingStation, Robot, PersonIdentification
+from auth.route.json_provider import FastJSONProvider
+
+
+def make_app(db_path):
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    db.init_app(app)
+    return app
+
+
+def seed(app, rows):
+    start = datetime(2024, 1, 1)
+    with app.app_context():
+        db.create_all()
+        db.session.add(Operator(name='bench', shift_start=datetime.min.time(), shift_end=datetime.min.time(), contact_info='-'))
+        db.session.add(ChargingStation(location='bench', capacity=1, available='yes'))
+        db.session.flush()
+        db.session.execute(insert(Robot), [{
+            'robot_id': i, 'status': 'Active', 'max_distance': 100, 'operator_id': 1, 'station_id': 1,
+            'alternative_power_source': 'no'
+        } for i in range(1, rows + 1)])
+        db.session.execute(insert(PersonIdentification), [{
+            'identification_id': i, 'person_name': f'person {i}', 'timestamp': start + timedelta(seconds=i),
+            'accuracy': Decimal('95.50'), 'sensor_id': 1, 'camera_id': 1, 'report_id': 1
+        } for i in range(1, rows + 1)])
+        db.session.commit()
+
+
+def orm_full(model, pk_column, to_dict):
+    return [to_dict(instance) for instance in model.query.order_by(pk_column).all()]
+
+
+def core_full(plan, pk_column):
+    return [plan.to_dict(row) for row in db.session.execute(plan.select().order_by(pk_column))]
+
+
+def orm_pages(model, pk_column, to_dict):
+    items, after = [], None
+    while True:
+        rows, after = keyset_page(model.query, pk_column, MAX_PAGE_SIZE, after)
+        items.extend(to_dict(row) for row in rows)
+        if after is None:
+            return items
+
+
+def core_pages(plan, pk_column):
+    items, after = [], None
+    while True:
+        rows, after = keyset_rows(plan, pk_column, MAX_PAGE_SIZE, after)
+        items.extend(rows)
+        if after is None:
+            return items
+
+
+def run_to_json(app, func, *args):
+    # Кодування входить у замір: ORM-шлях віддає datetime/Decimal провайдеру JSON як є
+    with app.app_context():
+        items = func(*args)
+        body = app.json.dumps(items)
+        db.session.remove()
+    return len(items), body
+
+
+def measure(app, name, func, *args):
+    started = time.perf_counter()
+    count, body = run_to_json(app, func, *args)
+    elapsed = time.perf_counter() - started
+    del body
+    # Пам'ять міряється окремим прогоном: tracemalloc сповільнює виконання в рази
+    tracemalloc.start()
+    run_to_json(app, func, *args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f'{name:<52} {count:>8} rows {elapsed:7.2f}s {count / elapsed:>10,.0f} rows/s '
+          f'peak {peak / 2 ** 20:7.1f} MiB')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = make_app(os.path.join(tmp, 'bench.db'))
+        seed(app, args.rows)
+        cases = [
+            ('robot', Robot, Robot.robot_id, RobotController._to_dict, ROBOT_ROWS),
+            ('person_identification', PersonIdentification, PersonIdentification.identification_id,
+             PersonIdentificationController._to_dict, IDENTIFICATION_ROWS),
+        ]
+        for name, model, pk_column, to_dict, plan in cases:
+            measure(app, f'{name}: ORM + _to_dict, full table', orm_full, model, pk_column, to_dict)
+            measure(app, f'{name}: RowPlan, full table', core_full, plan, pk_column)
+            measure(app, f'{name}: ORM + _to_dict, pages of {MAX_PAGE_SIZE}', orm_pages, model, pk_column, to_dict)
+            measure(app, f'{name}: RowPlan, pages of {MAX_PAGE_SIZE}', core_pages, plan, pk_column)
+
+
+if __name__ == '__main__':
+    main()
@@ -121,7 +121,7 @@ DROP TABLE IF EXISTS `battery` ;
 
 SHOW WARNINGS;
 CREATE TABLE IF NOT EXISTS `battery` (
-  `battery_id` INT NOT NULL,
+  `battery_id` INT NOT NULL AUTO_INCREMENT,
   `log_time` DATETIME NOT NULL,
   `battery_level` INT NOT NULL,
   `robot_id` INT NOT NULL,
@@ -288,6 +288,26 @@ CREATE TABLE `robot_maintenance` (
 ) ENGINE=InnoDB
 DEFAULT CHARSET=utf8mb3;
 
+-- -----------------------------------------------------
+-- Table `telemetry_rollup`
+-- Агрегати телеметрії (battery_level, temperature, power_output)
+-- з роздільністю 60, 3600 і 86400 секунд
+-- -----------------------------------------------------
+CREATE TABLE IF NOT EXISTS `telemetry_rollup` (
+  `metric` VARCHAR(32) NOT NULL,
+  `entity_id` INT NOT NULL,
+  `resolution` INT NOT NULL,
+  `bucket_start` DATETIME NOT NULL,
+  `sample_count` INT NOT NULL,
+  `value_sum` DOUBLE NOT NULL,
+  `value_min` DOUBLE NOT NULL,
+  `value_max` DOUBLE NOT NULL,
+  `value_last` DOUBLE NOT NULL,
+  `last_time` DATETIME NOT NULL,
+  PRIMARY KEY (`metric`, `entity_id`, `resolution`, `bucket_start`)
+) ENGINE=InnoDB
+DEFAULT CHARSET=utf8mb3;
+
 -- Вставка зв'язків між роботами та технічним обслуговуванням
 INSERT INTO `robot_maintenance` (robot_id, maintenance_id) VALUES (1, 1);  -- Робот 1 проходить техобслуговування 1
 INSERT INTO `robot_maintenance` (robot_id, maintenance_id) VALUES (1, 2);  -- Робот 1 проходить техобслуговування 2
@@ -0,0 +1,51 @@
+"""
+Версійовані міграції схеми.
+
+Кожна міграція виконується один раз, а застосовані версії записуються в
+таблицю schema_migrations. Кроки самі по собі ідемпотентні (checkfirst),
+тож запуск на базі, створеній з data.sql чи db.create_all, безпечний.
+
+    cd app/patrul_robot_project && python -m migrations
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select
+
+metadata = MetaData()
+
+schema_migrations = Table(
+    'schema_migrations', metadata,
+    Column('version', Integer, primary_key=True),
+    Column('description', String(255), nullable=False),
+    Column('applied_at', DateTime, nullable=False)
+)
+
+MIGRATIONS = []
+
+
+def migration(version, description):
+    def register(func):
+        MIGRATIONS.append((version, description, func))
+        return func
+    return register
+
+
+def upgrade(engine):
+    """Застосовує всі ще не застосовані міграції по порядку; повертає їхні версії."""
+    from migrations import versions  # noqa: F401 — реєструє міграції
+
+    with engine.begin() as connection:
+        schema_migrations.create(connection, checkfirst=True)
+        done = set(connection.scalars(select(schema_migrations.c.version)))
+
+    applied = []
+    for version, description, func in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in done:
+            continue
+        with engine.begin() as connection:
+            func(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=version, description=description, applied_at=datetime.utcnow()
+            ))
+        applied.append(version)
+    return applied
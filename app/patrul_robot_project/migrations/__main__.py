@@ -0,0 +1,11 @@
+from app import app
+from auth.domain.models import db
+from migrations import upgrade
+
+with app.app_context():
+    applied = upgrade(db.engine)
+
+if applied:
+    print(f"Applied migrations: {', '.join(str(version) for version in applied)}")
+else:
+    print('Schema is up to date')
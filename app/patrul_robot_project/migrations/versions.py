@@ -0,0 +1,112 @@
+from sqlalchemy import inspect, text
+
+from auth.domain.models import db, ChangeLog, TelemetryRollup
+from migrations import migration
+
+
+def _create_indexes(connection, *names):
+    # Індекси оголошені на моделях, тож db.create_all і міграції дають ту саму схему
+    indexes = {index.name: index for table in db.metadata.tables.values() for index in table.indexes}
+    for name in names:
+        indexes[name].create(connection, checkfirst=True)
+
+
+@migration(1, 'Create telemetry_rollup table')
+def create_telemetry_rollup(connection):
+    TelemetryRollup.__table__.create(connection, checkfirst=True)
+
+
+@migration(2, 'Make battery.battery_id AUTO_INCREMENT')
+def battery_auto_increment(connection):
+    if connection.dialect.name == 'mysql':
+        connection.execute(text('ALTER TABLE battery MODIFY battery_id INT NOT NULL AUTO_INCREMENT'))
+
+
+@migration(3, 'Secondary indexes for telemetry, alerts, identifications, maintenance and robots')
+def secondary_indexes(connection):
+    _create_indexes(
+        connection,
+        'ix_battery_robot_log_time',
+        'ix_alert_timestamp',
+        'ix_alert_audio_system_timestamp',
+        'ix_person_identification_timestamp',
+        'ix_person_identification_camera_timestamp',
+        'ix_maintenance_next_maintenance',
+        'ix_robot_status_station'
+    )
+
+    # users.username оголошено unique у моделі, але таблицю могли створити без ключа
+    inspector = inspect(connection)
+    if not inspector.has_table('users'):
+        return
+    covered = [ix['column_names'] for ix in inspector.get_indexes('users')]
+    covered += [uq['column_names'] for uq in inspector.get_unique_constraints('users')]
+    if not any(columns and columns[0] == 'username' for columns in covered):
+        connection.execute(text('CREATE UNIQUE INDEX ix_users_username ON users (username)'))
+
+
+@migration(4, 'ON DELETE CASCADE on every foreign key declared with it in the models')
+def foreign_key_cascades(connection):
+    # data.sql уже створює ключі з CASCADE; db.create_all до цієї версії — ні.
+    # SQLite не вміє змінювати обмеження, а база розробки там і так створюється заново.
+    if connection.dialect.name != 'mysql':
+        return
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        wanted = {
+            (tuple(fk.parent.name for fk in constraint.elements), constraint.referred_table.name)
+            for constraint in table.foreign_key_constraints
+            if (constraint.ondelete or '').upper() == 'CASCADE'
+        }
+        for fk in inspector.get_foreign_keys(table.name):
+            key = (tuple(fk['constrained_columns']), fk['referred_table'])
+            if key not in wanted or (fk['options'].get('ondelete') or '').upper() == 'CASCADE':
+                continue
+            name = preparer.quote(fk['name'])
+            columns = ', '.join(preparer.quote(column) for column in fk['constrained_columns'])
+            referred = ', '.join(preparer.quote(column) for column in fk['referred_columns'])
+            # Окремими ALTER: частина версій MySQL не дає перевикористати ім'я ключа в одному
+            connection.execute(text(f'ALTER TABLE {preparer.quote(table.name)} DROP FOREIGN KEY {name}'))
+            connection.execute(text(
+                f'ALTER TABLE {preparer.quote(table.name)} ADD CONSTRAINT {name} FOREIGN KEY ({columns}) '
+                f'REFERENCES {preparer.quote(fk["referred_table"])} ({referred}) ON DELETE CASCADE'
+            ))
+
+
+@migration(5, 'Indexes for GET /fleet/summary: sensor.trigger_status and camera.status')
+def fleet_summary_indexes(connection):
+    _create_indexes(connection, 'ix_sensor_trigger_status', 'ix_camera_status')
+
+
+@migration(6, 'Create change_log table for GET /changes')
+def create_change_log(connection):
+    ChangeLog.__table__.create(connection, checkfirst=True)
+
+
+@migration(7, 'version column for optimistic locking (ETag / If-Match) on the mutable tables')
+def version_columns(connection):
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    for mapper in db.Model.registry.mappers:
+        table = mapper.local_table
+        if mapper.version_id_col is None or not inspector.has_table(table.name):
+            continue
+        if any(column['name'] == 'version' for column in inspector.get_columns(table.name)):
+            continue
+        # DEFAULT 1 заповнює наявні рядки, тож їхній перший ETag — "1"
+        connection.execute(text(
+            f'ALTER TABLE {preparer.quote(table.name)} ADD COLUMN version INTEGER NOT NULL DEFAULT 1'
+        ))
+
+
+@migration(8, 'change_log.sequence: commit-ordered position in GET /changes')
+def change_log_sequence(connection):
+    if not any(column['name'] == 'sequence' for column in inspect(connection).get_columns('change_log')):
+        column_type = ChangeLog.__table__.c.sequence.type.compile(dialect=connection.dialect)
+        connection.execute(text(f'ALTER TABLE change_log ADD COLUMN sequence {column_type} NULL'))
+        # Уже віддані рядки зберігають свої номери, тож since клієнтів лишається дійсним
+        connection.execute(text('UPDATE change_log SET sequence = version'))
+    _create_indexes(connection, 'ix_change_log_sequence')
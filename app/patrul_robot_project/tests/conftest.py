@@ -0,0 +1,32 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+# Імпорт задає середовище перевірок (SQLite у пам'яті, SQL-інструментація, кеші вимкнено) до імпорту app
+import query_budget  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app_context():
+    with query_budget.app.app_context():
+        yield
+
+
+@pytest.fixture(scope='session')
+def client(app_context):
+    return query_budget.app.test_client()
+
+
+@pytest.fixture(scope='session')
+def auth_headers(app_context):
+    return query_budget.auth_headers()
+
+
+@pytest.fixture(scope='session')
+def base_rows():
+    return query_budget.load_base_rows()
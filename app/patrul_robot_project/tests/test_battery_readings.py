@@ -0,0 +1,36 @@
+"""
+Перевірка показів POST /robots/<id>/battery до відповіді: некоректне
+значення — 400 з номером показу, а не 500 і не 202 з подальшою втратою.
+
+    python -m pytest tests/test_battery_readings.py
+"""
+import pytest
+
+import query_budget
+from auth.domain.models import db
+from auth.domain.robot import Robot
+
+VALID_READING = {'log_time': '2024-09-19T08:00:00Z', 'battery_level': 80, 'temperature': '25.0'}
+
+INVALID_READINGS = [
+    ('log_time', 123),
+    ('log_time', ['2024-09-19T08:00:00']),
+    ('log_time', 'yesterday'),
+    ('battery_level', 85.7),
+    ('battery_level', True),
+    ('temperature', {}),
+]
+
+
+@pytest.fixture(scope='module')
+def robot_id(app_context, base_rows):
+    query_budget.seed(10, base_rows)
+    return db.session.scalars(db.select(Robot.robot_id).order_by(Robot.robot_id)).first()
+
+
+@pytest.mark.parametrize('field, value', INVALID_READINGS, ids=[f'{field}={value!r}' for field, value in INVALID_READINGS])
+def test_invalid_reading_is_rejected(client, auth_headers, robot_id, field, value):
+    response = client.post(f'/robots/{robot_id}/battery', headers=auth_headers,
+                           json=[VALID_READING, {**VALID_READING, field: value}])
+    assert response.status_code == 400, response.get_json()
+    assert field in response.get_json()['error'] and 'reading 1' in response.get_json()['error']
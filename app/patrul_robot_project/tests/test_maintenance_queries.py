@@ -0,0 +1,32 @@
+"""
+Кількість SQL-запитів ендпоінтів техобслуговування з роботами
+(benchmarks/maintenance_queries.py) як тести.
+
+Кожен виклик RobotMaintenanceController має робити рівно
+EXPECTED_QUERIES запитів незалежно від розміру флоту.
+
+    python -m pytest tests/test_maintenance_queries.py
+"""
+import pytest
+
+import maintenance_queries
+
+FLEET_SIZES = [10, 100, 1000]
+
+
+@pytest.fixture(scope='module')
+def maintenance_app(tmp_path_factory):
+    return maintenance_queries.make_app(tmp_path_factory.mktemp('maintenance') / 'bench.db')
+
+
+@pytest.fixture(scope='module', params=FLEET_SIZES, ids=lambda size: f'{size}robots')
+def fleet(request, maintenance_app):
+    maintenance_queries.seed(maintenance_app, request.param)
+    return maintenance_app
+
+
+@pytest.mark.parametrize('name', list(maintenance_queries.CALLS))
+def test_query_count_independent_of_fleet_size(fleet, name):
+    func, *args = maintenance_queries.CALLS[name]
+    queries, _ = maintenance_queries.count_queries(fleet, func, *args)
+    assert queries == maintenance_queries.EXPECTED_QUERIES[name]
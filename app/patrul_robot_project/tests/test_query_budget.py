@@ -0,0 +1,38 @@
+"""
+Бюджет SQL-запитів кожного GET-маршруту (benchmarks/query_budget.py) як тести.
+
+Маршрут перевіряється на кожному розмірі з QUERY_BUDGET_SIZES (через пробіл;
+за замовчуванням 10, 1000 і 100000 рядків на таблицю). Інший статус або
+більше запитів, ніж у benchmarks/query_budgets.json, валить тест; час лише
+звітується попередженням, бо залежить від машини.
+
+    python -m pytest tests/test_query_budget.py
+    QUERY_BUDGET_SIZES="10 1000" python -m pytest tests/test_query_budget.py
+"""
+import os
+import warnings
+
+import pytest
+
+import query_budget
+
+SIZES = [int(size) for size in os.getenv('QUERY_BUDGET_SIZES', ' '.join(map(str, query_budget.DEFAULT_SIZES))).split()]
+BUDGETS = query_budget.load_budgets()
+ROUTES = query_budget.get_routes(query_budget.existing_ids(query_budget.load_base_rows()))
+
+
+@pytest.fixture(scope='module', params=SIZES, ids=lambda size: f'{size}rows')
+def size(request, app_context, base_rows):
+    # Параметр модульного рівня: pytest групує тести за розміром, тож база заповнюється раз на розмір
+    query_budget.seed(request.param, base_rows)
+    return request.param
+
+
+@pytest.mark.parametrize('name, path', ROUTES, ids=[name for name, _ in ROUTES])
+def test_route_within_query_budget(size, name, path, client, auth_headers):
+    status, queries, elapsed_ms = query_budget.measure_warm(client, auth_headers, path)
+    measured = {'status': status, 'queries': queries, 'ms': elapsed_ms}
+    failures, slow = query_budget.compare(name, str(size), measured, BUDGETS.get(name, {}).get(str(size)))
+    for note in slow:
+        warnings.warn(note)
+    assert not failures, '; '.join(failures)
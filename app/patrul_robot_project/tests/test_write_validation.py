@@ -0,0 +1,66 @@
+"""
+Перевірка типів JSON-значень у записах (BatchWriter.parse): PATCH одного
+запису й пакет POST /robots/batch відповідають 400 до будь-якого запису
+в базу, а не 500 з драйвера чи збереженим значенням не того типу.
+
+    python -m pytest tests/test_write_validation.py
+"""
+import pytest
+
+import query_budget
+from auth.domain.models import db
+from auth.domain.robot import Robot
+
+VALID_ROBOT = {'status': 'Active', 'max_distance': 100, 'operator_id': 1, 'station_id': 1,
+               'alternative_power_source': 'no'}
+
+INVALID_VALUES = [
+    ('max_distance', [1]),
+    ('max_distance', {}),
+    ('max_distance', 1.5),
+    ('max_distance', True),
+    ('status', 5),
+    ('status', ['Active']),
+]
+
+
+@pytest.fixture(scope='module')
+def robot_id(app_context, base_rows):
+    query_budget.seed(10, base_rows)
+    return db.session.scalars(db.select(Robot.robot_id).order_by(Robot.robot_id)).first()
+
+
+def _robot_row(robot_id):
+    db.session.expire_all()
+    robot = db.session.get(Robot, robot_id)
+    return robot.status, robot.max_distance, robot.version
+
+
+@pytest.mark.parametrize('field, value', INVALID_VALUES, ids=[f'{field}={value!r}' for field, value in INVALID_VALUES])
+def test_patch_rejects_wrong_json_type(client, auth_headers, robot_id, field, value):
+    before = _robot_row(robot_id)
+    response = client.patch(f'/robots/{robot_id}', json={field: value}, headers={**auth_headers, 'If-Match': '*'})
+    assert response.status_code == 400, response.get_json()
+    assert field in response.get_json()['error']
+    assert _robot_row(robot_id) == before
+
+
+@pytest.mark.parametrize('field, value', INVALID_VALUES, ids=[f'{field}={value!r}' for field, value in INVALID_VALUES])
+def test_batch_rejects_wrong_json_type_before_writing(client, auth_headers, robot_id, field, value):
+    count = db.session.scalar(db.select(db.func.count()).select_from(Robot))
+    response = client.post('/robots/batch', headers=auth_headers, json={'operations': [
+        {'op': 'create', 'data': VALID_ROBOT},
+        {'op': 'create', 'data': {**VALID_ROBOT, field: value}},
+    ]})
+    body = response.get_json()
+    assert response.status_code == 400, body
+    assert body['applied'] is False
+    assert body['results'][1]['status'] == 400 and field in body['results'][1]['error']
+    assert db.session.scalar(db.select(db.func.count()).select_from(Robot)) == count
+
+
+def test_patch_accepts_matching_types(client, auth_headers, robot_id):
+    response = client.patch(f'/robots/{robot_id}', json={'max_distance': 150, 'status': 'Active'},
+                            headers={**auth_headers, 'If-Match': '*'})
+    assert response.status_code == 200, response.get_json()
+    assert _robot_row(robot_id)[:2] == ('Active', 150)
@@ -9,6 +9,7 @@ git reset --hard origin/main
 source venv/bin/activate
 pip install --upgrade pip
 pip install -r app/patrul_robot_project/requirements.txt
+(cd app/patrul_robot_project && python -m migrations)
 deactivate
 
 sudo systemctl daemon-reload
@@ -1,65 +1,298 @@
 # load_test.py
-import requests
-import threading
-import time
+"""
+Асинхронний генератор навантаження для Patrol robot API.
+
+- логіниться через /user/login (за потреби реєструє користувача) і
+  перевикористовує токен у всіх запитах;
+- ганяє зважену суміш запитів по всіх ресурсних маршрутах;
+- open-loop (фіксована частота прибуття) або closed-loop (N паралельних клієнтів);
+- латентності збираються в HDR-подібні гістограми (1% відносна похибка),
+  p50/p95/p99/p999 по кожному ендпоінту пишуться в JSON для порівняння запусків.
+
+    python load_test.py --base-url http://localhost:5000 --mode open --rate 200 --duration 60
+    python load_test.py --mode closed --concurrency 40 --output results/closed.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
 import random
 import sys
+import time
+from datetime import datetime, timedelta
+
+import aiohttp
+
+REPORT_INTERVAL = 5
+
+# (назва, вага, метод, шаблон шляху); {robot_id} тощо підставляються з реальних id
+SCENARIO = [
+    ('GET /robots', 10, 'GET', '/robots?limit=50'),
+    ('GET /robots/<id>', 15, 'GET', '/robots/{robot_id}'),
+    ('GET /robots/<id>/battery/rollup', 8, 'GET', '/robots/{robot_id}/battery/rollup'),
+    ('POST /robots/<id>/battery', 8, 'POST', '/robots/{robot_id}/battery'),
+    ('GET /sensors', 5, 'GET', '/sensors?limit=50'),
+    ('GET /sensors/<id>', 8, 'GET', '/sensors/{sensor_id}'),
+    ('GET /cameras', 5, 'GET', '/cameras?limit=50'),
+    ('GET /cameras/<id>', 8, 'GET', '/cameras/{camera_id}'),
+    ('GET /operators', 3, 'GET', '/operators?limit=50'),
+    ('GET /operators/<id>', 4, 'GET', '/operators/{operator_id}'),
+    ('GET /charging_stations', 3, 'GET', '/charging_stations?limit=50'),
+    ('GET /charging_stations/<id>', 4, 'GET', '/charging_stations/{station_id}'),
+    ('GET /charging_stations/<id>/solar/rollup', 2, 'GET', '/charging_stations/{station_id}/solar/rollup'),
+    ('GET /maintenances', 2, 'GET', '/maintenances?limit=50'),
+    ('GET /person_identifications', 5, 'GET', '/person_identifications?limit=50'),
+    ('GET /operators_with_robots', 2, 'GET', '/operators_with_robots'),
+    ('GET /charging_stations_with_robots', 2, 'GET', '/charging_stations_with_robots'),
+    ('GET /sensors_with_robot', 2, 'GET', '/sensors_with_robot'),
+    ('GET /maintenances_with_robots', 2, 'GET', '/maintenances_with_robots'),
+    ('GET /person_identifications_with_reports', 2, 'GET', '/person_identifications_with_reports'),
+    ('GET /user/profile', 2, 'GET', '/user/profile'),
+]
+
+# Звідки брати id для підстановки в шаблони
+ID_SOURCES = {
+    'robot_id': '/robots?limit=200',
+    'sensor_id': '/sensors?limit=200',
+    'camera_id': '/cameras?limit=200',
+    'operator_id': '/operators?limit=200',
+    'station_id': '/charging_stations?limit=200',
+}
+
+
+class Histogram:
+    """Логарифмічні бакети з 1% відносною похибкою, значення в мікросекундах."""
+
+    BASE = math.log(1.01)
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.sum_us = 0
+        self.max_us = 0
+
+    def record(self, seconds):
+        value = max(int(seconds * 1_000_000), 1)
+        index = int(math.log(value) / self.BASE)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum_us += value
+        self.max_us = max(self.max_us, value)
+
+    def percentile(self, q):
+        if not self.total:
+            return 0.0
+        rank = math.ceil(q / 100 * self.total)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return round(min(math.exp((index + 1) * self.BASE), self.max_us) / 1000, 3)
+        return self.max_us / 1000
+
+    def summary(self):
+        return {
+            'count': self.total,
+            'mean_ms': round(self.sum_us / self.total / 1000, 3) if self.total else 0.0,
+            'max_ms': self.max_us / 1000,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'p999_ms': self.percentile(99.9),
+        }
+
+
+class EndpointStats:
+    def __init__(self):
+        self.histogram = Histogram()
+        self.errors = 0
+        self.statuses = {}
 
+    def record(self, status, seconds):
+        self.histogram.record(seconds)
+        self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        if not isinstance(status, int) or status >= 400:
+            self.errors += 1
 
-API_URL = "http://..."             # REST API endpoint
-WEB_URL = "http://..."             # веб-сторінка
-URLS = [API_URL, WEB_URL]
+    def summary(self):
+        return {**self.histogram.summary(), 'errors': self.errors, 'statuses': self.statuses}
 
-THREADS = 40            
-REPORT_INTERVAL = 5   
 
-stop_event = threading.Event()
-counter_lock = threading.Lock()
-total_requests = 0
-errors = 0
+class LoadTest:
+    def __init__(self, args):
+        self.args = args
+        self.base_url = args.base_url.rstrip('/')
+        self.token = None
+        self.ids = {}
+        self.stats = {name: EndpointStats() for name, *_ in SCENARIO}
+        self.overall = EndpointStats()
+        self.names = [name for name, *_ in SCENARIO]
+        self.weights = [weight for _, weight, *_ in SCENARIO]
+        self.routes = {name: (method, path) for name, _, method, path in SCENARIO}
+        self.in_flight = 0
+        self.dropped = 0
 
-def worker(id):
-    global total_requests, errors
-    s = requests.Session()
-    while not stop_event.is_set():
-        url = random.choice(URLS)
+    async def login(self, session, registered=False):
+        credentials = {'username': self.args.username, 'password': self.args.password}
+        async with session.post(self.base_url + '/user/login', json=credentials) as response:
+            if response.status == 401 and not registered:
+                async with session.post(self.base_url + '/user/register', json=credentials) as register:
+                    if register.status not in (201, 409):
+                        raise SystemExit(f'Cannot register load-test user: HTTP {register.status}')
+                # Одна повторна спроба: 409 означає, що користувач існує з іншим паролем
+                return await self.login(session, registered=True)
+            if response.status == 401:
+                raise SystemExit(f'Login failed for {self.args.username!r}: the user exists with a different '
+                                 f'password; pass --password or choose another --username')
+            if response.status != 200:
+                raise SystemExit(f'Login failed: HTTP {response.status}')
+            self.token = (await response.json())['access_token']
+
+    async def discover_ids(self, session):
+        for key, path in ID_SOURCES.items():
+            try:
+                async with session.get(self.base_url + path, headers=self.headers()) as response:
+                    body = await response.json()
+            except (aiohttp.ClientError, ValueError):
+                body = {}
+            items = body.get('items', body) if isinstance(body, dict) else body
+            self.ids[key] = [item['id'] for item in items if isinstance(item, dict) and 'id' in item] or [1]
+
+    def headers(self):
+        return {'Authorization': f'Bearer {self.token}'}
+
+    def battery_payload(self):
+        now = datetime.utcnow()
+        return [{
+            'log_time': (now - timedelta(seconds=i)).isoformat(timespec='seconds'),
+            'battery_level': random.randint(5, 100),
+            'temperature': f'{random.uniform(20, 45):.1f}'
+        } for i in range(self.args.battery_batch)]
+
+    async def fire(self, session, scheduled_at=None):
+        name = random.choices(self.names, self.weights)[0]
+        method, template = self.routes[name]
+        path = template.format(**{key: random.choice(values) for key, values in self.ids.items()})
+        body = self.battery_payload() if method == 'POST' else None
+        # В open-loop латентність рахується від запланованого моменту (без coordinated omission)
+        started = scheduled_at if scheduled_at is not None else time.perf_counter()
         try:
-            r = s.get(url, timeout=5)
-            with counter_lock:
-                total_requests += 1
-            if r.status_code != 200:
-                with counter_lock:
-                    errors += 1
-        except Exception:
-            with counter_lock:
-                errors += 1
-
-def reporter():
-    last_total = 0
-    while not stop_event.is_set():
-        time.sleep(REPORT_INTERVAL)
-        with counter_lock:
-            t = total_requests
-            e = errors
-        print(f"[{time.strftime('%H:%M:%S')}] total={t} (+{t-last_total}/{REPORT_INTERVAL}s) errors={e}")
-        last_total = t
+            async with session.request(method, self.base_url + path, json=body, headers=self.headers()) as response:
+                await response.read()
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            status = type(error).__name__
+        elapsed = time.perf_counter() - started
+        self.stats[name].record(status, elapsed)
+        self.overall.record(status, elapsed)
+
+    async def closed_loop(self, session, deadline):
+        async def worker():
+            while time.perf_counter() < deadline:
+                await self.fire(session)
+
+        await asyncio.gather(*(worker() for _ in range(self.args.concurrency)))
+
+    async def open_loop(self, session, deadline):
+        interval = 1 / self.args.rate
+        tasks = set()
+        next_at = time.perf_counter()
+        while next_at < deadline:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(tasks) >= self.args.max_in_flight:
+                self.dropped += 1
+            else:
+                task = asyncio.ensure_future(self.fire(session, scheduled_at=next_at))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            next_at += interval
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def reporter(self, started):
+        last_total = 0
+        while True:
+            await asyncio.sleep(REPORT_INTERVAL)
+            total = self.overall.histogram.total
+            print(f"[{time.strftime('%H:%M:%S')}] total={total} (+{total - last_total}/{REPORT_INTERVAL}s) "
+                  f"errors={self.overall.errors} p99={self.overall.histogram.percentile(99):.1f}ms "
+                  f"elapsed={time.perf_counter() - started:.0f}s")
+            last_total = total
+
+    async def run(self):
+        timeout = aiohttp.ClientTimeout(total=self.args.timeout)
+        connector = aiohttp.TCPConnector(limit=self.args.max_in_flight)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            await self.login(session)
+            await self.discover_ids(session)
+            started = time.perf_counter()
+            deadline = started + self.args.duration
+            reporter = asyncio.ensure_future(self.reporter(started))
+            try:
+                if self.args.mode == 'open':
+                    await self.open_loop(session, deadline)
+                else:
+                    await self.closed_loop(session, deadline)
+            finally:
+                reporter.cancel()
+            return time.perf_counter() - started
+
+    def results(self, elapsed):
+        return {
+            'started_at': datetime.utcnow().isoformat(timespec='seconds'),
+            'config': {key: value for key, value in vars(self.args).items() if key != 'password'},
+            'elapsed_s': elapsed,
+            'throughput_rps': self.overall.histogram.total / elapsed if elapsed else 0.0,
+            'dropped_arrivals': self.dropped,
+            'overall': self.overall.summary(),
+            'endpoints': {name: stats.summary() for name, stats in self.stats.items() if stats.histogram.total},
+        }
+
+
+def print_table(results):
+    print(f"\n{'endpoint':<42} {'count':>7} {'err':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'p999':>8}")
+    rows = list(results['endpoints'].items()) + [('TOTAL', results['overall'])]
+    for name, summary in rows:
+        print(f"{name:<42} {summary['count']:>7} {summary['errors']:>5} "
+              f"{summary['p50_ms']:>8.1f} {summary['p95_ms']:>8.1f} {summary['p99_ms']:>8.1f} {summary['p999_ms']:>8.1f}")
+    print(f"\nthroughput={results['throughput_rps']:.1f} req/s dropped={results['dropped_arrivals']}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default=os.getenv('BASE_URL', 'http://localhost:5000'))
+    parser.add_argument('--username', default=os.getenv('LOAD_USER', 'loadtest'))
+    parser.add_argument('--password', default=os.getenv('LOAD_PASSWORD', 'loadtest-password'))
+    parser.add_argument('--mode', choices=['open', 'closed'], default=os.getenv('LOAD_MODE', 'closed'))
+    parser.add_argument('--rate', type=float, default=float(os.getenv('LOAD_RATE', '100')),
+                        help='arrivals per second in open-loop mode')
+    parser.add_argument('--concurrency', type=int, default=int(os.getenv('LOAD_CONCURRENCY', '40')),
+                        help='parallel clients in closed-loop mode')
+    parser.add_argument('--max-in-flight', type=int, default=1000,
+                        help='open-loop arrivals beyond this many outstanding requests are dropped and counted')
+    parser.add_argument('--duration', type=float, default=float(os.getenv('LOAD_DURATION', '60')))
+    parser.add_argument('--timeout', type=float, default=10)
+    parser.add_argument('--battery-batch', type=int, default=20, help='readings per battery POST')
+    parser.add_argument('--output', default=os.getenv('LOAD_OUTPUT', 'load_results.json'))
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
-    print("Starting load test. Ctrl+C to stop.")
-    threads = []
-    for i in range(THREADS):
-        t = threading.Thread(target=worker, args=(i,), daemon=True)
-        t.start()
-        threads.append(t)
-    rep = threading.Thread(target=reporter, daemon=True)
-    rep.start()
+    args = parse_args()
+    print(f"Starting {args.mode}-loop load test against {args.base_url} for {args.duration:.0f}s. Ctrl+C to stop.")
+    test = LoadTest(args)
+    started = time.perf_counter()
     try:
-        while True:
-            time.sleep(1)
+        elapsed = asyncio.run(test.run())
     except KeyboardInterrupt:
         print("Stopping...")
-        stop_event.set()
-        time.sleep(1)
-        with counter_lock:
-            print("Final:", "total=", total_requests, "errors=", errors)
-        sys.exit(0)
+        elapsed = time.perf_counter() - started
+    results = test.results(elapsed)
+    print_table(results)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to {args.output}")
+    sys.exit(0)